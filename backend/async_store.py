@@ -0,0 +1,86 @@
+"""
+Async data access for the API server.
+
+``AsyncDatabaseManager`` exposes the ``DatabaseManager`` methods as
+coroutines without ever running SQLite on the event loop:
+
+- reads run in parallel on a pool of reader threads (WAL lets them proceed
+  while a write is in progress);
+- writes are queued to a single writer thread, so concurrent requests never
+  contend for the SQLite write lock;
+- score submissions arriving within a few milliseconds are group-committed:
+  ``record_match_result`` calls are applied with one ``record_match_results``
+  transaction (``store.WriteQueue``).
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+from store import DURABILITY_BATCH, WriteQueue
+
+# DatabaseManager methods that write; everything else is dispatched as a read
+WRITE_METHODS = frozenset({
+    'create_tournament', 'update_tournament', 'delete_tournament',
+    'create_team', 'create_teams_bulk', 'update_team', 'update_team_stats', 'delete_team',
+    'create_match', 'create_matches_bulk', 'update_match_score', 'update_match_court',
+    'delete_match', 'record_match_results', 'recompute_team_stats', 'save_quadrette_schedule',
+    'init_database', 'migrate',
+})
+
+
+class AsyncDatabaseManager:
+    """Coroutine facade over a DatabaseManager: one writer thread, a pool of readers.
+
+    Any ``DatabaseManager`` method is available under the same name and
+    signature, as a coroutine. Blocking code that mixes reads and writes
+    (e.g. ``TournamentManager.generate_next_round``) goes through ``write``.
+    Writes complete once durable, as configured by ``durability`` (see
+    ``store.WriteQueue``).
+    """
+
+    def __init__(self, store, readers: Optional[int] = None, max_delay: float = 0.002,
+                 durability: str = DURABILITY_BATCH, sync_interval: float = 0.05):
+        self.store = store
+        if readers is None:
+            # Leave a pooled connection to the writer and to the thread that opened the store
+            readers = max(1, store.pool.max_connections - 2) if store.pool else 4
+        self._readers = ThreadPoolExecutor(max_workers=readers, thread_name_prefix='sqlite-read')
+        self.writes = WriteQueue(store, max_delay=max_delay, durability=durability,
+                                 sync_interval=sync_interval)
+
+    def __getattr__(self, name):
+        attr = getattr(self.store, name)
+        if name.startswith('_') or not callable(attr):
+            return attr
+        run = self.write if name in WRITE_METHODS else self.read
+
+        @functools.wraps(attr)
+        async def method(*args, **kwargs):
+            # Looked up per call: instrumentation may replace the store's methods
+            return await run(getattr(self.store, name), *args, **kwargs)
+
+        self.__dict__[name] = method
+        return method
+
+    # Dispatch
+    async def read(self, func: Callable, *args, **kwargs):
+        """Run a blocking read on the reader pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._readers, functools.partial(func, *args, **kwargs))
+
+    async def write(self, func: Callable, *args, **kwargs):
+        """Run a blocking write on the writer thread, after the writes queued before it"""
+        return await asyncio.wrap_future(self.writes.submit(func, *args, **kwargs))
+
+    async def record_match_result(self, match_id: str, team1_score: int,
+                                  team2_score: int) -> Optional[Dict]:
+        """Same result as DatabaseManager.record_match_result, group-committed"""
+        return await asyncio.wrap_future(
+            self.writes.submit_result(match_id, team1_score, team2_score))
+
+    def close(self):
+        """Finish the queued writes, then stop the writer and the readers"""
+        self.writes.close()
+        self._readers.shutdown(wait=True)
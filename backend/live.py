@@ -0,0 +1,211 @@
+"""
+Live standings push for spectator screens.
+
+LiveHub listens to the store change events and, per tournament, turns a
+burst of committed results into a single delta message, encoded once and
+fanned out to every subscriber of that tournament. Subscribers have a
+bounded queue: a client too slow to drain it loses its pending deltas and
+is resynchronised with a fresh snapshot instead of growing memory.
+
+Messages (JSON text):
+- ``snapshot``: full ranked standings;
+- ``delta``: changed matches and changed standings rows with their new
+  ``rank``, ordered by rank. Clients remove the listed teams, then insert
+  them at their rank in the given order. Values are absolute, so replaying
+  a delta already contained in a snapshot is harmless.
+"""
+
+import asyncio
+import json
+from typing import AsyncIterator, Awaitable, Callable, Dict, Optional, Set
+
+from events import MATCH_SCORED, TEAM_CREATED, TEAM_DELETED, TEAM_UPDATED, ChangeEvent
+
+MATCH_FIELDS = ('id', 'round_number', 'court_number', 'team1_id', 'team2_id',
+                'team1_name', 'team2_name', 'team1_score', 'team2_score', 'status')
+
+# Queue marker telling a subscriber to resynchronise with a snapshot
+RESYNC = None
+
+
+class Subscriber:
+    """One live connection to a tournament"""
+
+    def __init__(self, tournament_id: str, max_pending: int):
+        self.tournament_id = tournament_id
+        self.queue: asyncio.Queue = asyncio.Queue(max_pending)
+        self.dropped = 0
+
+    def offer(self, message: str):
+        """Queue a message without ever blocking the broadcaster"""
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # Slow client: forget its backlog, it will receive a snapshot instead
+            self.dropped += self.queue.qsize()
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESYNC)
+
+
+class _PendingChanges:
+    __slots__ = ('matches', 'teams', 'resync')
+
+    def __init__(self):
+        self.matches: Set[str] = set()
+        self.teams: Set[str] = set()
+        self.resync = False
+
+
+class LiveHub:
+    """Per-tournament fan-out of standings and match deltas.
+
+    ``run_db`` runs a blocking store call off the event loop (the server's
+    thread pool). Events coming from worker threads are handed to the loop
+    with ``call_soon_threadsafe`` and coalesced for ``coalesce_delay``
+    seconds before one delta per tournament is built.
+    """
+
+    def __init__(self, store, run_db: Callable[..., Awaitable], coalesce_delay: float = 0.1,
+                 max_pending: int = 32):
+        self.store = store
+        self.run_db = run_db
+        self.coalesce_delay = coalesce_delay
+        self.max_pending = max_pending
+        self._subscribers: Dict[str, Set[Subscriber]] = {}
+        self._pending: Dict[str, _PendingChanges] = {}
+        self._sequence: Dict[str, int] = {}
+        self._snapshots: Dict[str, tuple] = {}  # tournament -> (sequence, build task)
+        self._flush_lock = asyncio.Lock()
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._unsubscribe = None
+        self.messages_built = 0
+
+    # Lifecycle
+    def start(self):
+        """Attach to the store events (call from the running event loop)"""
+        self._loop = asyncio.get_running_loop()
+        self._unsubscribe = self.store.events.subscribe(self._on_store_event)
+
+    def stop(self):
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+    # Subscriptions
+    def subscribe(self, tournament_id: str) -> Subscriber:
+        subscriber = Subscriber(tournament_id, self.max_pending)
+        subscriber.queue.put_nowait(RESYNC)  # First message is always a snapshot
+        self._subscribers.setdefault(tournament_id, set()).add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber):
+        subscribers = self._subscribers.get(subscriber.tournament_id)
+        if subscribers is not None:
+            subscribers.discard(subscriber)
+            if not subscribers:
+                del self._subscribers[subscriber.tournament_id]
+                self._snapshots.pop(subscriber.tournament_id, None)
+
+    def subscriber_count(self, tournament_id: Optional[str] = None) -> int:
+        if tournament_id is not None:
+            return len(self._subscribers.get(tournament_id, ()))
+        return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+    async def stream(self, subscriber: Subscriber) -> AsyncIterator[str]:
+        """Messages for one subscriber, snapshots included, until cancelled"""
+        while True:
+            message = await subscriber.queue.get()
+            if message is RESYNC:
+                message = await self.snapshot(subscriber.tournament_id)
+            yield message
+
+    # Events
+    def _on_store_event(self, event: ChangeEvent):
+        # Called in whichever thread committed the change
+        if event.tournament_id is None or event.kind not in (
+                MATCH_SCORED, TEAM_UPDATED, TEAM_CREATED, TEAM_DELETED):
+            return
+        self._loop.call_soon_threadsafe(self._collect, event)
+
+    def _collect(self, event: ChangeEvent):
+        if event.tournament_id not in self._subscribers:
+            return
+        pending = self._pending.setdefault(event.tournament_id, _PendingChanges())
+        if event.kind == MATCH_SCORED:
+            pending.matches.update(event.ids)
+        elif event.kind == TEAM_UPDATED:
+            pending.teams.update(event.ids)
+        else:
+            # Teams added or removed shift every rank: resend the whole standings
+            pending.resync = True
+        if self._flush_handle is None:
+            self._flush_handle = self._loop.call_later(
+                self.coalesce_delay, lambda: asyncio.ensure_future(self._flush()))
+
+    async def _flush(self):
+        # One flush at a time, so that deltas reach clients in sequence order
+        async with self._flush_lock:
+            self._flush_handle = None
+            pending, self._pending = self._pending, {}
+            await self._broadcast(pending)
+
+    async def _broadcast(self, pending: Dict[str, _PendingChanges]):
+        for tournament_id, changes in pending.items():
+            subscribers = self._subscribers.get(tournament_id)
+            if not subscribers:
+                continue
+            sequence = self._sequence.get(tournament_id, 0) + 1
+            self._sequence[tournament_id] = sequence
+            if changes.resync:
+                message = RESYNC
+            else:
+                message = await self.run_db(self._build_delta, tournament_id, sequence,
+                                            changes.matches, changes.teams)
+                self.messages_built += 1
+            for subscriber in list(subscribers):
+                subscriber.offer(message)
+
+    # Messages (built on the database thread pool)
+    def _build_delta(self, tournament_id: str, sequence: int, match_ids, team_ids) -> str:
+        matches = self.store.get_matches_by_ids(match_ids)
+        standings = self.store.get_standings_entries(tournament_id, team_ids)
+        return json.dumps({
+            'type': 'delta',
+            'tournament_id': tournament_id,
+            'sequence': sequence,
+            'matches': [{field: match[field] for field in MATCH_FIELDS} for match in matches],
+            'standings': standings,
+        })
+
+    def _build_snapshot(self, tournament_id: str, sequence: int) -> str:
+        standings = self.store.get_team_standings(tournament_id)
+        for rank, row in enumerate(standings, start=1):
+            row['rank'] = rank
+        return json.dumps({
+            'type': 'snapshot',
+            'tournament_id': tournament_id,
+            'sequence': sequence,
+            'standings': standings,
+        })
+
+    async def snapshot(self, tournament_id: str) -> str:
+        """Full standings, built once per sequence number and shared by subscribers"""
+        sequence = self._sequence.get(tournament_id, 0)
+        cached = self._snapshots.get(tournament_id)
+        if cached is None or cached[0] != sequence:
+            # Concurrent resyncs (e.g. many clients connecting at once) share one build
+            build = asyncio.ensure_future(self.run_db(self._build_snapshot, tournament_id, sequence))
+            cached = (sequence, build)
+            self._snapshots[tournament_id] = cached
+            self.messages_built += 1
+        try:
+            return await asyncio.shield(cached[1])
+        except Exception:
+            if self._snapshots.get(tournament_id) is cached:
+                del self._snapshots[tournament_id]
+            raise
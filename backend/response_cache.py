@@ -0,0 +1,88 @@
+"""
+In-process cache of serialized API responses.
+
+Entries are keyed by the resource and the tournament data version from
+``DatabaseManager.get_data_version``: every committed write bumps the version
+stored in the database, whichever process made it, so stale bodies are never
+served and simply age out of the LRU. The same version is sent as a weak
+ETag, letting clients revalidate with ``If-None-Match`` and get a 304 after a
+single primary-key lookup.
+"""
+
+import statistics
+from collections import OrderedDict, deque
+from typing import Dict, Hashable, Optional
+
+HIT = 'hit'
+MISS = 'miss'
+NOT_MODIFIED = 'not_modified'
+
+
+class ResponseCache:
+    """LRU of response bodies with hit-rate and latency metrics"""
+
+    def __init__(self, max_entries: int = 256, latency_window: int = 1000):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[Hashable, bytes]' = OrderedDict()
+        self._counts = {HIT: 0, MISS: 0, NOT_MODIFIED: 0}
+        # Latest latencies per outcome, for percentiles
+        self._latencies = {outcome: deque(maxlen=latency_window) for outcome in self._counts}
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        body = self._entries.get(key)
+        if body is not None:
+            self._entries.move_to_end(key)
+        return body
+
+    def put(self, key: Hashable, body: bytes):
+        self._entries[key] = body
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def record(self, outcome: str, seconds: float):
+        """Count one request served as HIT, MISS or NOT_MODIFIED"""
+        self._counts[outcome] += 1
+        self._latencies[outcome].append(seconds)
+
+    def stats(self) -> Dict:
+        total = sum(self._counts.values())
+        served = self._counts[HIT] + self._counts[NOT_MODIFIED]
+        latency = {}
+        for outcome, values in self._latencies.items():
+            if values:
+                ordered = sorted(values)
+                latency[outcome] = {
+                    'p50_ms': 1000 * statistics.median(ordered),
+                    'p99_ms': 1000 * ordered[min(len(ordered) - 1, int(0.99 * len(ordered)))],
+                }
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'requests': total,
+            **self._counts,
+            'hit_rate': served / total if total else 0.0,
+            'latency': latency,
+        }
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """True if an If-None-Match header value covers etag (weak comparison)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    bare = etag[2:] if etag.startswith('W/') else etag
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate.startswith('W/'):
+            candidate = candidate[2:]
+        if candidate == bare:
+            return True
+    return False
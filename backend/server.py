@@ -1,12 +1,16 @@
-from fastapi import FastAPI, APIRouter
+from fastapi import FastAPI, APIRouter, HTTPException, Query, Request, Response, WebSocket, WebSocketDisconnect
+from fastapi.responses import JSONResponse, StreamingResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
-from motor.motor_asyncio import AsyncIOMotorClient
 import os
+import sys
+import asyncio
+import json
 import logging
+import time
 from pathlib import Path
 from pydantic import BaseModel, Field
-from typing import List
+from typing import Dict, List, Literal, Optional
 import uuid
 from datetime import datetime
 
@@ -14,10 +18,43 @@ from datetime import datetime
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
-# MongoDB connection
-mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
-db = client[os.environ['DB_NAME']]
+# Tournament logic lives in the desktop application modules (store.py, tournament.py)
+sys.path.insert(0, str(ROOT_DIR.parent))
+from store import DURABILITY_BATCH, DatabaseManager  # noqa: E402
+from tournament import PAIRING_METHODS, TournamentManager  # noqa: E402
+from live import LiveHub  # noqa: E402
+from response_cache import HIT, MISS, NOT_MODIFIED, ResponseCache, etag_matches  # noqa: E402
+from storage import create_storage  # noqa: E402
+from async_store import AsyncDatabaseManager  # noqa: E402
+
+# SQLite tournament database (same file as the desktop application by default)
+store = DatabaseManager(os.environ.get('SQLITE_PATH', str(ROOT_DIR.parent / 'petanque_manager.db')))
+tournaments = TournamentManager(store)
+
+# SQLite work never runs on the event loop: reads on a thread pool, writes on one
+# writer thread (scores received within WRITE_DELAY_MS group-committed, acknowledged
+# once durable: WRITE_DURABILITY=batch syncs each batch, timed every WRITE_SYNC_MS)
+db_workers = os.environ.get('DB_WORKERS')
+db = AsyncDatabaseManager(store, readers=int(db_workers) if db_workers else None,
+                          max_delay=float(os.environ.get('WRITE_DELAY_MS', 2)) / 1000,
+                          durability=os.environ.get('WRITE_DURABILITY', DURABILITY_BATCH),
+                          sync_interval=float(os.environ.get('WRITE_SYNC_MS', 50)) / 1000)
+
+# API-only data: embedded SQLite by default, MongoDB when STORAGE_BACKEND=mongo
+storage = create_storage(os.environ.get('STORAGE_BACKEND', 'sqlite'), store, db.read, db.write,
+                         mongo_url=os.environ.get('MONGO_URL'), db_name=os.environ.get('DB_NAME'))
+
+
+# Live standings push (WebSocket / Server-Sent Events)
+live_hub = LiveHub(store, db.read,
+                   coalesce_delay=float(os.environ.get('LIVE_COALESCE_DELAY', 0.1)),
+                   max_pending=int(os.environ.get('LIVE_MAX_PENDING', 32)))
+# A client that cannot take a message within this delay is disconnected
+LIVE_SEND_TIMEOUT = float(os.environ.get('LIVE_SEND_TIMEOUT', 10))
+
+# Serialized standings / round listings, keyed by tournament data version
+response_cache = ResponseCache(max_entries=int(os.environ.get('RESPONSE_CACHE_SIZE', 256)))
+
 
 # Create the main app without a prefix
 app = FastAPI()
@@ -35,6 +72,133 @@ class StatusCheck(BaseModel):
 class StatusCheckCreate(BaseModel):
     client_name: str
 
+TournamentType = Literal['tete_a_tete', 'doublette', 'triplette', 'quadrette', 'melee']
+
+PairingMethod = Literal[PAIRING_METHODS]
+
+class TournamentCreate(BaseModel):
+    name: str = Field(min_length=1)
+    type: TournamentType
+    num_courts: int = Field(ge=1)
+    pairing: PairingMethod = 'adjacent'
+
+class TournamentSummary(BaseModel):
+    id: str
+    name: str
+    type: str
+
+class Tournament(TournamentSummary):
+    num_courts: int
+    pairing: Optional[str] = None
+    status: Optional[str] = None
+    current_round: int = 0
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+
+class TeamCreate(BaseModel):
+    name: str = Field(min_length=1)
+    players: List[str] = []
+
+class Team(BaseModel):
+    id: str
+    tournament_id: str
+    name: str
+    players: List[str] = []
+    wins: int = 0
+    losses: int = 0
+    points_for: int = 0
+    points_against: int = 0
+
+class Match(BaseModel):
+    id: str
+    tournament_id: str
+    round_number: int
+    team1_id: str
+    team2_id: str
+    team1_name: Optional[str] = None
+    team2_name: Optional[str] = None
+    team1_score: Optional[int] = None
+    team2_score: Optional[int] = None
+    court_number: Optional[int] = None
+    status: str
+    is_bye: bool = False
+
+class RoundCreate(BaseModel):
+    # Defaults to the method chosen when the tournament was created
+    pairing: Optional[PairingMethod] = None
+
+class Round(BaseModel):
+    round_number: int
+    matches: List[Match]
+
+class MatchResult(BaseModel):
+    team1_score: int = Field(ge=0)
+    team2_score: int = Field(ge=0)
+
+class RoundResults(BaseModel):
+    results: Dict[str, MatchResult]
+
+class RoundResultsAck(BaseModel):
+    updated: int
+
+class Standing(BaseModel):
+    rank: int
+    id: str
+    name: str
+    wins: int
+    losses: int
+    points_for: int
+    points_against: int
+    point_difference: int
+
+class CacheStats(BaseModel):
+    entries: int
+    max_entries: int
+    requests: int
+    hit: int
+    miss: int
+    not_modified: int
+    hit_rate: float
+    latency: Dict[str, Dict[str, float]]
+
+
+async def get_tournament_or_404(tournament_id: str) -> Dict:
+    tournament = await db.get_tournament(tournament_id)
+    if tournament is None:
+        raise HTTPException(status_code=404, detail="Tournoi introuvable")
+    return tournament
+
+
+async def cached_response(request: Request, tournament_id: str, build) -> Response:
+    """Serve a tournament resource from the response cache.
+
+    The tournament data version stored in the database is the ETag, so writes
+    made by the desktop app invalidate it too. A matching If-None-Match gets
+    a 304 and a known version gets the cached body, both after a single
+    primary-key lookup. Otherwise ``build`` (a coroutine function returning
+    JSON-compatible data) runs once and its serialized result is cached under
+    that version. Unknown tournaments bypass the cache (``build`` raises 404).
+    """
+    start = time.perf_counter()
+    version = await db.get_data_version(tournament_id)
+    if version is None:
+        return JSONResponse(await build())
+    headers = {'ETag': f'W/"{version}"', 'Cache-Control': 'no-cache'}
+    if etag_matches(request.headers.get('if-none-match'), headers['ETag']):
+        response_cache.record(NOT_MODIFIED, time.perf_counter() - start)
+        return Response(status_code=304, headers=headers)
+
+    key = (request.url.path, str(request.query_params), version)
+    body = response_cache.get(key)
+    outcome = HIT
+    if body is None:
+        outcome = MISS
+        body = json.dumps(await build()).encode()
+        response_cache.put(key, body)
+    response_cache.record(outcome, time.perf_counter() - start)
+    return Response(content=body, media_type='application/json', headers=headers)
+
+
 # Add your routes to the router instead of directly to app
 @api_router.get("/")
 async def root():
@@ -42,16 +206,145 @@ async def root():
 
 @api_router.post("/status", response_model=StatusCheck)
 async def create_status_check(input: StatusCheckCreate):
-    status_dict = input.dict()
+    status_dict = input.model_dump()
     status_obj = StatusCheck(**status_dict)
-    _ = await db.status_checks.insert_one(status_obj.dict())
+    await storage.insert_status_check(status_obj.model_dump())
     return status_obj
 
 @api_router.get("/status", response_model=List[StatusCheck])
 async def get_status_checks():
-    status_checks = await db.status_checks.find().to_list(1000)
+    status_checks = await storage.list_status_checks(1000)
     return [StatusCheck(**status_check) for status_check in status_checks]
 
+# Tournaments
+@api_router.get("/tournaments", response_model=List[TournamentSummary])
+async def list_tournaments():
+    return await db.get_tournament_catalog()
+
+@api_router.post("/tournaments", response_model=Tournament, status_code=201)
+async def create_tournament(input: TournamentCreate):
+    tournament_id = await db.create_tournament(input.name, input.type, input.num_courts,
+                                               input.pairing)
+    return await db.get_tournament(tournament_id)
+
+@api_router.get("/tournaments/{tournament_id}", response_model=Tournament)
+async def get_tournament(tournament_id: str):
+    return await get_tournament_or_404(tournament_id)
+
+@api_router.delete("/tournaments/{tournament_id}", status_code=204)
+async def delete_tournament(tournament_id: str):
+    await get_tournament_or_404(tournament_id)
+    await db.delete_tournament(tournament_id)
+
+# Teams
+@api_router.get("/tournaments/{tournament_id}/teams", response_model=List[Team])
+async def list_teams(tournament_id: str, offset: int = Query(0, ge=0),
+                     limit: int = Query(100, ge=1, le=1000)):
+    await get_tournament_or_404(tournament_id)
+    return await db.get_teams_page(tournament_id, offset, limit)
+
+@api_router.post("/tournaments/{tournament_id}/teams", response_model=Team, status_code=201)
+async def create_team(tournament_id: str, input: TeamCreate):
+    await get_tournament_or_404(tournament_id)
+    team_id = await db.create_team(tournament_id, input.name, input.players)
+    return Team(id=team_id, tournament_id=tournament_id, name=input.name, players=input.players)
+
+@api_router.delete("/teams/{team_id}", status_code=204)
+async def delete_team(team_id: str):
+    await db.delete_team(team_id)
+
+# Rounds and results
+@api_router.post("/tournaments/{tournament_id}/rounds", response_model=Round, status_code=201)
+async def create_round(tournament_id: str, input: RoundCreate = RoundCreate()):
+    await get_tournament_or_404(tournament_id)
+    try:
+        await db.write(tournaments.generate_next_round, tournament_id, input.pairing)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    tournament = await db.get_tournament(tournament_id)
+    round_number = tournament['current_round']
+    matches = await db.get_matches_by_tournament_round(tournament_id, round_number)
+    return Round(round_number=round_number, matches=matches)
+
+@api_router.get("/tournaments/{tournament_id}/rounds/{round_number}/matches",
+                response_model=List[Match])
+async def list_matches(request: Request, tournament_id: str, round_number: int,
+                       offset: int = Query(0, ge=0), limit: int = Query(100, ge=1, le=1000)):
+    async def build():
+        await get_tournament_or_404(tournament_id)
+        page = await db.get_matches_page(tournament_id, round_number, offset, limit)
+        return [Match(**match).model_dump() for match in page]
+    return await cached_response(request, tournament_id, build)
+
+@api_router.put("/matches/{match_id}/result", status_code=204)
+async def record_match_result(match_id: str, input: MatchResult):
+    # Group-committed with the other scores waiting for the writer
+    try:
+        previous = await db.record_match_result(match_id, input.team1_score, input.team2_score)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    if previous is None:
+        raise HTTPException(status_code=404, detail="Match introuvable")
+
+@api_router.post("/tournaments/{tournament_id}/rounds/{round_number}/results",
+                 response_model=RoundResultsAck)
+async def submit_round_results(tournament_id: str, round_number: int, input: RoundResults):
+    await get_tournament_or_404(tournament_id)
+    results = {match_id: (r.team1_score, r.team2_score) for match_id, r in input.results.items()}
+    try:
+        updated = await db.write(tournaments.submit_round_results, tournament_id,
+                               round_number, results)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    return RoundResultsAck(updated=updated)
+
+# Standings
+@api_router.get("/tournaments/{tournament_id}/standings", response_model=List[Standing])
+async def get_standings(request: Request, tournament_id: str, offset: int = Query(0, ge=0),
+                        limit: Optional[int] = Query(None, ge=1)):
+    async def build():
+        await get_tournament_or_404(tournament_id)
+        page = await db.get_standings_page(tournament_id, offset, limit)
+        return [Standing(rank=offset + i + 1, **team).model_dump() for i, team in enumerate(page)]
+    return await cached_response(request, tournament_id, build)
+
+@api_router.get("/cache/stats", response_model=CacheStats)
+async def get_cache_stats():
+    return response_cache.stats()
+
+# Live standings
+@api_router.websocket("/tournaments/{tournament_id}/live")
+async def live_standings_ws(websocket: WebSocket, tournament_id: str):
+    if await db.get_tournament(tournament_id) is None:
+        await websocket.close(code=4404)
+        return
+    await websocket.accept()
+    subscriber = live_hub.subscribe(tournament_id)
+    try:
+        async for message in live_hub.stream(subscriber):
+            await asyncio.wait_for(websocket.send_text(message), LIVE_SEND_TIMEOUT)
+    except asyncio.TimeoutError:
+        await websocket.close(code=1013)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        live_hub.unsubscribe(subscriber)
+
+@api_router.get("/tournaments/{tournament_id}/live/sse")
+async def live_standings_sse(tournament_id: str):
+    await get_tournament_or_404(tournament_id)
+    subscriber = live_hub.subscribe(tournament_id)
+
+    async def event_stream():
+        try:
+            async for message in live_hub.stream(subscriber):
+                yield f"data: {message}\n\n"
+        finally:
+            live_hub.unsubscribe(subscriber)
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache"})
+
 # Include the router in the main app
 app.include_router(api_router)
 
@@ -70,6 +363,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def start_live_hub():
+    live_hub.start()
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
-    client.close()
+    live_hub.stop()
+    await storage.close()
+    db.close()
+    store.close()
@@ -0,0 +1,107 @@
+"""
+Storage backends for the API-only collections (status checks).
+
+Tournament data always lives in the SQLite file shared with the desktop
+application (``store.DatabaseManager``). The remaining API data goes through
+a ``Storage`` chosen by configuration:
+
+- ``sqlite`` (default): a table in that same SQLite file, no network needed;
+- ``mongo``: a MongoDB database through motor, imported only when selected.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable, Dict, List, Optional
+
+
+class Storage(ABC):
+    """Async interface used by the API routes"""
+
+    name = 'abstract'
+
+    @abstractmethod
+    async def insert_status_check(self, check: Dict):
+        ...
+
+    @abstractmethod
+    async def list_status_checks(self, limit: int = 1000) -> List[Dict]:
+        ...
+
+    async def close(self):
+        pass
+
+
+class SqliteStorage(Storage):
+    """Embedded default: a table next to the tournaments.
+
+    ``run_db`` runs the blocking reads off the event loop, ``run_write`` the
+    writes (the same function unless the server has a dedicated writer).
+    """
+
+    name = 'sqlite'
+
+    def __init__(self, store, run_db: Callable[..., Awaitable],
+                 run_write: Optional[Callable[..., Awaitable]] = None):
+        self.store = store
+        self.run_db = run_db
+        self.run_write = run_write or run_db
+        conn = store.get_connection()
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS status_checks (
+                id TEXT PRIMARY KEY,
+                client_name TEXT NOT NULL,
+                timestamp TEXT NOT NULL
+            )
+        ''')
+        conn.commit()
+
+    def _insert_status_check(self, check: Dict):
+        conn = self.store.get_connection()
+        conn.execute('INSERT INTO status_checks (id, client_name, timestamp) VALUES (?, ?, ?)',
+                     (check['id'], check['client_name'], check['timestamp'].isoformat()))
+        conn.commit()
+
+    def _list_status_checks(self, limit: int) -> List[Dict]:
+        conn = self.store.get_connection()
+        rows = conn.execute('SELECT id, client_name, timestamp FROM status_checks '
+                            'ORDER BY timestamp LIMIT ?', (limit,)).fetchall()
+        return [dict(row) for row in rows]
+
+    async def insert_status_check(self, check: Dict):
+        await self.run_write(self._insert_status_check, check)
+
+    async def list_status_checks(self, limit: int = 1000) -> List[Dict]:
+        return await self.run_db(self._list_status_checks, limit)
+
+
+class MongoStorage(Storage):
+    """Optional MongoDB backend (requires motor)"""
+
+    name = 'mongo'
+
+    def __init__(self, url: str, db_name: str):
+        # Imported here so that the default configuration never needs motor
+        from motor.motor_asyncio import AsyncIOMotorClient
+        self.client = AsyncIOMotorClient(url)
+        self.db = self.client[db_name]
+
+    async def insert_status_check(self, check: Dict):
+        await self.db.status_checks.insert_one(dict(check))
+
+    async def list_status_checks(self, limit: int = 1000) -> List[Dict]:
+        return await self.db.status_checks.find({}, {'_id': 0}).to_list(limit)
+
+    async def close(self):
+        self.client.close()
+
+
+def create_storage(backend: str, store, run_db: Callable[..., Awaitable],
+                   run_write: Optional[Callable[..., Awaitable]] = None,
+                   mongo_url: Optional[str] = None, db_name: Optional[str] = None) -> Storage:
+    """Build the storage selected by configuration ('sqlite' or 'mongo')"""
+    if backend == 'sqlite':
+        return SqliteStorage(store, run_db, run_write)
+    if backend == 'mongo':
+        if not mongo_url or not db_name:
+            raise ValueError("STORAGE_BACKEND=mongo requires MONGO_URL and DB_NAME")
+        return MongoStorage(mongo_url, db_name)
+    raise ValueError(f"Unknown storage backend: {backend!r} (expected 'sqlite' or 'mongo')")
@@ -0,0 +1 @@
+# Benchmarks de Pétanque Manager
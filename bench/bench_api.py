@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Test de charge de l'API REST (backend/server.py)
+Lance uvicorn en local sur une base temporaire puis soumet en parallèle les
+scores d'un tour via httpx ; affiche les latences p50 / p99 et le débit,
+puis celles des lectures du classement (corps en cache et revalidation ETag)
+
+Nécessite fastapi, uvicorn et httpx (backend/requirements.txt).
+Usage : python -m bench.bench_api [--teams 512] [--clients 32] [--rounds 3] [--reads 500]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+try:
+    import httpx
+except ImportError:
+    sys.exit("httpx est nécessaire : pip install httpx")
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_server(workdir: str, port: int) -> subprocess.Popen:
+    """Démarre uvicorn sur une base SQLite temporaire et attend qu'il réponde"""
+    env = dict(os.environ, SQLITE_PATH=os.path.join(workdir, 'bench_api.db'))
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'uvicorn', 'server:app', '--app-dir', os.path.join(ROOT, 'backend'),
+         '--host', '127.0.0.1', '--port', str(port), '--log-level', 'warning'],
+        cwd=workdir, env=env)
+    deadline = time.monotonic() + 20
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(f'http://127.0.0.1:{port}/api/', timeout=0.5)
+            return server
+        except httpx.TransportError:
+            if server.poll() is not None:
+                sys.exit("Le serveur n'a pas démarré")
+            time.sleep(0.1)
+    server.terminate()
+    sys.exit("Le serveur ne répond pas")
+
+
+def percentile(values, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def play_round(client: httpx.AsyncClient, tournament_id: str, clients: int, rng) -> list:
+    """Génère un tour puis soumet chaque score (un PUT par match, clients requêtes en vol)"""
+    response = await client.post(f'/api/tournaments/{tournament_id}/rounds', json={})
+    response.raise_for_status()
+    matches = [m for m in response.json()['matches'] if m['team1_id'] != m['team2_id']]
+
+    latencies = []
+    queue = asyncio.Queue()
+    for match in matches:
+        queue.put_nowait(match)
+
+    async def worker():
+        while not queue.empty():
+            match = queue.get_nowait()
+            winner_first = rng.random() < 0.5
+            loser = rng.randint(0, 12)
+            body = {'team1_score': 13 if winner_first else loser,
+                    'team2_score': loser if winner_first else 13}
+            start = time.perf_counter()
+            result = await client.put(f"/api/matches/{match['id']}/result", json=body)
+            latencies.append(time.perf_counter() - start)
+            result.raise_for_status()
+
+    await asyncio.gather(*(worker() for _ in range(clients)))
+    return latencies
+
+
+async def run(port: int, args) -> list:
+    rng = random.Random(0)
+    limits = httpx.Limits(max_connections=args.clients)
+    async with httpx.AsyncClient(base_url=f'http://127.0.0.1:{port}', limits=limits,
+                                 timeout=30) as client:
+        response = await client.post('/api/tournaments', json={
+            'name': 'Bench API', 'type': 'doublette', 'num_courts': 64})
+        response.raise_for_status()
+        tournament_id = response.json()['id']
+        await asyncio.gather(*(
+            client.post(f'/api/tournaments/{tournament_id}/teams',
+                        json={'name': f'Équipe {i + 1}', 'players': ['a', 'b']})
+            for i in range(args.teams)))
+
+        latencies = []
+        for _ in range(args.rounds):
+            latencies += await play_round(client, tournament_id, args.clients, rng)
+
+        reads = await read_standings(client, tournament_id, args.reads)
+        cache_stats = (await client.get('/api/cache/stats')).json()
+    return latencies, reads, cache_stats
+
+
+async def read_standings(client: httpx.AsyncClient, tournament_id: str, count: int) -> dict:
+    """Lectures répétées du classement : sans ETag (corps en cache) puis avec If-None-Match"""
+    url = f'/api/tournaments/{tournament_id}/standings'
+    reads = {'200': [], '304': []}
+    etag = None
+    for headers in ({}, None):
+        for _ in range(count):
+            start = time.perf_counter()
+            response = await client.get(url, headers=headers if headers is not None
+                                        else {'If-None-Match': etag})
+            reads[str(response.status_code)].append(time.perf_counter() - start)
+            etag = response.headers['etag']
+    return reads
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--teams', type=int, default=512)
+    parser.add_argument('--clients', type=int, default=32)
+    parser.add_argument('--rounds', type=int, default=3)
+    parser.add_argument('--reads', type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        port = free_port()
+        server = start_server(workdir, port)
+        try:
+            start = time.perf_counter()
+            latencies, reads, cache_stats = asyncio.run(run(port, args))
+            elapsed = time.perf_counter() - start
+        finally:
+            server.terminate()
+            server.wait()
+
+    print(f"{len(latencies)} scores soumis par {args.clients} clients simultanés "
+          f"({args.teams} équipes, {args.rounds} tours)")
+    print(f"p50 : {1000 * statistics.median(latencies):8.2f} ms")
+    print(f"p99 : {1000 * percentile(latencies, 0.99):8.2f} ms")
+    print(f"Débit global : {len(latencies) / elapsed:8.1f} scores/s")
+    for status, label in (('200', "corps"), ('304', "revalidation 304")):
+        if reads[status]:
+            print(f"Classement ({label}, {len(reads[status])} lectures) : "
+                  f"p50 {1000 * statistics.median(reads[status]):.2f} ms, "
+                  f"p99 {1000 * percentile(reads[status], 0.99):.2f} ms")
+    print(f"Cache serveur : {100 * cache_stats['hit_rate']:.1f} % de réussite "
+          f"({cache_stats['hit']} corps, {cache_stats['not_modified']} 304, "
+          f"{cache_stats['miss']} construits)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark de la couche de connexions SQLite
+Compare le débit (ops/s) avec et sans pool de connexions sur un tournoi de 500 équipes
+
+Usage : python -m bench.bench_connections [--teams 500] [--repeat 2000]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from store import DatabaseManager
+from tournament import TournamentManager
+
+
+def setup_tournament(db: DatabaseManager, num_teams: int) -> str:
+    """Crée un tournoi doublette avec num_teams équipes"""
+    tournament_id = db.create_tournament("Bench", "doublette", 32)
+    for i in range(num_teams):
+        db.create_team(tournament_id, f"Équipe {i + 1}", [f"J{2 * i}", f"J{2 * i + 1}"])
+    return tournament_id
+
+
+def measure(label: str, func, repeat: int) -> float:
+    """Exécute func repeat fois et retourne le nombre d'opérations par seconde"""
+    start = time.perf_counter()
+    for i in range(repeat):
+        func(i)
+    elapsed = time.perf_counter() - start
+    return repeat / elapsed if elapsed > 0 else float('inf')
+
+
+def run(max_connections: int, num_teams: int, repeat: int) -> dict:
+    """Lance la série de mesures pour une configuration donnée"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseManager(os.path.join(tmp, "bench.db"), max_connections=max_connections)
+        manager = TournamentManager(db)
+        tournament_id = setup_tournament(db, num_teams)
+
+        results = {}
+        results['get_tournament'] = measure(
+            'get_tournament', lambda i: db.get_tournament(tournament_id), repeat)
+
+        start = time.perf_counter()
+        matches = manager.generate_next_round(tournament_id)
+        results['generate_next_round (s)'] = time.perf_counter() - start
+
+        match_ids = [m['id'] for m in matches]
+        results['update_match_result'] = measure(
+            'update_match_result',
+            lambda i: manager.update_match_result(match_ids[i % len(match_ids)], 13, i % 13),
+            min(repeat, len(match_ids)))
+
+        db.close()
+        return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--teams', type=int, default=500)
+    parser.add_argument('--repeat', type=int, default=2000)
+    args = parser.parse_args()
+
+    before = run(0, args.teams, args.repeat)
+    after = run(8, args.teams, args.repeat)
+
+    print(f"{'Opération':<28}{'sans pool':>14}{'avec pool':>14}")
+    for key in before:
+        print(f"{key:<28}{before[key]:>14.2f}{after[key]:>14.2f}")
+
+
+if __name__ == '__main__':
+    main()
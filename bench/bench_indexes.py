@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark des index du schéma
+Mesure la latence des requêtes principales sur une base contenant plusieurs
+saisons de tournois archivés, avant et après application des migrations
+
+Usage : python -m bench.bench_indexes [--tournaments 150] [--teams 64] [--rounds 5]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import uuid
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from store import DatabaseManager, SCHEMA_VERSION
+
+
+def populate(db: DatabaseManager, num_tournaments: int, num_teams: int, num_rounds: int):
+    """Remplit la base avec des tournois archivés (insertion directe pour la rapidité)"""
+    conn = db.get_connection()
+    tournament_ids = []
+    for t in range(num_tournaments):
+        tournament_id = str(uuid.uuid4())
+        tournament_ids.append(tournament_id)
+        conn.execute('INSERT INTO tournaments (id, name, type, num_courts, current_round) '
+                     'VALUES (?, ?, ?, ?, ?)',
+                     (tournament_id, f"Saison {t // 30} - {t}", "doublette", 16, num_rounds))
+        team_ids = [str(uuid.uuid4()) for _ in range(num_teams)]
+        conn.executemany('INSERT INTO teams (id, tournament_id, name, players) VALUES (?, ?, ?, ?)',
+                         [(team_id, tournament_id, f"Équipe {i + 1}", '[]')
+                          for i, team_id in enumerate(team_ids)])
+        rows = []
+        for round_number in range(1, num_rounds + 1):
+            random.shuffle(team_ids)
+            for i in range(0, num_teams - 1, 2):
+                rows.append((str(uuid.uuid4()), tournament_id, round_number,
+                             team_ids[i], team_ids[i + 1], i // 2 + 1))
+        conn.executemany('INSERT INTO matches (id, tournament_id, round_number, team1_id, '
+                         'team2_id, court_number) VALUES (?, ?, ?, ?, ?, ?)', rows)
+    conn.commit()
+    return tournament_ids
+
+
+def drop_indexes(db: DatabaseManager):
+    """Ramène la base dans l'état d'avant les migrations"""
+    conn = db.get_connection()
+    for name, in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index' "
+                              "AND name LIKE 'idx_%'").fetchall():
+        conn.execute(f'DROP INDEX {name}')
+    conn.execute('PRAGMA user_version = 0')
+    conn.commit()
+
+
+def time_queries(db: DatabaseManager, tournament_ids, samples: int) -> dict:
+    """Retourne la latence moyenne (ms) de chaque requête"""
+    conn = db.get_connection()
+    targets = [random.choice(tournament_ids) for _ in range(samples)]
+    team_ids = [conn.execute('SELECT id FROM teams WHERE tournament_id = ? LIMIT 2',
+                             (tid,)).fetchall() for tid in targets]
+    pair_sql = '''
+        SELECT COUNT(*) FROM matches
+        WHERE tournament_id = ? AND (
+            (team1_id = ? AND team2_id = ?) OR
+            (team1_id = ? AND team2_id = ?)
+        )
+    '''
+    queries = {
+        'get_teams_by_tournament': lambda i: db.get_teams_by_tournament(targets[i]),
+        'get_matches_by_tournament_round':
+            lambda i: db.get_matches_by_tournament_round(targets[i], 1 + i % 5),
+        'have_teams_played': lambda i: conn.execute(
+            pair_sql, (targets[i], team_ids[i][0][0], team_ids[i][1][0],
+                       team_ids[i][1][0], team_ids[i][0][0])).fetchone(),
+        'matches_of_team': lambda i: conn.execute(
+            'SELECT COUNT(*) FROM matches WHERE team1_id = ? OR team2_id = ?',
+            (team_ids[i][0][0], team_ids[i][0][0])).fetchone(),
+        'get_team_standings': lambda i: db.get_team_standings(targets[i]),
+    }
+    results = {}
+    for name, query in queries.items():
+        start = time.perf_counter()
+        for i in range(samples):
+            query(i)
+        results[name] = (time.perf_counter() - start) * 1000 / samples
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--tournaments', type=int, default=150)
+    parser.add_argument('--teams', type=int, default=64)
+    parser.add_argument('--rounds', type=int, default=5)
+    parser.add_argument('--samples', type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "archive.db")
+        db = DatabaseManager(path)
+        tournament_ids = populate(db, args.tournaments, args.teams, args.rounds)
+        drop_indexes(db)
+        before = time_queries(db, tournament_ids, args.samples)
+        db.migrate()
+        after = time_queries(db, tournament_ids, args.samples)
+        db.close()
+
+    print(f"Base : {args.tournaments} tournois x {args.teams} équipes x {args.rounds} tours "
+          f"(schéma v{SCHEMA_VERSION})")
+    print(f"{'Requête (ms)':<34}{'sans index':>12}{'avec index':>12}")
+    for name in before:
+        print(f"{name:<34}{before[name]:>12.3f}{after[name]:>12.3f}")
+
+
+if __name__ == '__main__':
+    main()
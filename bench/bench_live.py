@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark de la diffusion du classement en direct (backend/live.py)
+Simule des spectateurs abonnés à un tournoi, alimentés par un flux de
+résultats (100 par minute par défaut) dans un seul processus ; mesure la
+latence entre l'enregistrement d'un score et sa réception par chaque abonné
+
+Usage : python -m bench.bench_live [--subscribers 500] [--rate 100] [--speed 10]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'backend'))
+
+from live import LiveHub
+from store import DatabaseManager
+from tournament import TournamentManager
+
+
+async def consume(hub: LiveHub, subscriber, sent: dict, latencies: list, counters: dict,
+                  delay: float):
+    """Un écran spectateur : lit les messages, éventuellement lentement"""
+    async for message in hub.stream(subscriber):
+        received = time.perf_counter()
+        data = json.loads(message)
+        counters[data['type']] += 1
+        for match in data.get('matches', ()):
+            latencies.append(received - sent[match['id']])
+        if delay:
+            await asyncio.sleep(delay)
+
+
+async def produce(manager: TournamentManager, db: DatabaseManager, tournament_id: str,
+                  count: int, interval: float, sent: dict, rng: random.Random):
+    """Flux de résultats régulier ; un nouveau tour est généré quand le précédent est joué"""
+    pending = []
+    for _ in range(count):
+        if not pending:
+            await asyncio.to_thread(manager.generate_next_round, tournament_id, 'matching')
+            round_number = (await asyncio.to_thread(db.get_tournament, tournament_id))['current_round']
+            pending = [m['id'] for m in await asyncio.to_thread(
+                db.get_matches_by_tournament_round, tournament_id, round_number)
+                if m['status'] != 'finished']
+        match_id = pending.pop()
+        loser = rng.randint(0, 12)
+        scores = (13, loser) if rng.random() < 0.5 else (loser, 13)
+        sent[match_id] = time.perf_counter()
+        await asyncio.to_thread(manager.update_match_result, match_id, *scores)
+        await asyncio.sleep(interval)
+
+
+async def run(args, db: DatabaseManager, tournament_id: str):
+    hub = LiveHub(db, asyncio.to_thread, coalesce_delay=args.coalesce, max_pending=args.max_pending)
+    hub.start()
+    sent, latencies = {}, []
+    counters = {'snapshot': 0, 'delta': 0}
+    slow_count = int(args.subscribers * args.slow)
+    subscribers = [hub.subscribe(tournament_id) for _ in range(args.subscribers)]
+    consumers = [asyncio.ensure_future(consume(hub, s, sent, latencies, counters,
+                                               args.slow_delay if i < slow_count else 0))
+                 for i, s in enumerate(subscribers)]
+
+    interval = 60 / (args.rate * args.speed)
+    start = time.perf_counter()
+    await produce(TournamentManager(db), db, tournament_id, args.results, interval, sent,
+                  random.Random(0))
+    await asyncio.sleep(args.coalesce + 0.5)  # Laisser partir le dernier delta
+    elapsed = time.perf_counter() - start
+
+    for consumer in consumers:
+        consumer.cancel()
+    await asyncio.gather(*consumers, return_exceptions=True)
+    hub.stop()
+    dropped = sum(s.dropped for s in subscribers)
+    return latencies, counters, hub.messages_built, dropped, elapsed, slow_count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--subscribers', type=int, default=500)
+    parser.add_argument('--rate', type=float, default=100, help="résultats par minute")
+    parser.add_argument('--speed', type=float, default=10, help="accélération du temps simulé")
+    parser.add_argument('--results', type=int, default=200)
+    parser.add_argument('--teams', type=int, default=128)
+    parser.add_argument('--coalesce', type=float, default=0.1)
+    parser.add_argument('--max-pending', type=int, default=32)
+    parser.add_argument('--slow', type=float, default=0.05, help="part d'abonnés lents")
+    parser.add_argument('--slow-delay', type=float, default=1.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        db = DatabaseManager(os.path.join(workdir, 'bench_live.db'))
+        tournament_id = db.create_tournament("Bench live", "doublette", 64)
+        db.create_teams_bulk(tournament_id, [(f"Équipe {i + 1}", ["a", "b"])
+                                             for i in range(args.teams)])
+        latencies, counters, built, dropped, elapsed, slow_count = asyncio.run(
+            run(args, db, tournament_id))
+        db.close()
+
+    fast = sorted(latencies)
+    print(f"{args.subscribers} abonnés ({slow_count} lents), {args.results} résultats "
+          f"à {args.rate:g}/min (x{args.speed:g}) en {elapsed:.1f} s")
+    print(f"Messages construits : {built} (diffusés : {counters['delta']} deltas, "
+          f"{counters['snapshot']} instantanés)")
+    print(f"Messages abandonnés (clients lents) : {dropped}")
+    if fast:
+        print(f"Latence p50 : {1000 * statistics.median(fast):8.2f} ms")
+        print(f"Latence p99 : {1000 * fast[min(len(fast) - 1, int(0.99 * len(fast)))]:8.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Benchmark des méthodes d'appariement des tournois standard
+Simule des tournois complets et mesure, pour chaque méthode, le temps par tour,
+le nombre de revanches et le nombre d'équipes laissées sans match
+
+Usage : python -m bench.bench_pairing [--teams 200] [--rounds 6] [--engine-teams 1000]
+        [--swiss-teams 512]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from pairing import MatchingPairingEngine, SwissPairingEngine
+from store import DatabaseManager
+from tournament import TournamentManager, PAIRING_METHODS
+
+
+def simulate(pairing: str, num_teams: int, num_rounds: int, seed: int) -> dict:
+    """Joue num_rounds tours avec la méthode donnée et agrège les mesures"""
+    random.seed(seed)
+    db = DatabaseManager(f"file:bench_pairing_{pairing}_{seed}?mode=memory&cache=shared")
+    manager = TournamentManager(db)
+    tournament_id = db.create_tournament("Bench", "doublette", 32)
+    for i in range(num_teams):
+        db.create_team(tournament_id, f"Équipe {i + 1}", ["a", "b"])
+    strength = {t['id']: random.random() for t in db.get_teams_by_tournament(tournament_id)}
+
+    seen = set()
+    round_times, rematches, unpaired = [], 0, 0
+    for _ in range(num_rounds):
+        start = time.perf_counter()
+        matches = manager.generate_next_round(tournament_id, pairing)
+        round_times.append(time.perf_counter() - start)
+
+        playing = num_teams - num_teams % 2
+        unpaired += playing - 2 * len(matches)
+        for match in matches:
+            team1_id, team2_id = match['team1']['id'], match['team2']['id']
+            key = frozenset((team1_id, team2_id))
+            rematches += key in seen
+            seen.add(key)
+            # Modèle de score : la plus forte gagne le plus souvent, le perdant marque 0 à 12
+            p1 = strength[team1_id] / (strength[team1_id] + strength[team2_id])
+            loser_score = random.randint(0, 12)
+            if random.random() < p1:
+                manager.update_match_result(match['id'], 13, loser_score)
+            else:
+                manager.update_match_result(match['id'], loser_score, 13)
+    db.close()
+    return {
+        'ms/tour': 1000 * sum(round_times) / len(round_times),
+        'revanches': rematches,
+        'sans match': unpaired,
+    }
+
+
+def bench_engine(num_teams: int, seed: int) -> float:
+    """Temps (s) du moteur seul sur num_teams équipes avec un historique de 5 tours"""
+    rng = random.Random(seed)
+    team_ids = [f"t{i}" for i in range(num_teams)]
+    performances = {t: rng.uniform(-60, 110) for t in team_ids}
+    played = set()
+    for _ in range(5):
+        rng.shuffle(team_ids)
+        played.update(frozenset(p) for p in zip(team_ids[0::2], team_ids[1::2]))
+    have_played = lambda a, b: frozenset((a, b)) in played
+
+    start = time.perf_counter()
+    pairs, unpaired = MatchingPairingEngine().pair(team_ids, performances, have_played)
+    elapsed = time.perf_counter() - start
+    assert not unpaired and all(not have_played(a, b) for a, b in pairs)
+    return elapsed
+
+
+def bench_swiss_engine(num_teams: int, seed: int) -> float:
+    """Temps (s) du moteur suisse seul : num_teams équipes après 5 tours joués"""
+    rng = random.Random(seed)
+    team_ids = [f"t{i}" for i in range(num_teams)]
+    wins = dict.fromkeys(team_ids, 0)
+    played = set()
+    for _ in range(5):
+        rng.shuffle(team_ids)
+        for a, b in zip(team_ids[0::2], team_ids[1::2]):
+            played.add(frozenset((a, b)))
+            wins[a if rng.random() < 0.5 else b] += 1
+    tiebreaks = {t: (rng.randint(-60, 60), rng.randint(0, 80)) for t in team_ids}
+    have_played = lambda a, b: frozenset((a, b)) in played
+
+    start = time.perf_counter()
+    pairs, unpaired = SwissPairingEngine().pair(team_ids, wins, have_played, tiebreaks)
+    elapsed = time.perf_counter() - start
+    assert not unpaired and all(not have_played(a, b) for a, b in pairs)
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--teams', type=int, default=200)
+    parser.add_argument('--rounds', type=int, default=6)
+    parser.add_argument('--tournaments', type=int, default=3)
+    parser.add_argument('--engine-teams', type=int, default=1000)
+    parser.add_argument('--swiss-teams', type=int, default=512)
+    args = parser.parse_args()
+
+    print(f"{args.tournaments} tournois simulés, {args.teams} équipes, {args.rounds} tours")
+    print(f"{'Méthode':<12}{'ms/tour':>10}{'revanches':>12}{'sans match':>12}")
+    for pairing in PAIRING_METHODS:
+        totals = {'ms/tour': 0.0, 'revanches': 0, 'sans match': 0}
+        for seed in range(args.tournaments):
+            for key, value in simulate(pairing, args.teams, args.rounds, seed).items():
+                totals[key] += value
+        print(f"{pairing:<12}{totals['ms/tour'] / args.tournaments:>10.2f}"
+              f"{totals['revanches']:>12}{totals['sans match']:>12}")
+
+    elapsed = bench_engine(args.engine_teams, 0)
+    print(f"Moteur seul, {args.engine_teams} équipes : {elapsed * 1000:.1f} ms")
+    elapsed = bench_swiss_engine(args.swiss_teams, 0)
+    print(f"Moteur suisse seul, {args.swiss_teams} équipes : {elapsed * 1000:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark du classement incrémental
+Compare, après chaque mise à jour de score, la requête SQL de classement au
+classement en mémoire (top-N, position d'une équipe, page du classement)
+
+Usage : python -m bench.bench_standings [--teams 5000] [--updates 500]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from store import DatabaseManager
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--teams', type=int, default=5000)
+    parser.add_argument('--updates', type=int, default=500)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    db = DatabaseManager("file:bench_standings?mode=memory&cache=shared")
+    tournament_id = db.create_tournament("Bench", "triplette", 64)
+    team_ids = [db.create_team(tournament_id, f"Équipe {i + 1}", ["a", "b", "c"])
+                for i in range(args.teams)]
+    db.get_standings_index(tournament_id)
+
+    stats = {team_id: [0, 0, 0, 0] for team_id in team_ids}
+    stream = []
+    for _ in range(args.updates):
+        winner, loser = rng.sample(team_ids, 2)
+        loser_score = rng.randint(0, 12)
+        stats[winner][0] += 1
+        stats[winner][2] += 13
+        stats[winner][3] += loser_score
+        stats[loser][1] += 1
+        stats[loser][2] += loser_score
+        stats[loser][3] += 13
+        stream.append((winner, tuple(stats[winner])))
+        stream.append((loser, tuple(stats[loser])))
+
+    sql_time = index_time = 0.0
+    for team_id, values in stream:
+        db.update_team_stats(team_id, *values)
+
+        start = time.perf_counter()
+        db._query_team_standings(tournament_id)
+        sql_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        db.get_standings_page(tournament_id, 0, 20)
+        db.get_team_rank(tournament_id, team_id)
+        db.get_standings_page(tournament_id, 2000, 50)
+        index_time += time.perf_counter() - start
+
+    ranking = lambda rows: [(r['wins'], r['point_difference'], r['points_for']) for r in rows]
+    assert ranking(db.get_team_standings(tournament_id)) == ranking(
+        db._query_team_standings(tournament_id))
+    n = len(stream)
+    print(f"{args.teams} équipes, {n} mises à jour de statistiques")
+    print(f"Requête SQL complète          : {1000 * sql_time / n:8.3f} ms/mise à jour")
+    print(f"Classement en mémoire (3 req.): {1000 * index_time / n:8.3f} ms/mise à jour")
+    print(f"Accélération                  : x{sql_time / index_time:.0f}")
+    db.close()
+
+
+if __name__ == '__main__':
+    main()
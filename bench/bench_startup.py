@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark du démarrage de l'application
+Mesure, dans un interpréteur neuf, le temps d'import de l'interface et les
+étapes de main.main qui ne nécessitent pas d'affichage (ouverture de la base,
+liste des tournois) ; la construction de la fenêtre jusqu'à la première image
+n'est mesurée que si un affichage est disponible
+
+Usage : python -m bench.bench_startup [--repeat 5] [--tournaments 500]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+# Exécuté dans un interpréteur neuf (aucun module déjà importé)
+PROBE = r'''
+import json, sys, time
+start = time.perf_counter()
+import gui
+from store import db_manager
+imported = time.perf_counter()
+tournaments = db_manager.get_tournament_summaries()
+listed = time.perf_counter()
+result = {
+    'import': imported - start,
+    'list': listed - imported,
+    'tournaments': len(tournaments),
+    'reportlab_loaded': any(m.split('.')[0] == 'reportlab' for m in sys.modules),
+}
+try:
+    import tkinter as tk
+    root = tk.Tk()
+except Exception:
+    result['first_frame'] = None
+else:
+    root.withdraw()
+    before = time.perf_counter()
+    app = gui.MainWindow(root)
+    root.update_idletasks()
+    result['first_frame'] = time.perf_counter() - before
+    result['built_tabs'] = len(app.built_widgets())
+    root.destroy()
+print(json.dumps(result))
+'''
+
+
+def populate(workdir: str, count: int):
+    """Crée une base avec des tournois archivés dans le répertoire de travail"""
+    from store import DatabaseManager
+    db = DatabaseManager(os.path.join(workdir, 'petanque_manager.db'))
+    for i in range(count):
+        tournament_id = db.create_tournament(f"Archive {i + 1}", "doublette", 8)
+        db.create_teams_bulk(tournament_id, [(f"Équipe {k + 1}", ["a", "b"]) for k in range(16)])
+    db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--tournaments', type=int, default=500)
+    args = parser.parse_args()
+
+    env = dict(os.environ, PYTHONPATH=ROOT, PYTHONDONTWRITEBYTECODE='1')
+    samples = []
+    with tempfile.TemporaryDirectory() as workdir:
+        populate(workdir, args.tournaments)
+        for _ in range(args.repeat):
+            output = subprocess.run([sys.executable, '-c', PROBE], cwd=workdir, env=env,
+                                    capture_output=True, text=True, check=True).stdout
+            samples.append(json.loads(output.strip().splitlines()[-1]))
+
+    def median_ms(key):
+        values = [s[key] for s in samples if s.get(key) is not None]
+        return f"{1000 * statistics.median(values):8.2f} ms" if values else "     n/d"
+
+    print(f"{args.repeat} démarrages, {samples[0]['tournaments']} tournois en base")
+    print(f"Import de l'interface     : {median_ms('import')}")
+    print(f"Liste des tournois        : {median_ms('list')}")
+    print(f"Fenêtre (première image)  : {median_ms('first_frame')}")
+    if samples[0].get('built_tabs') is not None:
+        print(f"Onglets construits        : {samples[0]['built_tabs']}/3")
+    print(f"reportlab chargé au démarrage : {'oui' if samples[0]['reportlab_loaded'] else 'non'}")
+    if samples[0]['reportlab_loaded']:
+        sys.exit("Régression : reportlab ne doit être importé qu'à l'export PDF")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Benchmark du rafraîchissement des tableaux Treeview
+Compare la reconstruction complète d'un tableau de 3 000 lignes à la
+synchronisation différentielle (TreeviewBinding) lorsqu'un seul score change
+
+Nécessite un affichage (tkinter). Usage : python -m bench.bench_table_refresh [--rows 3000]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tkinter as tk
+from tkinter import ttk
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from widgets.table_binding import TreeviewBinding
+
+
+def make_rows(count: int, changed: int = -1):
+    return [(f"team-{i}", (f"Équipe {i + 1}", "A, B", 13 if i == changed else 0, 0, 0, 0), ())
+            for i in range(count)]
+
+
+def full_rebuild(tree, rows):
+    """Comportement d'origine : tout supprimer puis tout réinsérer"""
+    for item in tree.get_children():
+        tree.delete(item)
+    for iid, values, tags in rows:
+        tree.insert('', 'end', iid=iid, values=values, tags=tags)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=3000)
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        sys.exit(f"Affichage indisponible : {e}")
+    root.withdraw()
+    columns = ('Nom', 'Joueurs', 'Victoires', 'Défaites', 'Points +', 'Points -')
+
+    rebuild_tree = ttk.Treeview(root, columns=columns, show='headings')
+    full_rebuild(rebuild_tree, make_rows(args.rows))
+    start = time.perf_counter()
+    for k in range(args.repeat):
+        full_rebuild(rebuild_tree, make_rows(args.rows, changed=k))
+        root.update_idletasks()
+    rebuild = (time.perf_counter() - start) / args.repeat
+
+    diff_tree = ttk.Treeview(root, columns=columns, show='headings')
+    binding = TreeviewBinding(diff_tree)
+    binding.sync(make_rows(args.rows))
+    start = time.perf_counter()
+    for k in range(args.repeat):
+        binding.sync(make_rows(args.rows, changed=k))
+        root.update_idletasks()
+    synced = (time.perf_counter() - start) / args.repeat
+
+    root.destroy()
+    print(f"{args.rows} lignes, un score modifié par rafraîchissement")
+    print(f"Reconstruction complète : {1000 * rebuild:8.2f} ms")
+    print(f"Synchronisation diff    : {1000 * synced:8.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
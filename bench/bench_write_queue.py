@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark de l'écriture des scores avec 1, 10 et 100 écrivains simultanés
+Compare une transaction par score (record_match_result depuis chaque thread) et
+la file à validation groupée (WriteQueue), en durabilité par lot puis périodique ;
+chaque écrivain attend l'accusé de son score avant d'envoyer le suivant
+
+Usage : python -m bench.bench_write_queue [--scores 2000] [--writers 1 10 100] [--delay-ms 2]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from store import DURABILITY_BATCH, DURABILITY_TIMED, DatabaseManager, WriteQueue
+
+
+def setup_round(db: DatabaseManager, num_matches: int):
+    """Crée un tournoi et un tour de num_matches matchs ; retourne leurs identifiants"""
+    tournament_id = db.create_tournament("Bench", "doublette", 64)
+    team_ids = db.create_teams_bulk(tournament_id, [(f"Équipe {i + 1}", ["a", "b"])
+                                                    for i in range(2 * num_matches)])
+    pairs = [(team_ids[i], team_ids[i + 1], i // 2 + 1) for i in range(0, len(team_ids), 2)]
+    return db.create_matches_bulk(tournament_id, 1, pairs)
+
+
+def run(mode: str, writers: int, num_scores: int, delay: float, sync_interval: float) -> dict:
+    """Mesure un mode ('direct', 'batch' ou 'timed') avec writers threads"""
+    with tempfile.TemporaryDirectory() as tmp:
+        # Une connexion par écrivain en mode direct, comme autant de requêtes en parallèle
+        db = DatabaseManager(os.path.join(tmp, 'bench.db'), max_connections=writers + 2,
+                             pragmas={'synchronous': 'FULL'})
+        match_ids = setup_round(db, num_scores)
+        writes = None
+        if mode == 'direct':
+            def record(match_id):
+                db.record_match_result(match_id, 13, 7)
+        else:
+            writes = WriteQueue(db, max_delay=delay, sync_interval=sync_interval,
+                                durability=DURABILITY_BATCH if mode == 'batch' else DURABILITY_TIMED)
+
+            def record(match_id):
+                writes.submit_result(match_id, 13, 7).result()
+
+        latencies = []
+        lock = threading.Lock()
+
+        def writer(ids):
+            mine = []
+            for match_id in ids:
+                start = time.perf_counter()
+                record(match_id)
+                mine.append(time.perf_counter() - start)
+            db.release_connection()
+            with lock:
+                latencies.extend(mine)
+
+        threads = [threading.Thread(target=writer, args=(match_ids[i::writers],))
+                   for i in range(writers)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        transactions = num_scores
+        if writes is not None:
+            writes.close()
+            transactions = writes.batches
+        db.close()
+
+    latencies.sort()
+    return {
+        'throughput': num_scores / elapsed,
+        'p50': statistics.median(latencies),
+        'p99': latencies[min(len(latencies) - 1, int(0.99 * len(latencies)))],
+        'transactions': transactions,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scores', type=int, default=2000)
+    parser.add_argument('--writers', type=int, nargs='+', default=[1, 10, 100])
+    parser.add_argument('--delay-ms', type=float, default=2.0,
+                        help="fenêtre de regroupement de la file")
+    parser.add_argument('--sync-ms', type=float, default=50.0,
+                        help="période de synchronisation en durabilité 'timed'")
+    args = parser.parse_args()
+
+    print(f"{args.scores} scores, synchronous = FULL pour les écritures directes")
+    print(f"{'mode':>8} {'écrivains':>10} {'scores/s':>10} {'p50 ms':>9} {'p99 ms':>9} "
+          f"{'transactions':>13}")
+    for writers in args.writers:
+        for mode in ('direct', 'batch', 'timed'):
+            result = run(mode, writers, args.scores, args.delay_ms / 1000, args.sync_ms / 1000)
+            print(f"{mode:>8} {writers:>10} {result['throughput']:>10.0f} "
+                  f"{1000 * result['p50']:>9.2f} {1000 * result['p99']:>9.2f} "
+                  f"{result['transactions']:>13}")
+
+
+if __name__ == '__main__':
+    main()
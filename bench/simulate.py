@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Simulateur de tournoi sans interface
+Crée un tournoi de taille et de type donnés sur une base en mémoire, joue N tours
+avec un modèle de score au choix et produit un rapport JSON par tour : temps,
+requêtes SQL, revanches, matchs entre groupes de victoires différents (qualité
+de l'appariement), équipes sans match et répartition des BYE
+
+Le modèle de score est un nom de SCORE_MODELS ou un chemin « module:fonction »
+vers une fonction (rng, force1, force2) -> (score1, score2).
+
+Usage : python -m bench.simulate [--teams 128] [--type doublette] [--rounds 6]
+        [--pairing matching] [--score-model strength] [--seed 0] [--output rapport.json]
+"""
+
+import argparse
+import importlib
+import json
+import os
+import platform
+import random
+import sys
+import time
+from collections import Counter
+from typing import Callable, Dict, Tuple
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from store import DatabaseManager
+from tournament import PAIRING_METHODS, TournamentManager
+
+TOURNAMENT_TYPES = ('tete_a_tete', 'doublette', 'triplette', 'quadrette', 'melee')
+PLAYERS_PER_TEAM = {'tete_a_tete': 1, 'doublette': 2, 'triplette': 3, 'quadrette': 4, 'melee': 1}
+
+ScoreModel = Callable[[random.Random, float, float], Tuple[int, int]]
+
+
+def strength_model(rng: random.Random, strength1: float, strength2: float) -> Tuple[int, int]:
+    """La plus forte gagne le plus souvent (Bradley-Terry), le perdant marque 0 à 12"""
+    loser = rng.randint(0, 12)
+    if rng.random() < strength1 / (strength1 + strength2):
+        return 13, loser
+    return loser, 13
+
+
+def random_model(rng: random.Random, strength1: float, strength2: float) -> Tuple[int, int]:
+    """Pile ou face, sans tenir compte de la force des équipes"""
+    loser = rng.randint(0, 12)
+    return (13, loser) if rng.random() < 0.5 else (loser, 13)
+
+
+def close_model(rng: random.Random, strength1: float, strength2: float) -> Tuple[int, int]:
+    """Parties serrées (perdant entre 9 et 12) : beaucoup d'ex æquo au classement"""
+    loser = rng.randint(9, 12)
+    return (13, loser) if rng.random() < 0.5 else (loser, 13)
+
+
+SCORE_MODELS: Dict[str, ScoreModel] = {
+    'strength': strength_model,
+    'random': random_model,
+    'close': close_model,
+}
+
+
+def load_score_model(name: str) -> ScoreModel:
+    """Modèle par nom, ou fonction importée depuis « module:fonction »"""
+    if ':' in name:
+        module_name, function_name = name.split(':', 1)
+        return getattr(importlib.import_module(module_name), function_name)
+    try:
+        return SCORE_MODELS[name]
+    except KeyError:
+        raise ValueError(f"Modèle de score inconnu : {name}") from None
+
+
+class StatementCounter:
+    """Compte les requêtes exécutées sur une connexion SQLite (trace_callback)"""
+
+    def __init__(self, conn):
+        self.count = 0
+        self.active = True
+        conn.set_trace_callback(self._trace)
+
+    def _trace(self, statement: str):
+        if self.active:
+            self.count += 1
+
+    def take(self) -> int:
+        count, self.count = self.count, 0
+        return count
+
+
+def simulate(num_teams: int, tournament_type: str = 'doublette', num_rounds: int = 6,
+             pairing: str = 'matching', score_model: ScoreModel = strength_model,
+             seed: int = 0, num_courts: int = 0) -> Dict:
+    """Joue un tournoi complet et retourne le rapport (sérialisable en JSON)"""
+    rng = random.Random(seed)
+    random.seed(seed)  # Tirages internes de TournamentManager (BYE, mêlée)
+    db = DatabaseManager(f"file:simulate_{os.getpid()}_{seed}_{time.monotonic_ns()}"
+                         f"?mode=memory&cache=shared")
+    manager = TournamentManager(db)
+    num_courts = num_courts or max(1, num_teams // 2)
+    tournament_id = db.create_tournament("Simulation", tournament_type, num_courts)
+    players = PLAYERS_PER_TEAM[tournament_type]
+    team_ids = db.create_teams_bulk(tournament_id, [
+        (f"Équipe {i + 1}", [f"J{i + 1}.{p + 1}" for p in range(players)])
+        for i in range(num_teams)])
+    strength = {team_id: rng.uniform(0.2, 1.0) for team_id in team_ids}
+
+    # Toutes les requêtes de la simulation passent par la connexion de ce thread
+    counter = StatementCounter(db.get_connection())
+    counter.take()
+
+    seen = set()
+    byes = Counter()
+    rounds = []
+    error = None
+    for round_number in range(1, num_rounds + 1):
+        start = time.perf_counter()
+        try:
+            matches = manager.generate_next_round(tournament_id, pairing)
+        except ValueError as e:
+            error = str(e)
+            break
+        pairing_ms = 1000 * (time.perf_counter() - start)
+        pairing_statements = counter.take()
+
+        start = time.perf_counter()
+        results = {match['id']: score_model(rng, strength[match['team1']['id']],
+                                            strength[match['team2']['id']])
+                   for match in matches}
+        manager.submit_round_results(tournament_id, round_number, results)
+        scoring_ms = 1000 * (time.perf_counter() - start)
+        scoring_statements = counter.take()
+
+        # Mesures hors comptage : BYE du tour (matchs marqués is_bye en base)
+        counter.active = False
+        round_byes = [m['team1_id'] for m in db.get_matches_by_tournament_round(
+            tournament_id, round_number) if m['is_bye']]
+        counter.active = True
+        byes.update(round_byes)
+
+        rematches = cross_group = score_gap = 0
+        playing = set()
+        for match in matches:
+            pair = frozenset((match['team1']['id'], match['team2']['id']))
+            rematches += pair in seen
+            seen.add(pair)
+            playing.update(pair)
+            # Qualité d'appariement : écart de victoires avant le tour
+            gap = abs(match['team1']['wins'] - match['team2']['wins'])
+            cross_group += gap > 0
+            score_gap += gap
+        rounds.append({
+            'round': round_number,
+            'matches': len(matches),
+            'wall_ms': round(pairing_ms + scoring_ms, 3),
+            'pairing_ms': round(pairing_ms, 3),
+            'scoring_ms': round(scoring_ms, 3),
+            'pairing_statements': pairing_statements,
+            'scoring_statements': scoring_statements,
+            'rematches': rematches,
+            'cross_group': cross_group,
+            'score_gap': score_gap,
+            'unpaired': num_teams - len(playing) - len(round_byes),
+            'byes': len(round_byes),
+            'repeated_byes': sum(byes[team_id] > 1 for team_id in round_byes),
+        })
+    db.close()
+
+    distribution = Counter(byes[team_id] for team_id in team_ids)
+    report = {
+        'rounds': rounds,
+        'totals': {
+            'rounds_played': len(rounds),
+            'wall_ms': round(sum(r['wall_ms'] for r in rounds), 3),
+            'pairing_ms': round(sum(r['pairing_ms'] for r in rounds), 3),
+            'scoring_ms': round(sum(r['scoring_ms'] for r in rounds), 3),
+            'statements': sum(r['pairing_statements'] + r['scoring_statements'] for r in rounds),
+            'rematches': sum(r['rematches'] for r in rounds),
+            'cross_group': sum(r['cross_group'] for r in rounds),
+            'score_gap': sum(r['score_gap'] for r in rounds),
+            'unpaired': sum(r['unpaired'] for r in rounds),
+            'byes': sum(byes.values()),
+            # Nombre d'équipes par nombre de BYE reçus ({"0": 120, "1": 8})
+            'bye_distribution': {str(k): distribution[k] for k in sorted(distribution)},
+            'max_byes_per_team': max(distribution) if distribution else 0,
+        },
+    }
+    if error:
+        report['error'] = error
+    return report
+
+
+def app_version() -> str:
+    with open(os.path.join(ROOT, 'VERSION.txt'), encoding='utf-8') as f:
+        return f.readline().strip()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--teams', type=int, default=128)
+    parser.add_argument('--type', choices=TOURNAMENT_TYPES, default='doublette')
+    parser.add_argument('--rounds', type=int, default=6)
+    parser.add_argument('--pairing', choices=PAIRING_METHODS, default='matching')
+    parser.add_argument('--score-model', default='strength',
+                        help=f"{', '.join(SCORE_MODELS)} ou module:fonction")
+    parser.add_argument('--courts', type=int, default=0, help="0 : un terrain par match")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help="fichier JSON (sortie standard par défaut)")
+    args = parser.parse_args()
+
+    report = {
+        'version': app_version(),
+        'python': platform.python_version(),
+        'config': {
+            'teams': args.teams, 'type': args.type, 'rounds': args.rounds,
+            'pairing': args.pairing, 'score_model': args.score_model,
+            'courts': args.courts, 'seed': args.seed,
+        },
+        **simulate(args.teams, args.type, args.rounds, args.pairing,
+                   load_score_model(args.score_model), args.seed, args.courts),
+    }
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""
+Module de notifications de Pétanque Manager
+Le gestionnaire de base de données publie chaque modification validée (type
+et identifiants concernés) ; l'interface et le serveur s'y abonnent
+"""
+
+import threading
+from typing import Callable, Iterable, List, NamedTuple, Optional, Tuple
+
+# Types d'évènements
+TOURNAMENT_CREATED = 'tournament_created'
+TOURNAMENT_UPDATED = 'tournament_updated'
+TOURNAMENT_DELETED = 'tournament_deleted'
+TEAM_CREATED = 'team_created'
+TEAM_UPDATED = 'team_updated'  # Nom, joueurs ou statistiques
+TEAM_DELETED = 'team_deleted'
+ROUND_CREATED = 'round_created'
+MATCH_SCORED = 'match_scored'
+MATCH_UPDATED = 'match_updated'  # Terrain
+
+
+class ChangeEvent(NamedTuple):
+    """Modification publiée après validation de la transaction"""
+    kind: str
+    tournament_id: Optional[str]  # None si l'émetteur ne connaît pas le tournoi
+    ids: Tuple[str, ...] = ()
+
+
+class EventBus:
+    """Diffusion des évènements aux abonnés.
+
+    Les abonnés sont appelés de façon synchrone, dans le thread qui a écrit
+    en base ; ils doivent donc rester brefs (mise en file, le plus souvent).
+    """
+
+    def __init__(self):
+        self._subscribers: List[Callable[[ChangeEvent], None]] = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback: Callable[[ChangeEvent], None]) -> Callable[[], None]:
+        """Abonne callback ; retourne la fonction de désabonnement"""
+        with self._lock:
+            self._subscribers.append(callback)
+        return lambda: self.unsubscribe(callback)
+
+    def unsubscribe(self, callback: Callable[[ChangeEvent], None]):
+        with self._lock:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+    def emit(self, kind: str, tournament_id: Optional[str], ids: Iterable[str] = ()):
+        """Publie un évènement à tous les abonnés"""
+        with self._lock:
+            subscribers = list(self._subscribers)
+        if not subscribers:
+            return
+        event = ChangeEvent(kind, tournament_id, tuple(ids))
+        for callback in subscribers:
+            callback(event)
@@ -7,11 +7,15 @@ sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import os
+from events import TOURNAMENT_CREATED, TOURNAMENT_DELETED, TOURNAMENT_UPDATED
 from store import db_manager
+from widgets.change_dispatcher import ChangeDispatcher, tournament_deleted
 from widgets.team_widget import TeamWidget
 from widgets.match_widget import MatchWidget
 from widgets.standings_widget import StandingsWidget
-from tournament import TournamentManager
+from widgets.task_executor import TaskExecutor
+from widgets.diagnostics_panel import DiagnosticsPanel
+from tournament import PAIRING_METHODS, TournamentManager
 
 class MainWindow:
     """Fenêtre principale de l'application"""
@@ -19,12 +23,23 @@ class MainWindow:
     def __init__(self, root):
         self.root = root
         self.current_tournament_id = None
+        self.tournament_ids = []  # Identifiants dans l'ordre de la liste déroulante
         self.tournament_manager = TournamentManager()
         self.theme = 'light'  # 'light' ou 'dark'
         
+        # Accès base de données et export PDF hors de la boucle Tk
+        self.task_executor = TaskExecutor(root, on_busy_change=self.on_tasks_change)
+        # Notifications de la base, regroupées par cycle Tk, pour les rafraîchissements ciblés
+        self.changes = ChangeDispatcher(root, db_manager.events)
+        self.changes.add_listener(self.on_changes)
+        
         self.setup_ui()
         self.setup_menu()
         self.load_tournaments()
+        
+        # Panneau de diagnostic de la base, sans entrée de menu
+        self.diagnostics = None
+        self.root.bind_all('<Control-Shift-D>', self.show_diagnostics)
     
     def setup_ui(self):
         """Configure l'interface utilisateur"""
@@ -79,32 +94,68 @@ class MainWindow:
                   command=self.delete_tournament).grid(row=0, column=5, padx=5)
     
     def setup_tabs(self):
-        """Configure les onglets principaux"""
+        """Configure les onglets principaux (contenu construit au premier affichage)"""
         self.notebook = ttk.Notebook(self.root)
         self.notebook.grid(row=1, column=0, sticky='nsew', padx=10, pady=5)
         
         # Onglet Équipes/Joueurs
         self.team_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.team_frame, text='Équipes / Joueurs')
-        self.team_widget = TeamWidget(self.team_frame, self)
+        self.team_widget = None
         
         # Onglet Matchs
         self.match_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.match_frame, text='Matchs')
-        self.match_widget = MatchWidget(self.match_frame, self)
+        self.match_widget = None
         
         # Onglet Classement
         self.standings_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.standings_frame, text='Classement')
-        self.standings_widget = StandingsWidget(self.standings_frame, self)
+        self.standings_widget = None
+        
+        self._tabs = {
+            'team_widget': (self.team_frame, TeamWidget),
+            'match_widget': (self.match_frame, MatchWidget),
+            'standings_widget': (self.standings_frame, StandingsWidget),
+        }
+        self.notebook.bind('<<NotebookTabChanged>>', self.on_tab_change)
+        self.on_tab_change()
+    
+    def get_widget(self, attribute):
+        """Retourne le widget d'un onglet, en le construisant s'il n'existe pas encore"""
+        widget = getattr(self, attribute)
+        if widget is None:
+            frame, widget_class = self._tabs[attribute]
+            widget = widget_class(frame, self)
+            setattr(self, attribute, widget)
+        return widget
+    
+    def built_widgets(self):
+        """Widgets des onglets déjà construits"""
+        return [getattr(self, attribute) for attribute in self._tabs
+                if getattr(self, attribute) is not None]
+    
+    def on_tab_change(self, event=None):
+        """Construit et remplit un onglet lors de son premier affichage"""
+        selected = self.notebook.select()
+        for attribute, (frame, _) in self._tabs.items():
+            if str(frame) == selected and getattr(self, attribute) is None:
+                self.refresh_all_widgets([self.get_widget(attribute)])
     
     def setup_status_bar(self):
         """Configure la barre de statut"""
         self.status_var = tk.StringVar()
         self.status_var.set("Prêt")
-        status_bar = ttk.Label(self.root, textvariable=self.status_var, 
+        status_frame = ttk.Frame(self.root)
+        status_frame.grid(row=2, column=0, sticky='ew', padx=5, pady=2)
+        status_frame.grid_columnconfigure(0, weight=1)
+        
+        status_bar = ttk.Label(status_frame, textvariable=self.status_var, 
                               relief=tk.SUNKEN, anchor=tk.W)
-        status_bar.grid(row=2, column=0, sticky='ew', padx=5, pady=2)
+        status_bar.grid(row=0, column=0, sticky='ew')
+        
+        # Indicateur d'activité des tâches de fond (affiché seulement pendant un traitement)
+        self.progress = ttk.Progressbar(status_frame, mode='indeterminate', length=150)
     
     def setup_menu(self):
         """Configure la barre de menus"""
@@ -131,31 +182,45 @@ class MainWindow:
         menubar.add_cascade(label="Aide", menu=help_menu)
         help_menu.add_command(label="À propos", command=self.show_about)
     
-    def load_tournaments(self):
-        """Charge la liste des tournois"""
-        tournaments = db_manager.get_all_tournaments()
-        tournament_names = [f"{t['name']} ({t['type']})" for t in tournaments]
-        self.tournament_combo['values'] = tournament_names
+    def load_tournaments(self, select_id=None):
+        """Charge la liste des tournois et sélectionne select_id (par défaut le plus récent)"""
+        self.update_tournament_list()
 
-        if tournaments:
-            self.tournament_combo.current(0)
-            self.current_tournament_id = tournaments[0]['id']
+        if self.tournament_ids:
+            if select_id not in self.tournament_ids:
+                select_id = self.tournament_ids[0]
+            self.tournament_combo.current(self.tournament_ids.index(select_id))
             self.on_tournament_change()
         else:
             self.current_tournament_id = None
             self.tournament_combo.set('')
     
+    def update_tournament_list(self):
+        """Remplit la liste déroulante depuis le catalogue, en conservant la sélection"""
+        tournaments = db_manager.get_tournament_catalog()
+        self.tournament_ids = [t['id'] for t in tournaments]
+        self.tournament_combo['values'] = [f"{t['name']} ({t['type']})" for t in tournaments]
+        if self.current_tournament_id in self.tournament_ids:
+            self.tournament_combo.current(self.tournament_ids.index(self.current_tournament_id))
+    
+    def on_changes(self, events):
+        """Suit la création, la modification et la suppression des tournois"""
+        if not any(event.kind in (TOURNAMENT_CREATED, TOURNAMENT_UPDATED, TOURNAMENT_DELETED)
+                   for event in events):
+            return
+        if tournament_deleted(events, self.current_tournament_id):
+            # Le tournoi affiché a disparu : sélectionner le premier restant
+            self.current_tournament_id = None
+            self.load_tournaments()
+        else:
+            self.update_tournament_list()
+    
     def create_tournament(self):
         """Ouvre la boîte de dialogue pour créer un tournoi"""
         dialog = TournamentDialog(self.root, self)
         if dialog.result:
-            self.load_tournaments()
             # Sélectionner le nouveau tournoi
-            tournaments = db_manager.get_all_tournaments()
-            if tournaments:
-                self.tournament_combo.current(0)
-                self.current_tournament_id = tournaments[0]['id']
-                self.on_tournament_change()
+            self.load_tournaments(select_id=dialog.result)
 
     def delete_tournament(self):
         """Supprime le tournoi actuel"""
@@ -171,37 +236,54 @@ class MainWindow:
             )
             if response:
                 try:
+                    # La liste et les onglets se mettent à jour via les notifications
                     db_manager.delete_tournament(self.current_tournament_id)
-                    self.current_tournament_id = None
-                    self.load_tournaments()
-                    self.refresh_all_widgets()
                     self.update_status(f"Tournoi '{tournament['name']}' supprimé")
                 except Exception as e:
                     messagebox.showerror("Erreur",
                                          f"Erreur lors de la suppression: {str(e)}")
-
-                # Réinitialiser la sélection post-suppression
-                self.tournament_combo.set('')
-                self.current_tournament_id = None
-                self.refresh_all_widgets()
-
-            
     
     def on_tournament_change(self, event=None):
         """Appelé quand le tournoi sélectionné change"""
         selection = self.tournament_combo.current()
-        if selection >= 0:
-            tournaments = db_manager.get_all_tournaments()
-            if selection < len(tournaments):
-                self.current_tournament_id = tournaments[selection]['id']
-                self.refresh_all_widgets()
+        # La position est relue dans la liste d'identifiants affichée, jamais dans une nouvelle requête
+        if 0 <= selection < len(self.tournament_ids):
+            self.current_tournament_id = self.tournament_ids[selection]
+            self.refresh_all_widgets()
     
-    def refresh_all_widgets(self):
-        """Rafraîchit tous les widgets avec les nouvelles données"""
-        if self.current_tournament_id:
-            self.team_widget.refresh()
-            self.match_widget.refresh()
-            self.standings_widget.refresh()
+    def refresh_all_widgets(self, widgets=None):
+        """Rafraîchit les widgets construits (données chargées en arrière-plan)"""
+        if not self.current_tournament_id:
+            return
+        
+        tournament_id = self.current_tournament_id
+        widgets = self.built_widgets() if widgets is None else widgets
+        
+        def render(data):
+            # Ignorer un chargement devenu obsolète (tournoi changé entre-temps)
+            if tournament_id != self.current_tournament_id:
+                return
+            for widget, widget_data in zip(widgets, data):
+                widget.render(widget_data)
+        
+        self.task_executor.submit(
+            lambda: [widget.load_data(tournament_id) for widget in widgets],
+            on_success=render,
+            on_error=lambda e: messagebox.showerror("Erreur", f"Erreur de chargement: {str(e)}"),
+            description="Chargement du tournoi"
+        )
+    
+    def on_tasks_change(self, description):
+        """Affiche la tâche de fond en cours dans la barre de statut"""
+        if description:
+            self.status_var.set(f"{description}...")
+            if not self.progress.winfo_ismapped():
+                self.progress.grid(row=0, column=1, padx=5)
+                self.progress.start(10)
+        else:
+            self.progress.stop()
+            self.progress.grid_remove()
+            self.status_var.set("Prêt")
     
     def change_theme(self, theme):
         """Change le thème de l'application"""
@@ -231,11 +313,17 @@ class MainWindow:
         )
         
         if filename:
-            try:
-                self.standings_widget.export_to_pdf(filename)
-                messagebox.showinfo("Succès", f"Export réussi vers {filename}")
-            except Exception as e:
-                messagebox.showerror("Erreur", f"Erreur lors de l'export: {str(e)}")
+            self.get_widget('standings_widget').export_to_pdf(
+                filename,
+                on_done=lambda f: messagebox.showinfo("Succès", f"Export réussi vers {f}")
+            )
+    
+    def show_diagnostics(self, event=None):
+        """Ouvre (ou ramène au premier plan) le panneau de diagnostic"""
+        if self.diagnostics is not None and self.diagnostics.exists():
+            self.diagnostics.window.lift()
+            return
+        self.diagnostics = DiagnosticsPanel(self.root, db_manager)
     
     def show_about(self):
         """Affiche la boîte de dialogue À propos"""
@@ -298,6 +386,12 @@ class TournamentDialog:
         courts_spin = ttk.Spinbox(main_frame, from_=1, to=20, textvariable=self.courts_var, width=10)
         courts_spin.grid(row=5, column=0, sticky='w', pady=5)
         
+        # Appariement (tournois tête-à-tête, doublette et triplette)
+        ttk.Label(main_frame, text="Appariement:").grid(row=4, column=1, sticky='w', pady=5)
+        self.pairing_var = tk.StringVar(value="adjacent")
+        ttk.Combobox(main_frame, textvariable=self.pairing_var, values=PAIRING_METHODS,
+                     state='readonly', width=12).grid(row=5, column=1, sticky='w', pady=5)
+        
         # Boutons
         button_frame = ttk.Frame(main_frame)
         button_frame.grid(row=6, column=0, columnspan=2, pady=20)
@@ -328,7 +422,8 @@ class TournamentDialog:
             return
         
         # Créer le tournoi
-        tournament_id = db_manager.create_tournament(name, tournament_type, num_courts)
+        tournament_id = db_manager.create_tournament(name, tournament_type, num_courts,
+                                                     self.pairing_var.get())
         self.result = tournament_id
         
         self.main_window.update_status(f"Tournoi '{name}' créé avec succès")
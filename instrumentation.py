@@ -0,0 +1,124 @@
+"""
+Module d'instrumentation de la base de données
+Mesure, à la demande, les appels aux méthodes de DatabaseManager (nombre et
+histogramme des durées) ainsi que les requêtes et validations SQLite
+"""
+
+import bisect
+import functools
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, List
+
+# Bornes supérieures (ms) des classes de l'histogramme des durées ; la dernière est ouverte
+LATENCY_BUCKETS_MS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+
+class MethodStats:
+    """Compteurs d'une méthode : appels, durée cumulée et maximale, histogramme"""
+
+    __slots__ = ('calls', 'errors', 'total', 'max', 'buckets')
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def add(self, elapsed_ms: float, failed: bool):
+        self.calls += 1
+        self.errors += failed
+        self.total += elapsed_ms
+        if elapsed_ms > self.max:
+            self.max = elapsed_ms
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+
+    def percentile(self, fraction: float) -> float:
+        """Borne supérieure de la classe contenant le percentile demandé (estimation)"""
+        target = fraction * self.calls
+        seen = 0
+        for i, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= target:
+                bound = LATENCY_BUCKETS_MS[i] if i < len(LATENCY_BUCKETS_MS) else self.max
+                return round(min(bound, self.max), 3)
+        return 0.0
+
+    def to_dict(self) -> Dict:
+        labels = [f"<={bound}" for bound in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}"]
+        return {
+            'calls': self.calls,
+            'errors': self.errors,
+            'total_ms': round(self.total, 3),
+            'mean_ms': round(self.total / self.calls, 3) if self.calls else 0.0,
+            'p50_ms': self.percentile(0.5),
+            'p95_ms': self.percentile(0.95),
+            'max_ms': round(self.max, 3),
+            'histogram_ms': {label: count for label, count in zip(labels, self.buckets) if count},
+        }
+
+
+class Instrumentation:
+    """Collecte des mesures d'un DatabaseManager instrumenté.
+
+    Les méthodes sont enveloppées par ``wrap`` et les connexions reçoivent
+    ``trace`` comme trace_callback ; rien de tout cela n'existe tant que
+    l'instrumentation n'est pas activée.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.methods: Dict[str, MethodStats] = {}
+        self.statements = 0
+        self.commits = 0
+        self.started = datetime.now()
+
+    def wrap(self, name: str, method: Callable) -> Callable:
+        """Retourne method mesurée sous le nom name"""
+        with self._lock:
+            stats = self.methods.setdefault(name, MethodStats())
+        lock = self._lock
+
+        @functools.wraps(method)
+        def measured(*args, **kwargs):
+            start = time.perf_counter()
+            failed = True
+            try:
+                result = method(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                elapsed_ms = 1000 * (time.perf_counter() - start)
+                with lock:
+                    stats.add(elapsed_ms, failed)
+
+        return measured
+
+    def trace(self, statement: str):
+        """trace_callback SQLite : compte les requêtes et les validations"""
+        with self._lock:
+            self.statements += 1
+            if statement.startswith('COMMIT'):
+                self.commits += 1
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            methods = {name: stats.to_dict() for name, stats in self.methods.items()
+                       if stats.calls}
+            return {
+                'since': self.started.isoformat(timespec='seconds'),
+                'statements': self.statements,
+                'commits': self.commits,
+                'methods': dict(sorted(methods.items(),
+                                       key=lambda item: item[1]['total_ms'], reverse=True)),
+            }
+
+
+def instrumented_methods(cls) -> List[str]:
+    """Méthodes publiques mesurées (hors gestion des connexions et de l'instrumentation)"""
+    excluded = {'get_connection', 'release_connection', 'close',
+                'enable_instrumentation', 'disable_instrumentation', 'stats', 'dump_stats'}
+    return [name for name, value in vars(cls).items()
+            if callable(value) and not name.startswith('_') and name not in excluded]
@@ -0,0 +1,267 @@
+"""
+Module d'appariement pour Pétanque Manager
+Résout un tour comme un couplage parfait de coût minimal, ou par groupes de
+score selon le système suisse
+"""
+
+from itertools import groupby
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+# Coût ajouté à une paire d'équipes qui se sont déjà rencontrées
+REMATCH_PENALTY = 1_000_000.0
+
+
+class MatchingPairingEngine:
+    """Appariement par couplage de coût minimal.
+
+    Le coût d'une paire est l'écart de performance entre les deux équipes ;
+    les revanches sont interdites, ou fortement pénalisées si
+    ``allow_rematches`` est vrai. L'algorithme procède en trois temps :
+
+    1. couplage glouton sur la liste triée (optimal sans contrainte en 1D) ;
+    2. chemins augmentants de longueur 3 pour placer les équipes restantes
+       en échangeant les partenaires d'une paire existante ;
+    3. amélioration locale (2-opt) entre paires voisines du classement.
+    """
+
+    def __init__(self, allow_rematches: bool = True, window: int = 64, max_passes: int = 4):
+        self.allow_rematches = allow_rematches
+        self.window = window
+        self.max_passes = max_passes
+
+    def pair(self, team_ids: Sequence[str], performances: Dict[str, float],
+             have_played: Callable[[str, str], bool]) -> Tuple[List[Tuple[str, str]], List[str]]:
+        """Apparie les équipes ; retourne (paires, équipes non appariées)
+
+        Les paires sont triées selon le rang de leur meilleure équipe.
+        """
+        order = sorted(team_ids, key=lambda t: performances[t], reverse=True)
+        rank = {team_id: i for i, team_id in enumerate(order)}
+
+        def cost(a: str, b: str) -> float:
+            gap = abs(performances[a] - performances[b])
+            return gap + REMATCH_PENALTY if have_played(a, b) else gap
+
+        partner: Dict[str, Optional[str]] = {team_id: None for team_id in order}
+        self._greedy(order, partner, have_played)
+
+        unpaired = [t for t in order if partner[t] is None]
+        if unpaired:
+            self._augment(order, rank, partner, unpaired, cost, have_played)
+            unpaired = [t for t in order if partner[t] is None]
+            if unpaired and self.allow_rematches:
+                # Dernier recours : revanches entre équipes restantes, voisines au classement
+                for a, b in zip(unpaired[0::2], unpaired[1::2]):
+                    partner[a], partner[b] = b, a
+                unpaired = [t for t in order if partner[t] is None]
+
+        pairs = [(a, partner[a]) for a in order
+                 if partner[a] is not None and rank[a] < rank[partner[a]]]
+        pairs = self._improve(pairs, cost)
+        pairs.sort(key=lambda p: min(rank[p[0]], rank[p[1]]))
+        return pairs, unpaired
+
+    def _greedy(self, order: List[str], partner: Dict[str, Optional[str]],
+                have_played: Callable[[str, str], bool]):
+        """Associe chaque équipe à la plus proche suivante encore libre et jamais rencontrée"""
+        n = len(order)
+        for i, a in enumerate(order):
+            if partner[a] is not None:
+                continue
+            for j in range(i + 1, min(n, i + 1 + self.window)):
+                b = order[j]
+                if partner[b] is None and not have_played(a, b):
+                    partner[a], partner[b] = b, a
+                    break
+
+    def _augment(self, order: List[str], rank: Dict[str, int],
+                 partner: Dict[str, Optional[str]], unpaired: List[str],
+                 cost: Callable[[str, str], float], have_played: Callable[[str, str], bool]):
+        """Place les équipes libres deux à deux via un échange avec une paire existante"""
+        free = list(unpaired)
+        while len(free) >= 2:
+            u = free.pop(0)
+            best = None
+            for v in free:
+                if not have_played(u, v):
+                    best = (cost(u, v), v, None, None)
+                    break
+                # Paires voisines de u au classement, par distance croissante
+                lo, hi = rank[u], rank[u]
+                for _ in range(self.window):
+                    lo, hi = lo - 1, hi + 1
+                    for k in (lo, hi):
+                        if not 0 <= k < len(order):
+                            continue
+                        x = order[k]
+                        y = partner[x]
+                        if y is None or y == u or y == v:
+                            continue
+                        for a, b in ((x, y), (y, x)):
+                            if not have_played(u, a) and not have_played(v, b):
+                                delta = cost(u, a) + cost(v, b) - cost(x, y)
+                                if best is None or delta < best[0]:
+                                    best = (delta, v, a, b)
+                    if best is not None:
+                        break
+                if best is not None:
+                    break
+            if best is None:
+                continue
+            _, v, a, b = best
+            free.remove(v)
+            if a is None:
+                partner[u], partner[v] = v, u
+            else:
+                partner[u], partner[a] = a, u
+                partner[v], partner[b] = b, v
+
+    def _improve(self, pairs: List[Tuple[str, str]],
+                 cost: Callable[[str, str], float]) -> List[Tuple[str, str]]:
+        """Échange les partenaires de paires consécutives tant que le coût total baisse"""
+        for _ in range(self.max_passes):
+            improved = False
+            for k in range(len(pairs) - 1):
+                (a, b), (c, d) = pairs[k], pairs[k + 1]
+                current = cost(a, b) + cost(c, d)
+                for p, q in (((a, c), (b, d)), ((a, d), (b, c))):
+                    if cost(*p) + cost(*q) < current:
+                        pairs[k], pairs[k + 1] = p, q
+                        current = cost(*p) + cost(*q)
+                        improved = True
+            if not improved:
+                break
+        return pairs
+
+
+class SwissPairingEngine(MatchingPairingEngine):
+    """Appariement suisse (système hollandais) par groupes de score.
+
+    Les équipes sont regroupées par nombre de victoires puis classées dans
+    chaque groupe par ``tiebreaks`` (différence de points, points marqués).
+    Dans un groupe, la moitié haute rencontre la moitié basse (1er contre
+    n/2 + 1, 2e contre n/2 + 2...) ; un couplage biparti par chemins
+    augmentants évite les revanches en s'écartant le moins possible de cet
+    ordre. Les équipes qu'un groupe ne peut pas apparier (nombre impair,
+    revanches) descendent dans le groupe suivant, où elles rencontrent en
+    priorité les mieux classées.
+
+    Les équipes encore seules en bas du tableau sont placées par les échanges
+    du couplage de coût minimal, puis en revanche si ``allow_rematches``.
+    """
+
+    def pair(self, team_ids: Sequence[str], scores: Dict[str, float],
+             have_played: Callable[[str, str], bool],
+             tiebreaks: Optional[Dict[str, tuple]] = None
+             ) -> Tuple[List[Tuple[str, str]], List[str]]:
+        """Apparie les équipes ; retourne (paires, équipes non appariées)
+
+        Les paires sont triées selon le rang de leur meilleure équipe.
+        """
+        if tiebreaks:
+            order = sorted(team_ids, key=lambda t: (scores[t], tiebreaks[t]), reverse=True)
+        else:
+            order = sorted(team_ids, key=lambda t: scores[t], reverse=True)
+        rank = {team_id: i for i, team_id in enumerate(order)}
+
+        pairs: List[Tuple[str, str]] = []
+        floaters: List[str] = []
+        for _, group in groupby(order, key=lambda t: scores[t]):
+            residents = list(group)
+            if floaters:
+                # Les équipes descendues affrontent d'abord le haut du groupe
+                matched, floaters, free = self._bipartite(floaters, residents, have_played,
+                                                          dutch=False)
+                pairs += matched
+                residents = [t for t in residents if t in free]
+            half = len(residents) // 2
+            matched, left1, left2 = self._bipartite(residents[:half], residents[half:],
+                                                    have_played)
+            pairs += matched
+            leftover = sorted(left1 + left2, key=rank.__getitem__)
+            pairs += self._pair_adjacent(leftover, have_played)
+            floaters = sorted(floaters + leftover, key=rank.__getitem__)
+
+        unpaired = floaters
+        if len(unpaired) >= 2:
+            partner: Dict[str, Optional[str]] = {team_id: None for team_id in order}
+            for a, b in pairs:
+                partner[a], partner[b] = b, a
+
+            def cost(a: str, b: str) -> float:
+                return abs(scores[a] - scores[b])
+
+            self._augment(order, rank, partner, unpaired, cost, have_played)
+            unpaired = [t for t in order if partner[t] is None]
+            if unpaired and self.allow_rematches:
+                for a, b in zip(unpaired[0::2], unpaired[1::2]):
+                    partner[a], partner[b] = b, a
+                unpaired = [t for t in order if partner[t] is None]
+            pairs = [(a, partner[a]) for a in order
+                     if partner[a] is not None and rank[a] < rank[partner[a]]]
+
+        pairs = [(a, b) if rank[a] < rank[b] else (b, a) for a, b in pairs]
+        pairs.sort(key=lambda p: rank[p[0]])
+        return pairs, unpaired
+
+    @staticmethod
+    def _bipartite(left: List[str], right: List[str], have_played: Callable[[str, str], bool],
+                   dutch: bool = True) -> Tuple[List[Tuple[str, str]], List[str], List[str]]:
+        """Couplage sans revanche entre left et right (algorithme de Kuhn)
+
+        Avec ``dutch``, le i-ème de left préfère le i-ème de right puis ses
+        voisins ; sinon il préfère le haut de right. Retourne (paires, left
+        non apparié, right non apparié), dans l'ordre d'origine.
+        """
+        owner: Dict[int, str] = {}
+        position = {team_id: i for i, team_id in enumerate(left)}
+
+        def candidates(i: int):
+            n = len(right)
+            if not dutch:
+                yield from range(n)
+                return
+            if i < n:
+                yield i
+            for d in range(1, n):
+                if i + d < n:
+                    yield i + d
+                if 0 <= i - d < n:
+                    yield i - d
+                elif i + d >= n:
+                    break
+
+        def assign(a: str, seen: set) -> bool:
+            for j in candidates(position[a]):
+                if j in seen or have_played(a, right[j]):
+                    continue
+                seen.add(j)
+                if j not in owner or assign(owner[j], seen):
+                    owner[j] = a
+                    return True
+            return False
+
+        for a in left:
+            assign(a, set())
+        matched = {a: right[j] for j, a in owner.items()}
+        pairs = [(a, matched[a]) for a in left if a in matched]
+        taken = set(owner)
+        return (pairs, [a for a in left if a not in matched],
+                [b for j, b in enumerate(right) if j not in taken])
+
+    @staticmethod
+    def _pair_adjacent(teams: List[str], have_played: Callable[[str, str], bool]
+                       ) -> List[Tuple[str, str]]:
+        """Apparie entre elles les équipes restantes d'un groupe, sans revanche ; les retire de teams"""
+        pairs = []
+        i = 0
+        while i < len(teams):
+            a = teams[i]
+            for j in range(i + 1, len(teams)):
+                if not have_played(a, teams[j]):
+                    pairs.append((a, teams.pop(j)))
+                    teams.pop(i)
+                    break
+            else:
+                i += 1
+        return pairs
@@ -0,0 +1,99 @@
+"""
+Module quadrette pour Pétanque Manager
+Planning complet des 7 tours d'un tournoi quadrette, calculé une fois au
+premier tour : rotation des adversaires sans revanche (table de Berger) et
+composition des sous-équipes de chaque tour
+"""
+
+import json
+import random
+from typing import List, Optional, Sequence, Tuple
+
+# Répartition des joueurs A, B, C, D (indices 0 à 3) en deux parties par tour :
+# chaque joueur dispute 3 triplettes, 3 doublettes et un tête-à-tête, et joue
+# 3 fois avec chacun de ses coéquipiers
+QUADRETTE_SPLITS = (
+    ((0, 1, 2), (3,)),
+    ((0, 1), (2, 3)),
+    ((0, 1, 3), (2,)),
+    ((0, 2), (1, 3)),
+    ((0, 2, 3), (1,)),
+    ((0, 3), (1, 2)),
+    ((1, 2, 3), (0,)),
+)
+QUADRETTE_ROUNDS = len(QUADRETTE_SPLITS)
+
+# À partir de ce nombre d'équipes, les 7 tours sont tous différents ; en dessous,
+# la rotation reprend des tours déjà joués (revanches et BYE répétés)
+QUADRETTE_MIN_TEAMS = QUADRETTE_ROUNDS
+
+# Indice d'adversaire d'une équipe exemptée (BYE) dans le planning
+BYE = -1
+
+
+def round_pattern(round_number: int) -> str:
+    """Répartition d'un tour sous forme lisible, par exemple « ABC vs D »"""
+    return ' vs '.join(''.join('ABCD'[i] for i in group)
+                       for group in QUADRETTE_SPLITS[round_number - 1])
+
+
+def round_compositions(players: Sequence[str], round_number: int) -> List[List[str]]:
+    """Sous-équipes d'une équipe pour un tour (joueurs dans l'ordre A, B, C, D)"""
+    return [[players[i] for i in group if i < len(players)]
+            for group in QUADRETTE_SPLITS[round_number - 1]]
+
+
+class QuadretteSchedule:
+    """Planning précalculé : ordre des équipes et, par tour, la liste à plat
+    des indices appariés (``BYE`` pour une équipe exemptée).
+
+    Servir un tour ne demande qu'un accès à la liste du tour.
+    """
+
+    def __init__(self, team_ids: Sequence[str], rounds: Sequence[Sequence[int]]):
+        self.team_ids = list(team_ids)
+        self.rounds = [list(indices) for indices in rounds]
+
+    @classmethod
+    def build(cls, team_ids: Sequence[str], rng=random) -> 'QuadretteSchedule':
+        """Tire l'ordre des équipes puis calcule les 7 tours par la méthode du cercle
+
+        À partir de 7 équipes (8 places avec l'équipe fictive d'un nombre
+        impair), les 7 tours sont tous différents : aucune paire ne se
+        rencontre deux fois et aucune équipe n'a deux BYE. En dessous, les
+        tours du cercle sont repris dans l'ordre : chaque paire se rencontre
+        autant de fois qu'une autre à une près, et de même pour les BYE.
+        """
+        order = rng.sample(list(team_ids), len(team_ids))
+        size = len(order) + len(order) % 2  # Équipe fictive (BYE) si impair
+        rounds = []
+        for r in range(QUADRETTE_ROUNDS):
+            # Position 0 fixe, les autres tournent d'un cran par tour
+            shift = r % (size - 1)
+            others = list(range(1, size))
+            circle = [0] + others[shift:] + others[:shift]
+            indices = []
+            for i in range(size // 2):
+                a, b = circle[i], circle[size - 1 - i]
+                if b >= len(order):
+                    b = BYE
+                elif a >= len(order):
+                    a, b = b, BYE
+                indices.extend((a, b))
+            rounds.append(indices)
+        return cls(order, rounds)
+
+    def pairs(self, round_number: int) -> List[Tuple[str, Optional[str]]]:
+        """Paires (équipe 1, équipe 2) du tour ; équipe 2 vaut None pour un BYE"""
+        indices = self.rounds[round_number - 1]
+        team_ids = self.team_ids
+        return [(team_ids[a], team_ids[b] if b != BYE else None)
+                for a, b in zip(indices[0::2], indices[1::2])]
+
+    def to_json(self) -> str:
+        return json.dumps({'teams': self.team_ids, 'rounds': self.rounds}, separators=(',', ':'))
+
+    @classmethod
+    def from_json(cls, text: str) -> 'QuadretteSchedule':
+        data = json.loads(text)
+        return cls(data['teams'], data['rounds'])
@@ -3,28 +3,407 @@ Module de gestion de la base de données SQLite
 Gère la persistance des données de tournois, équipes, joueurs et matchs
 """
 
+import os
+import queue
 import sqlite3
+import threading
+import time
 import uuid
-from typing import List, Dict, Optional
+from concurrent.futures import Future
+from typing import Callable, List, Dict, Optional, Tuple
 import json
 
+import events
+from events import EventBus
+from instrumentation import Instrumentation, instrumented_methods
+from quadrette import QuadretteSchedule
+from standings import StandingsIndex
+
+
+# Pragmas appliqués à chaque nouvelle connexion (surchargeables par DatabaseManager)
+DEFAULT_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'temp_store': 'MEMORY',
+    'busy_timeout': 5000,
+}
+
+
+# Migrations du schéma, appliquées dans l'ordre selon PRAGMA user_version
+MIGRATIONS = [
+    (1, [
+        'CREATE INDEX IF NOT EXISTS idx_teams_tournament ON teams (tournament_id, name)',
+        'CREATE INDEX IF NOT EXISTS idx_matches_tournament_round '
+        'ON matches (tournament_id, round_number, court_number)',
+        'CREATE INDEX IF NOT EXISTS idx_matches_pair ON matches (tournament_id, team1_id, team2_id)',
+        'CREATE INDEX IF NOT EXISTS idx_matches_team1 ON matches (team1_id)',
+        'CREATE INDEX IF NOT EXISTS idx_matches_team2 ON matches (team2_id)',
+    ]),
+    # Méthode d'appariement choisie à la création du tournoi
+    (2, [
+        "ALTER TABLE tournaments ADD COLUMN pairing TEXT NOT NULL DEFAULT 'adjacent'",
+    ]),
+    # Marqueur des matchs BYE (auparavant reconnus à team1_id = team2_id), indexé
+    # pour charger l'historique des BYE d'un tournoi sans parcourir ses matchs
+    (3, [
+        'ALTER TABLE matches ADD COLUMN is_bye INTEGER NOT NULL DEFAULT 0',
+        'UPDATE matches SET is_bye = 1 WHERE team1_id = team2_id',
+        'CREATE INDEX IF NOT EXISTS idx_matches_bye ON matches (tournament_id, team1_id) '
+        'WHERE is_bye = 1',
+    ]),
+    # Planning quadrette calculé au premier tour (QuadretteSchedule.to_json)
+    (4, [
+        '''CREATE TABLE IF NOT EXISTS quadrette_schedules (
+            tournament_id TEXT PRIMARY KEY,
+            schedule TEXT NOT NULL,
+            FOREIGN KEY (tournament_id) REFERENCES tournaments (id)
+        )''',
+    ]),
+    # Versions des données incrémentées dans chaque transaction d'écriture : les caches
+    # d'un processus voient ainsi les écritures d'un autre (interface et API sur le même fichier)
+    (5, [
+        'ALTER TABLE tournaments ADD COLUMN data_version INTEGER NOT NULL DEFAULT 0',
+        'CREATE TABLE IF NOT EXISTS catalog_version (version INTEGER NOT NULL)',
+        'INSERT INTO catalog_version (version) VALUES (0)',
+    ]),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+# Colonnes autorisées pour le tri des listes paginées
+TEAM_SORT_COLUMNS = ('name', 'wins', 'losses', 'points_for', 'points_against')
+MATCH_SORT_COLUMNS = ('court_number', 'team1_name', 'team2_name',
+                      'team1_score', 'team2_score', 'status')
+
+
+def _result_contributions(team1_id: str, team2_id: str,
+                          team1_score: int, team2_score: int) -> List[Tuple]:
+    """Statistiques apportées par un match terminé : (victoires, défaites, pour, contre, équipe)
+
+    Un match BYE (équipe contre elle-même) ne compte qu'une fois.
+    """
+    contributions = [(int(team1_score > team2_score), int(team1_score < team2_score),
+                      team1_score, team2_score, team1_id)]
+    if team2_id != team1_id:
+        contributions.append((int(team2_score > team1_score), int(team2_score < team1_score),
+                              team2_score, team1_score, team2_id))
+    return contributions
+
+
+class _ConnectionLease:
+    """Connexion attribuée à un thread, rendue au pool à la fin du thread"""
+
+    def __init__(self, pool: 'ConnectionPool', conn: sqlite3.Connection):
+        self.pool = pool
+        self.conn = conn
+        self.trace = None  # trace_callback installé sur la connexion
+
+    def release(self):
+        conn, self.conn = self.conn, None
+        if conn is not None:
+            if self.trace is not None:
+                conn.set_trace_callback(None)
+            self.pool._give_back(conn)
+
+    def __del__(self):
+        # Appelé lorsque le stockage local du thread est détruit (fin du thread)
+        self.release()
+
+
+class ConnectionPool:
+    """Pool de connexions SQLite : une connexion persistante par thread.
+
+    Le nombre total de connexions ouvertes est borné par ``max_connections`` ;
+    les connexions des threads terminés (ou libérées via ``release``) sont
+    réutilisées par les threads suivants.
+    """
+
+    def __init__(self, db_path: str, max_connections: int = 8,
+                 pragmas: Optional[Dict] = None, timeout: float = 30.0):
+        self.db_path = db_path
+        self.max_connections = max_connections
+        self.pragmas = dict(DEFAULT_PRAGMAS)
+        if pragmas:
+            self.pragmas.update(pragmas)
+        self.timeout = timeout
+        self._local = threading.local()
+        self._idle: List[sqlite3.Connection] = []
+        self._open_count = 0
+        self._cond = threading.Condition()
+        self.connections_opened = 0
+        self._trace: Optional[Callable[[str], None]] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Ouvre une nouvelle connexion configurée"""
+        conn = sqlite3.connect(
+            self.db_path,
+            uri=self.db_path.startswith("file:"),
+            check_same_thread=False
+        )
+        conn.row_factory = sqlite3.Row
+        for name, value in self.pragmas.items():
+            conn.execute(f"PRAGMA {name} = {value}")
+        self.connections_opened += 1
+        return conn
+
+    def set_trace_callback(self, callback: Optional[Callable[[str], None]]):
+        """Installe callback sur chaque connexion à sa prochaine utilisation (None le retire)"""
+        self._trace = callback
+
+    def _apply_trace(self, lease: _ConnectionLease):
+        lease.conn.set_trace_callback(self._trace)
+        lease.trace = self._trace
+
+    def acquire(self) -> sqlite3.Connection:
+        """Retourne la connexion du thread courant (ouverte au besoin)"""
+        lease = getattr(self._local, 'lease', None)
+        if lease is not None:
+            if lease.trace is not self._trace:
+                self._apply_trace(lease)
+            return lease.conn
+
+        with self._cond:
+            while not self._idle and self._open_count >= self.max_connections:
+                if not self._cond.wait(self.timeout):
+                    raise sqlite3.OperationalError("Pool de connexions épuisé")
+            if self._idle:
+                conn = self._idle.pop()
+            else:
+                conn = None
+                self._open_count += 1
+
+        if conn is None:
+            try:
+                conn = self._connect()
+            except Exception:
+                with self._cond:
+                    self._open_count -= 1
+                    self._cond.notify()
+                raise
+
+        lease = self._local.lease = _ConnectionLease(self, conn)
+        if self._trace is not None:
+            self._apply_trace(lease)
+        return conn
+
+    def release(self):
+        """Rend la connexion du thread courant au pool"""
+        lease = getattr(self._local, 'lease', None)
+        if lease is not None:
+            del self._local.lease
+            lease.release()
+
+    def _give_back(self, conn: sqlite3.Connection):
+        if conn.in_transaction:
+            conn.rollback()
+        with self._cond:
+            self._idle.append(conn)
+            self._cond.notify()
+
+    def close(self):
+        """Ferme les connexions inactives et celle du thread courant"""
+        self.release()
+        with self._cond:
+            idle, self._idle = self._idle, []
+            self._open_count -= len(idle)
+        for conn in idle:
+            conn.close()
+
+
+class HeadToHeadIndex:
+    """Historique en mémoire des rencontres d'un tournoi.
+
+    Associe chaque paire d'équipes (clé ``frozenset``) au nombre de fois où
+    elles se sont affrontées ; les matchs BYE (équipe contre elle-même) sont ignorés.
+    """
+
+    def __init__(self, pairs=()):
+        self._counts: Dict[frozenset, int] = {}
+        self._opponents: Dict[str, set] = {}
+        for team1_id, team2_id in pairs:
+            self.add(team1_id, team2_id)
+
+    def add(self, team1_id: str, team2_id: str):
+        """Enregistre une rencontre entre deux équipes"""
+        if team1_id == team2_id:
+            return
+        key = frozenset((team1_id, team2_id))
+        self._counts[key] = self._counts.get(key, 0) + 1
+        self._opponents.setdefault(team1_id, set()).add(team2_id)
+        self._opponents.setdefault(team2_id, set()).add(team1_id)
+
+    def remove(self, team1_id: str, team2_id: str):
+        """Retire une rencontre (suppression d'un match)"""
+        key = frozenset((team1_id, team2_id))
+        count = self._counts.get(key, 0)
+        if team1_id == team2_id or count == 0:
+            return
+        if count > 1:
+            self._counts[key] = count - 1
+            return
+        del self._counts[key]
+        self._opponents[team1_id].discard(team2_id)
+        self._opponents[team2_id].discard(team1_id)
+
+    def remove_team(self, team_id: str):
+        """Retire une équipe et toutes ses rencontres"""
+        for opponent_id in self._opponents.pop(team_id, set()):
+            self._counts.pop(frozenset((team_id, opponent_id)), None)
+            self._opponents[opponent_id].discard(team_id)
+
+    def have_played(self, team1_id: str, team2_id: str) -> bool:
+        """Indique si deux équipes se sont déjà rencontrées"""
+        return frozenset((team1_id, team2_id)) in self._counts
+
+    def opponents(self, team_id: str) -> set:
+        """Retourne l'ensemble des adversaires déjà rencontrés par une équipe"""
+        return self._opponents.get(team_id, set())
+
+
+class ByeLedger:
+    """Historique en mémoire des BYE d'un tournoi : nombre de BYE reçus par équipe"""
+
+    def __init__(self, team_ids=()):
+        self._counts: Dict[str, int] = {}
+        for team_id in team_ids:
+            self.add(team_id)
+
+    def add(self, team_id: str):
+        """Enregistre un BYE attribué à une équipe"""
+        self._counts[team_id] = self._counts.get(team_id, 0) + 1
+
+    def remove(self, team_id: str):
+        """Retire un BYE (suppression du match)"""
+        count = self._counts.get(team_id, 0)
+        if count > 1:
+            self._counts[team_id] = count - 1
+        elif count:
+            del self._counts[team_id]
+
+    def remove_team(self, team_id: str):
+        """Retire une équipe de l'historique"""
+        self._counts.pop(team_id, None)
+
+    def count(self, team_id: str) -> int:
+        """Nombre de BYE déjà reçus par une équipe"""
+        return self._counts.get(team_id, 0)
+
+    def total(self) -> int:
+        """Nombre de BYE attribués dans le tournoi"""
+        return sum(self._counts.values())
+
 
 class DatabaseManager:
     """Gestionnaire de base de données SQLite pour Pétanque Manager"""
 
-    def __init__(self, db_path: str = "petanque_manager.db"):
+    def __init__(self, db_path: str = "petanque_manager.db", max_connections: int = 8,
+                 pragmas: Optional[Dict] = None):
         self.db_path = db_path
+        # max_connections = 0 désactive le pool (une connexion par appel)
+        self.pool = ConnectionPool(db_path, max_connections, pragmas) if max_connections > 0 else None
+        # Historiques des rencontres et classements chargés à la demande, par tournoi
+        self._head_to_head: Dict[str, HeadToHeadIndex] = {}
+        self._byes: Dict[str, ByeLedger] = {}
+        self._quadrette: Dict[str, QuadretteSchedule] = {}
+        self._standings: Dict[str, StandingsIndex] = {}
+        # Liste de sélection des tournois (id -> résumé), du plus récent au plus ancien
+        self._catalog: Optional[Dict[str, Dict]] = None
+        # Versions persistées auxquelles correspondent les caches chargés : un écart
+        # (écriture d'un autre processus) les fait recharger
+        self._cache_versions: Dict[str, int] = {}
+        self._catalog_version: Optional[int] = None
+        # Tenu pendant le chargement des caches et pendant toute écriture qui les met à
+        # jour (validation comprise) : un cache chargé depuis des lignes déjà validées
+        # ne reçoit pas une seconde fois la modification
+        self._cache_lock = threading.RLock()
+        # Notifications publiées après chaque modification validée
+        self.events = EventBus()
+        # Mesures des appels et requêtes, inactives par défaut (voir enable_instrumentation)
+        self._instrumentation: Optional[Instrumentation] = None
+        self._connections_opened = 0
         self.init_database()
+        if os.environ.get('PETANQUE_DB_STATS'):
+            self.enable_instrumentation()
 
     def get_connection(self):
-        """Retourne une connexion à la base de données"""
+        """Retourne la connexion persistante du thread courant"""
+        if self.pool is not None:
+            return self.pool.acquire()
         conn = sqlite3.connect(
             self.db_path,
             uri=self.db_path.startswith("file:")
         )
         conn.row_factory = sqlite3.Row
+        self._connections_opened += 1
+        if self._instrumentation is not None:
+            conn.set_trace_callback(self._instrumentation.trace)
         return conn
 
+    def release_connection(self):
+        """Rend la connexion du thread courant au pool (threads de travail)"""
+        if self.pool is not None:
+            self.pool.release()
+
+    def close(self):
+        """Ferme les connexions ouvertes par ce gestionnaire"""
+        if self.pool is not None:
+            self.pool.close()
+
+    # Instrumentation
+    def enable_instrumentation(self):
+        """Mesure les appels de méthodes et les requêtes jusqu'à disable_instrumentation
+
+        Les méthodes publiques sont remplacées, sur cette instance seulement,
+        par des versions mesurées : désactivée, l'instrumentation ne coûte rien.
+        """
+        if self._instrumentation is not None:
+            return
+        instrumentation = Instrumentation()
+        for name in instrumented_methods(DatabaseManager):
+            setattr(self, name, instrumentation.wrap(name, getattr(DatabaseManager, name)
+                                                     .__get__(self)))
+        self._instrumentation = instrumentation
+        if self.pool is not None:
+            self.pool.set_trace_callback(instrumentation.trace)
+
+    def disable_instrumentation(self):
+        """Retire les mesures ; les statistiques collectées sont perdues"""
+        if self._instrumentation is None:
+            return
+        for name in instrumented_methods(DatabaseManager):
+            self.__dict__.pop(name, None)
+        self._instrumentation = None
+        if self.pool is not None:
+            self.pool.set_trace_callback(None)
+
+    def stats(self) -> Dict:
+        """Statistiques d'utilisation : connexions, et mesures si l'instrumentation est active"""
+        if self.pool is not None:
+            connections = {'max': self.pool.max_connections, 'open': self.pool._open_count,
+                           'idle': len(self.pool._idle), 'opened': self.pool.connections_opened}
+        else:
+            connections = {'opened': self._connections_opened}
+        stats = {'enabled': self._instrumentation is not None, 'connections': connections}
+        if self._instrumentation is not None:
+            stats.update(self._instrumentation.snapshot())
+        return stats
+
+    def dump_stats(self, path: str):
+        """Écrit stats() dans un fichier JSON"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.stats(), f, indent=2, ensure_ascii=False)
+
+    def get_data_version(self, tournament_id: str) -> Optional[str]:
+        """Version des données d'un tournoi (clés de cache et ETag du serveur), None s'il n'existe pas
+
+        Lue dans la base (tournaments.data_version), elle change à chaque
+        écriture validée, quel que soit le processus qui l'a faite.
+        """
+        with self.get_connection() as conn:
+            row = conn.execute('SELECT data_version FROM tournaments WHERE id = ?',
+                               (tournament_id,)).fetchone()
+        return str(row[0]) if row else None
+
     def init_database(self):
         """Initialise la base de données et crée les tables"""
         with self.get_connection() as conn:
@@ -81,17 +460,120 @@ class DatabaseManager:
 
             conn.commit()
 
+        self.migrate()
+
+    def get_schema_version(self) -> int:
+        """Retourne la version du schéma (PRAGMA user_version)"""
+        conn = self.get_connection()
+        return conn.execute('PRAGMA user_version').fetchone()[0]
+
+    def migrate(self):
+        """Applique les migrations manquantes, chacune dans sa propre transaction"""
+        conn = self.get_connection()
+        current = self.get_schema_version()
+        for version, statements in MIGRATIONS:
+            if version <= current:
+                continue
+            try:
+                # Verrou d'écriture pris avant de relire la version : un autre processus
+                # a pu appliquer la migration depuis la première lecture
+                conn.execute('BEGIN IMMEDIATE')
+                current = conn.execute('PRAGMA user_version').fetchone()[0]
+                if version > current:
+                    for statement in statements:
+                        conn.execute(statement)
+                    conn.execute(f'PRAGMA user_version = {int(version)}')
+                    current = version
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+    # Versions des données (verrou des caches tenu)
+    def _bump_data_version(self, cursor: sqlite3.Cursor, tournament_id: str) -> Optional[int]:
+        """Incrémente la version d'un tournoi dans la transaction en cours ; retourne la nouvelle"""
+        cursor.execute('UPDATE tournaments SET data_version = data_version + 1 WHERE id = ?',
+                       (tournament_id,))
+        row = cursor.execute('SELECT data_version FROM tournaments WHERE id = ?',
+                             (tournament_id,)).fetchone()
+        return row[0] if row else None
+
+    def _bump_team_tournament(self, cursor: sqlite3.Cursor,
+                              team_id: str) -> Optional[Tuple[str, int]]:
+        """Incrémente la version du tournoi d'une équipe ; retourne (tournoi, version),
+        à passer à _caches_follow une fois la transaction validée"""
+        row = cursor.execute('SELECT tournament_id FROM teams WHERE id = ?', (team_id,)).fetchone()
+        if row is None:
+            return None
+        return row[0], self._bump_data_version(cursor, row[0])
+
+    def _bump_match_tournament(self, cursor: sqlite3.Cursor,
+                               match_id: str) -> Optional[Tuple[str, int]]:
+        """Comme _bump_team_tournament, pour le tournoi d'un match"""
+        row = cursor.execute('SELECT tournament_id FROM matches WHERE id = ?',
+                             (match_id,)).fetchone()
+        if row is None:
+            return None
+        return row[0], self._bump_data_version(cursor, row[0])
+
+    def _bump_catalog_version(self, cursor: sqlite3.Cursor) -> int:
+        """Incrémente la version de la liste des tournois dans la transaction en cours"""
+        cursor.execute('UPDATE catalog_version SET version = version + 1')
+        return cursor.execute('SELECT version FROM catalog_version').fetchone()[0]
+
+    def _caches_follow(self, tournament_id: str, version: Optional[int]) -> bool:
+        """Après une écriture validée en version ``version`` : True si les caches du tournoi
+        étaient à jour et doivent recevoir la modification, sinon ils sont abandonnés"""
+        if version is not None and self._cache_versions.get(tournament_id) == version - 1:
+            self._cache_versions[tournament_id] = version
+            return True
+        self._drop_caches(tournament_id)
+        return False
+
+    def _catalog_follows(self, version: int) -> bool:
+        """Comme _caches_follow, pour la liste des tournois"""
+        if self._catalog is not None and self._catalog_version == version - 1:
+            self._catalog_version = version
+            return True
+        self._catalog = None
+        return False
+
+    def _check_caches(self, tournament_id: str):
+        """Abandonne les caches d'un tournoi modifié depuis leur chargement (autre processus)"""
+        with self.get_connection() as conn:
+            row = conn.execute('SELECT data_version FROM tournaments WHERE id = ?',
+                               (tournament_id,)).fetchone()
+        version = row[0] if row else None
+        if version is None or self._cache_versions.get(tournament_id) != version:
+            self._drop_caches(tournament_id)
+            if version is not None:
+                self._cache_versions[tournament_id] = version
+
+    def _drop_caches(self, tournament_id: str):
+        self._cache_versions.pop(tournament_id, None)
+        self._head_to_head.pop(tournament_id, None)
+        self._byes.pop(tournament_id, None)
+        self._quadrette.pop(tournament_id, None)
+        self._standings.pop(tournament_id, None)
+
     # CRUD pour Tournois
-    def create_tournament(self, name: str, tournament_type: str, num_courts: int) -> str:
+    def create_tournament(self, name: str, tournament_type: str, num_courts: int,
+                          pairing: str = 'adjacent') -> str:
         """Crée un nouveau tournoi"""
         tournament_id = str(uuid.uuid4())
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT INTO tournaments (id, name, type, num_courts)
-                VALUES (?, ?, ?, ?)
-            ''', (tournament_id, name, tournament_type, num_courts))
-            conn.commit()
+        with self._cache_lock:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    INSERT INTO tournaments (id, name, type, num_courts, pairing)
+                    VALUES (?, ?, ?, ?, ?)
+                ''', (tournament_id, name, tournament_type, num_courts, pairing))
+                catalog_version = self._bump_catalog_version(cursor)
+                conn.commit()
+            if self._catalog_follows(catalog_version):
+                summary = {'id': tournament_id, 'name': name, 'type': tournament_type}
+                self._catalog = {tournament_id: summary, **self._catalog}
+        self.events.emit(events.TOURNAMENT_CREATED, tournament_id, (tournament_id,))
         return tournament_id
 
     def get_tournament(self, tournament_id: str) -> Optional[Dict]:
@@ -110,6 +592,28 @@ class DatabaseManager:
             rows = cursor.fetchall()
             return [dict(row) for row in rows]
 
+    def get_tournament_summaries(self) -> List[Dict]:
+        """Récupère l'identifiant, le nom et le type de tous les tournois (liste de sélection)"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT id, name, type FROM tournaments ORDER BY created_at DESC')
+            return [dict(row) for row in cursor.fetchall()]
+
+    def get_tournament_catalog(self) -> List[Dict]:
+        """Liste de sélection des tournois, servie depuis la mémoire
+
+        Chargée au premier appel puis tenue à jour par la création, la
+        modification et la suppression des tournois ; rechargée si un autre
+        processus a modifié la liste depuis.
+        """
+        with self._cache_lock:
+            with self.get_connection() as conn:
+                version = conn.execute('SELECT version FROM catalog_version').fetchone()[0]
+            if self._catalog is None or self._catalog_version != version:
+                self._catalog_version = version
+                self._catalog = {row['id']: row for row in self.get_tournament_summaries()}
+            return [dict(row) for row in self._catalog.values()]
+
     def update_tournament(self, tournament_id: str, **kwargs):
         """Met à jour un tournoi"""
         if not kwargs:
@@ -118,23 +622,40 @@ class DatabaseManager:
         set_clause = ', '.join([f"{key} = ?" for key in kwargs.keys()])
         values = list(kwargs.values()) + [tournament_id]
 
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(f'''
-                UPDATE tournaments
-                SET {set_clause}, updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-            ''', values)
-            conn.commit()
+        with self._cache_lock:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(f'''
+                    UPDATE tournaments
+                    SET {set_clause}, updated_at = CURRENT_TIMESTAMP
+                    WHERE id = ?
+                ''', values)
+                version = self._bump_data_version(cursor, tournament_id)
+                catalog_version = self._bump_catalog_version(cursor)
+                conn.commit()
+            self._caches_follow(tournament_id, version)
+            if self._catalog_follows(catalog_version):
+                summary = self._catalog.get(tournament_id)
+                if summary is not None:
+                    summary.update((key, kwargs[key]) for key in ('name', 'type') if key in kwargs)
+        self.events.emit(events.TOURNAMENT_UPDATED, tournament_id, (tournament_id,))
 
     def delete_tournament(self, tournament_id: str):
         """Supprime un tournoi et toutes les données associées"""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('DELETE FROM matches WHERE tournament_id = ?', (tournament_id,))
-            cursor.execute('DELETE FROM teams WHERE tournament_id = ?', (tournament_id,))
-            cursor.execute('DELETE FROM tournaments WHERE id = ?', (tournament_id,))
-            conn.commit()
+        with self._cache_lock:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('DELETE FROM matches WHERE tournament_id = ?', (tournament_id,))
+                cursor.execute('DELETE FROM quadrette_schedules WHERE tournament_id = ?',
+                               (tournament_id,))
+                cursor.execute('DELETE FROM teams WHERE tournament_id = ?', (tournament_id,))
+                cursor.execute('DELETE FROM tournaments WHERE id = ?', (tournament_id,))
+                catalog_version = self._bump_catalog_version(cursor)
+                conn.commit()
+            self._drop_caches(tournament_id)
+            if self._catalog_follows(catalog_version):
+                self._catalog.pop(tournament_id, None)
+        self.events.emit(events.TOURNAMENT_DELETED, tournament_id, (tournament_id,))
 
     # CRUD pour Équipes
     def create_team(self, tournament_id: str, name: str, players: List[str]) -> str:
@@ -142,15 +663,41 @@ class DatabaseManager:
         team_id = str(uuid.uuid4())
         players_json = json.dumps(players)
 
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT INTO teams (id, tournament_id, name, players)
-                VALUES (?, ?, ?, ?)
-            ''', (team_id, tournament_id, name, players_json))
-            conn.commit()
+        with self._cache_lock:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    INSERT INTO teams (id, tournament_id, name, players)
+                    VALUES (?, ?, ?, ?)
+                ''', (team_id, tournament_id, name, players_json))
+                version = self._bump_data_version(cursor, tournament_id)
+                conn.commit()
+            standings = self._standings.get(tournament_id)
+            if self._caches_follow(tournament_id, version) and standings is not None:
+                standings.add_team({'id': team_id, 'name': name})
+        self.events.emit(events.TEAM_CREATED, tournament_id, (team_id,))
         return team_id
 
+    def create_teams_bulk(self, tournament_id: str,
+                          teams: List[Tuple[str, List[str]]]) -> List[str]:
+        """Crée plusieurs équipes ``(nom, joueurs)`` en une seule transaction"""
+        team_ids = [str(uuid.uuid4()) for _ in teams]
+        with self._cache_lock:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.executemany('''
+                    INSERT INTO teams (id, tournament_id, name, players)
+                    VALUES (?, ?, ?, ?)
+                ''', [(team_id, tournament_id, name, json.dumps(players))
+                      for team_id, (name, players) in zip(team_ids, teams)])
+                version = self._bump_data_version(cursor, tournament_id)
+            standings = self._standings.get(tournament_id)
+            if self._caches_follow(tournament_id, version) and standings is not None:
+                for team_id, (name, _) in zip(team_ids, teams):
+                    standings.add_team({'id': team_id, 'name': name})
+        self.events.emit(events.TEAM_CREATED, tournament_id, team_ids)
+        return team_ids
+
     def get_teams_by_tournament(self, tournament_id: str) -> List[Dict]:
         """Récupère toutes les équipes d'un tournoi"""
         with self.get_connection() as conn:
@@ -169,6 +716,33 @@ class DatabaseManager:
                 teams.append(team)
             return teams
 
+    def count_teams(self, tournament_id: str) -> int:
+        """Nombre d'équipes d'un tournoi"""
+        with self.get_connection() as conn:
+            return conn.execute('SELECT COUNT(*) FROM teams WHERE tournament_id = ?',
+                                (tournament_id,)).fetchone()[0]
+
+    def get_teams_page(self, tournament_id: str, offset: int, limit: int,
+                       order_by: str = 'name', descending: bool = False) -> List[Dict]:
+        """Récupère une page des équipes d'un tournoi, triée côté base"""
+        if order_by not in TEAM_SORT_COLUMNS:
+            raise ValueError(f"Tri impossible sur la colonne: {order_by}")
+        direction = 'DESC' if descending else 'ASC'
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f'''
+                SELECT * FROM teams
+                WHERE tournament_id = ?
+                ORDER BY {order_by} {direction}, id
+                LIMIT ? OFFSET ?
+            ''', (tournament_id, limit, offset))
+            teams = []
+            for row in cursor.fetchall():
+                team = dict(row)
+                team['players'] = json.loads(team['players']) if team['players'] else []
+                teams.append(team)
+            return teams
+
     def update_team_stats(
         self,
         team_id: str,
@@ -192,12 +766,17 @@ class DatabaseManager:
             set_clause = ', '.join([f"{key} = ?" for key in updates.keys()])
             values = list(updates.values()) + [team_id]
 
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(f'''
-                    UPDATE teams SET {set_clause} WHERE id = ?
-                ''', values)
-                conn.commit()
+            with self._cache_lock:
+                with self.get_connection() as conn:
+                    cursor = conn.cursor()
+                    cursor.execute(f'''
+                        UPDATE teams SET {set_clause} WHERE id = ?
+                    ''', values)
+                    bumped = self._bump_team_tournament(cursor, team_id)
+                    conn.commit()
+                if bumped and self._caches_follow(*bumped):
+                    self._update_standings(team_id, **updates)
+            self.events.emit(events.TEAM_UPDATED, None, (team_id,))
 
     def update_team(
         self,
@@ -218,24 +797,40 @@ class DatabaseManager:
         set_clause = ', '.join([f"{key} = ?" for key in updates.keys()])
         values = list(updates.values()) + [team_id]
 
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                f"UPDATE teams SET {set_clause} WHERE id = ?",
-                values
-            )
-            conn.commit()
+        with self._cache_lock:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    f"UPDATE teams SET {set_clause} WHERE id = ?",
+                    values
+                )
+                bumped = self._bump_team_tournament(cursor, team_id)
+                conn.commit()
+            if bumped and self._caches_follow(*bumped) and name is not None:
+                self._update_standings(team_id, name=name)
+        self.events.emit(events.TEAM_UPDATED, None, (team_id,))
 
     def delete_team(self, team_id: str):
         """Supprime une équipe et ses matchs associés"""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                'DELETE FROM matches WHERE team1_id = ? OR team2_id = ?',
-                (team_id, team_id)
-            )
-            cursor.execute('DELETE FROM teams WHERE id = ?', (team_id,))
-            conn.commit()
+        with self._cache_lock:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT tournament_id FROM teams WHERE id = ?', (team_id,))
+                row = cursor.fetchone()
+                cursor.execute(
+                    'DELETE FROM matches WHERE team1_id = ? OR team2_id = ?',
+                    (team_id, team_id)
+                )
+                cursor.execute('DELETE FROM teams WHERE id = ?', (team_id,))
+                version = self._bump_data_version(cursor, row['tournament_id']) if row else None
+                conn.commit()
+            if row and self._caches_follow(row['tournament_id'], version):
+                tournament_id = row['tournament_id']
+                for cache in (self._head_to_head, self._byes, self._standings):
+                    if tournament_id in cache:
+                        cache[tournament_id].remove_team(team_id)
+        if row:
+            self.events.emit(events.TEAM_DELETED, row['tournament_id'], (team_id,))
 
     # CRUD pour Matchs
     def create_match(
@@ -249,15 +844,89 @@ class DatabaseManager:
         """Crée un nouveau match"""
         match_id = str(uuid.uuid4())
 
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT INTO matches (id, tournament_id, round_number, team1_id, team2_id, court_number)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (match_id, tournament_id, round_number, team1_id, team2_id, court_number))
-            conn.commit()
+        with self._cache_lock:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    INSERT INTO matches (id, tournament_id, round_number, team1_id, team2_id, court_number)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', (match_id, tournament_id, round_number, team1_id, team2_id, court_number))
+                version = self._bump_data_version(cursor, tournament_id)
+                conn.commit()
+            if self._caches_follow(tournament_id, version):
+                self._record_pairings(tournament_id, [(team1_id, team2_id)])
+        self.events.emit(events.ROUND_CREATED, tournament_id, (match_id,))
         return match_id
 
+    def create_matches_bulk(
+        self,
+        tournament_id: str,
+        round_number: int,
+        pairings: List[Tuple]
+    ) -> List[str]:
+        """Crée tous les matchs d'un tour et avance le tour actuel en une transaction
+
+        Chaque appariement est un tuple ``(team1_id, team2_id, court_number)``,
+        éventuellement suivi de ``(team1_score, team2_score)`` pour un match déjà
+        joué : le match est alors terminé et les statistiques mises à jour. Un
+        tel match d'une équipe contre elle-même est un BYE (``is_bye``).
+        """
+        match_ids = [str(uuid.uuid4()) for _ in pairings]
+        pending = []
+        finished = []
+        stats = []
+        for match_id, pairing in zip(match_ids, pairings):
+            team1_id, team2_id, court_number = pairing[:3]
+            if len(pairing) > 3:
+                team1_score, team2_score = pairing[3:5]
+                finished.append((match_id, tournament_id, round_number, team1_id, team2_id,
+                                 court_number, team1_score, team2_score,
+                                 int(team1_id == team2_id)))
+                stats.extend(_result_contributions(team1_id, team2_id, team1_score, team2_score))
+            else:
+                pending.append((match_id, tournament_id, round_number,
+                                team1_id, team2_id, court_number))
+
+        with self._cache_lock:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.executemany('''
+                    INSERT INTO matches (id, tournament_id, round_number, team1_id, team2_id, court_number)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', pending)
+                cursor.executemany('''
+                    INSERT INTO matches (id, tournament_id, round_number, team1_id, team2_id,
+                                         court_number, team1_score, team2_score, status, is_bye)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'finished', ?)
+                ''', finished)
+                cursor.executemany('''
+                    UPDATE teams
+                    SET wins = wins + ?, losses = losses + ?,
+                        points_for = points_for + ?, points_against = points_against + ?
+                    WHERE id = ?
+                ''', stats)
+                cursor.execute('''
+                    UPDATE tournaments
+                    SET current_round = ?, updated_at = CURRENT_TIMESTAMP
+                    WHERE id = ?
+                ''', (round_number, tournament_id))
+                version = self._bump_data_version(cursor, tournament_id)
+            if self._caches_follow(tournament_id, version):
+                self._record_pairings(tournament_id, [pairing[:2] for pairing in pairings])
+                ledger = self._byes.get(tournament_id)
+                if ledger is not None:
+                    for row in finished:
+                        if row[-1]:
+                            ledger.add(row[3])
+                standings = self._standings.get(tournament_id)
+                if standings is not None:
+                    for wins, losses, points_for, points_against, team_id in stats:
+                        standings.apply_delta(team_id, wins, losses, points_for, points_against)
+        self.events.emit(events.ROUND_CREATED, tournament_id, match_ids)
+        if stats:
+            self.events.emit(events.TEAM_UPDATED, tournament_id, [entry[-1] for entry in stats])
+        return match_ids
+
     def get_matches_by_tournament_round(self, tournament_id: str, round_number: int) -> List[Dict]:
         """Récupère tous les matchs d'un tournoi pour un tour donné"""
         with self.get_connection() as conn:
@@ -274,36 +943,338 @@ class DatabaseManager:
             rows = cursor.fetchall()
             return [dict(row) for row in rows]
 
-    def update_match_score(self, match_id: str, team1_score: int, team2_score: int):
-        """Met à jour le score d'un match"""
+    def get_matches_by_ids(self, match_ids: List[str]) -> List[Dict]:
+        """Récupère des matchs par identifiant (avec le nom des équipes), en une requête"""
+        match_ids = list(match_ids)
+        if not match_ids:
+            return []
+        placeholders = ', '.join('?' * len(match_ids))
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute('''
-                UPDATE matches
-                SET team1_score = ?, team2_score = ?, status = 'finished'
-                WHERE id = ?
-            ''', (team1_score, team2_score, match_id))
-            conn.commit()
+            cursor.execute(f'''
+                SELECT m.*,
+                       t1.name as team1_name, t2.name as team2_name
+                FROM matches m
+                JOIN teams t1 ON m.team1_id = t1.id
+                JOIN teams t2 ON m.team2_id = t2.id
+                WHERE m.id IN ({placeholders})
+            ''', match_ids)
+            return [dict(row) for row in cursor.fetchall()]
 
-    def update_match_court(self, match_id: str, court_number: int):
-        """Met à jour le numéro de terrain d'un match"""
+    def count_matches(self, tournament_id: str, round_number: int) -> int:
+        """Nombre de matchs d'un tour"""
+        with self.get_connection() as conn:
+            return conn.execute(
+                'SELECT COUNT(*) FROM matches WHERE tournament_id = ? AND round_number = ?',
+                (tournament_id, round_number)
+            ).fetchone()[0]
+
+    def get_matches_page(self, tournament_id: str, round_number: int, offset: int, limit: int,
+                         order_by: str = 'court_number', descending: bool = False) -> List[Dict]:
+        """Récupère une page des matchs d'un tour, triée côté base"""
+        if order_by not in MATCH_SORT_COLUMNS:
+            raise ValueError(f"Tri impossible sur la colonne: {order_by}")
+        direction = 'DESC' if descending else 'ASC'
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                'UPDATE matches SET court_number = ? WHERE id = ?',
-                (court_number, match_id)
-            )
-            conn.commit()
+            cursor.execute(f'''
+                SELECT m.*,
+                       t1.name as team1_name, t2.name as team2_name
+                FROM matches m
+                JOIN teams t1 ON m.team1_id = t1.id
+                JOIN teams t2 ON m.team2_id = t2.id
+                WHERE m.tournament_id = ? AND m.round_number = ?
+                ORDER BY {order_by} {direction}, m.id
+                LIMIT ? OFFSET ?
+            ''', (tournament_id, round_number, limit, offset))
+            return [dict(row) for row in cursor.fetchall()]
+
+    def update_match_score(self, match_id: str, team1_score: int, team2_score: int):
+        """Met à jour le score d'un match"""
+        with self._cache_lock:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    UPDATE matches
+                    SET team1_score = ?, team2_score = ?, status = 'finished'
+                    WHERE id = ?
+                ''', (team1_score, team2_score, match_id))
+                bumped = self._bump_match_tournament(cursor, match_id)
+                conn.commit()
+            if bumped:
+                self._caches_follow(*bumped)
+        self.events.emit(events.MATCH_SCORED, None, (match_id,))
+
+    def record_match_result(self, match_id: str, team1_score: int,
+                            team2_score: int) -> Optional[Dict]:
+        """Enregistre le résultat d'un match et ajuste les statistiques des équipes
+
+        Les statistiques reçoivent l'écart avec le score précédemment enregistré,
+        ce qui rend la correction d'un score idempotente. Retourne le match
+        (avant mise à jour) ou None s'il n'existe pas.
+        """
+        return self.record_match_results({match_id: (team1_score, team2_score)}).get(match_id)
+
+    def record_match_results(self, results: Dict[str, Tuple[int, int]]) -> Dict[str, Dict]:
+        """Enregistre plusieurs résultats ``{match_id: (score1, score2)}`` en une transaction
+
+        Retourne les matchs trouvés (état avant mise à jour), indexés par identifiant.
+        Lève ValueError, sans rien enregistrer, pour un score non entier ou un BYE.
+        """
+        for match_id, scores in results.items():
+            if len(scores) != 2 or any(isinstance(score, bool) or not isinstance(score, int)
+                                       for score in scores):
+                raise ValueError(f"Score invalide pour le match {match_id}: {scores}")
+        previous_by_id = {}
+        deltas: Dict[str, List[int]] = {}
+        with self._cache_lock:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                for match_id in results:
+                    cursor.execute('''
+                        SELECT id, tournament_id, team1_id, team2_id, team1_score, team2_score,
+                               status, is_bye
+                        FROM matches WHERE id = ?
+                    ''', (match_id,))
+                    row = cursor.fetchone()
+                    if not row:
+                        continue
+                    if row['is_bye']:
+                        raise ValueError(f"Le match {match_id} est un BYE")
+                    previous = dict(row)
+                    previous_by_id[match_id] = previous
+
+                    team1_score, team2_score = results[match_id]
+                    new = _result_contributions(previous['team1_id'], previous['team2_id'],
+                                                team1_score, team2_score)
+                    old = []
+                    if previous['status'] == 'finished':
+                        old = _result_contributions(previous['team1_id'], previous['team2_id'],
+                                                    previous['team1_score'], previous['team2_score'])
+                    for sign, contributions in ((1, new), (-1, old)):
+                        for *values, team_id in contributions:
+                            delta = deltas.setdefault(team_id, [0, 0, 0, 0])
+                            for i, value in enumerate(values):
+                                delta[i] += sign * value
+
+                cursor.executemany('''
+                    UPDATE matches
+                    SET team1_score = ?, team2_score = ?, status = 'finished'
+                    WHERE id = ?
+                ''', [(*results[match_id], match_id) for match_id in previous_by_id])
+                cursor.executemany('''
+                    UPDATE teams
+                    SET wins = wins + ?, losses = losses + ?,
+                        points_for = points_for + ?, points_against = points_against + ?
+                    WHERE id = ?
+                ''', [(*delta, team_id) for team_id, delta in deltas.items()])
+                versions = {previous['tournament_id']: None
+                            for previous in previous_by_id.values()}
+                for tournament_id in versions:
+                    versions[tournament_id] = self._bump_data_version(cursor, tournament_id)
+
+            following = {tournament_id for tournament_id, version in versions.items()
+                         if self._caches_follow(tournament_id, version)}
+            team_tournaments = {team_id: previous['tournament_id']
+                                for previous in previous_by_id.values()
+                                for team_id in (previous['team1_id'], previous['team2_id'])}
+            for team_id, delta in deltas.items():
+                standings = self._standings.get(team_tournaments[team_id])
+                if team_tournaments[team_id] in following and standings is not None:
+                    standings.apply_delta(team_id, *delta)
+
+        # Une notification par tournoi concerné
+        scored: Dict[str, List[str]] = {}
+        teams: Dict[str, set] = {}
+        for match_id, previous in previous_by_id.items():
+            tournament_id = previous['tournament_id']
+            scored.setdefault(tournament_id, []).append(match_id)
+            teams.setdefault(tournament_id, set()).update(
+                team_id for team_id in (previous['team1_id'], previous['team2_id'])
+                if any(deltas.get(team_id, ())))
+        for tournament_id, match_ids in scored.items():
+            self.events.emit(events.MATCH_SCORED, tournament_id, match_ids)
+            if teams[tournament_id]:
+                self.events.emit(events.TEAM_UPDATED, tournament_id, sorted(teams[tournament_id]))
+        return previous_by_id
+
+    def recompute_team_stats(self, tournament_id: str):
+        """Reconstruit les statistiques de toutes les équipes à partir des matchs terminés"""
+        with self._cache_lock:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    SELECT t.id,
+                           COALESCE(SUM(r.points_for > r.points_against), 0),
+                           COALESCE(SUM(r.points_for < r.points_against), 0),
+                           COALESCE(SUM(r.points_for), 0),
+                           COALESCE(SUM(r.points_against), 0)
+                    FROM teams t
+                    LEFT JOIN (
+                        SELECT team1_id AS team_id, team1_score AS points_for,
+                               team2_score AS points_against
+                        FROM matches WHERE tournament_id = ? AND status = 'finished'
+                        UNION ALL
+                        SELECT team2_id, team2_score, team1_score
+                        FROM matches
+                        WHERE tournament_id = ? AND status = 'finished' AND team2_id != team1_id
+                    ) r ON r.team_id = t.id
+                    WHERE t.tournament_id = ?
+                    GROUP BY t.id
+                ''', (tournament_id, tournament_id, tournament_id))
+                rows = [(*row[1:], row[0]) for row in cursor.fetchall()]
+                cursor.executemany('''
+                    UPDATE teams
+                    SET wins = ?, losses = ?, points_for = ?, points_against = ?
+                    WHERE id = ?
+                ''', rows)
+                version = self._bump_data_version(cursor, tournament_id)
+
+            self._caches_follow(tournament_id, version)
+            self._standings.pop(tournament_id, None)
+        self.events.emit(events.TEAM_UPDATED, tournament_id, [row[-1] for row in rows])
+
+    def update_match_court(self, match_id: str, court_number: int):
+        """Met à jour le numéro de terrain d'un match"""
+        with self._cache_lock:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    'UPDATE matches SET court_number = ? WHERE id = ?',
+                    (court_number, match_id)
+                )
+                bumped = self._bump_match_tournament(cursor, match_id)
+                conn.commit()
+            if bumped:
+                self._caches_follow(*bumped)
+        self.events.emit(events.MATCH_UPDATED, None, (match_id,))
 
     def delete_match(self, match_id: str):
         """Supprime un match"""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('DELETE FROM matches WHERE id = ?', (match_id,))
-            conn.commit()
+        with self._cache_lock:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    'SELECT tournament_id, team1_id, team2_id, is_bye FROM matches WHERE id = ?',
+                    (match_id,)
+                )
+                row = cursor.fetchone()
+                cursor.execute('DELETE FROM matches WHERE id = ?', (match_id,))
+                version = self._bump_data_version(cursor, row['tournament_id']) if row else None
+                conn.commit()
+            if row and self._caches_follow(row['tournament_id'], version):
+                index = self._head_to_head.get(row['tournament_id'])
+                if index is not None:
+                    index.remove(row['team1_id'], row['team2_id'])
+                ledger = self._byes.get(row['tournament_id'])
+                if ledger is not None and row['is_bye']:
+                    ledger.remove(row['team1_id'])
+        if row:
+            self.events.emit(events.MATCH_UPDATED, row['tournament_id'], (match_id,))
+
+    def get_head_to_head(self, tournament_id: str) -> HeadToHeadIndex:
+        """Retourne l'historique des rencontres d'un tournoi (une requête au premier appel)"""
+        with self._cache_lock:
+            self._check_caches(tournament_id)
+            index = self._head_to_head.get(tournament_id)
+            if index is None:
+                with self.get_connection() as conn:
+                    rows = conn.execute(
+                        'SELECT team1_id, team2_id FROM matches WHERE tournament_id = ?',
+                        (tournament_id,)
+                    ).fetchall()
+                index = HeadToHeadIndex(tuple(row) for row in rows)
+                self._head_to_head[tournament_id] = index
+            return index
+
+    def get_bye_ledger(self, tournament_id: str) -> ByeLedger:
+        """Retourne l'historique des BYE d'un tournoi (une requête indexée au premier appel)"""
+        with self._cache_lock:
+            self._check_caches(tournament_id)
+            ledger = self._byes.get(tournament_id)
+            if ledger is None:
+                with self.get_connection() as conn:
+                    rows = conn.execute(
+                        'SELECT team1_id FROM matches WHERE tournament_id = ? AND is_bye = 1',
+                        (tournament_id,)
+                    ).fetchall()
+                ledger = ByeLedger(row[0] for row in rows)
+                self._byes[tournament_id] = ledger
+            return ledger
+
+    def save_quadrette_schedule(self, tournament_id: str, schedule: QuadretteSchedule):
+        """Enregistre le planning quadrette d'un tournoi"""
+        with self._cache_lock:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    INSERT OR REPLACE INTO quadrette_schedules (tournament_id, schedule)
+                    VALUES (?, ?)
+                ''', (tournament_id, schedule.to_json()))
+                version = self._bump_data_version(cursor, tournament_id)
+            if self._caches_follow(tournament_id, version):
+                self._quadrette[tournament_id] = schedule
+
+    def get_quadrette_schedule(self, tournament_id: str) -> Optional[QuadretteSchedule]:
+        """Retourne le planning quadrette d'un tournoi (lu une fois), None s'il n'existe pas"""
+        with self._cache_lock:
+            self._check_caches(tournament_id)
+            schedule = self._quadrette.get(tournament_id)
+            if schedule is None:
+                with self.get_connection() as conn:
+                    row = conn.execute(
+                        'SELECT schedule FROM quadrette_schedules WHERE tournament_id = ?',
+                        (tournament_id,)
+                    ).fetchone()
+                if row is None:
+                    return None
+                schedule = QuadretteSchedule.from_json(row[0])
+                self._quadrette[tournament_id] = schedule
+            return schedule
+
+    def _record_pairings(self, tournament_id: str, pairings):
+        """Reporte de nouveaux matchs dans l'historique s'il est chargé"""
+        with self._cache_lock:
+            index = self._head_to_head.get(tournament_id)
+            if index is not None:
+                for team1_id, team2_id in pairings:
+                    index.add(team1_id, team2_id)
 
     def get_team_standings(self, tournament_id: str) -> List[Dict]:
-        """Calcule et retourne le classement des équipes"""
+        """Retourne le classement des équipes (servi par le classement en mémoire)"""
+        with self._cache_lock:
+            return self.get_standings_index(tournament_id).page()
+
+    def get_standings_page(self, tournament_id: str, offset: int = 0,
+                           limit: Optional[int] = None) -> List[Dict]:
+        """Retourne une page du classement"""
+        with self._cache_lock:
+            return self.get_standings_index(tournament_id).page(offset, limit)
+
+    def get_team_rank(self, tournament_id: str, team_id: str) -> Optional[int]:
+        """Retourne la position d'une équipe dans le classement"""
+        with self._cache_lock:
+            return self.get_standings_index(tournament_id).rank(team_id)
+
+    def get_standings_entries(self, tournament_id: str, team_ids) -> List[Dict]:
+        """Lignes du classement de quelques équipes, avec leur position, par position croissante"""
+        with self._cache_lock:
+            standings = self.get_standings_index(tournament_id)
+            entries = [standings.entry(team_id) for team_id in team_ids]
+        return sorted((e for e in entries if e is not None), key=lambda e: e['rank'])
+
+    def get_standings_index(self, tournament_id: str) -> StandingsIndex:
+        """Retourne le classement en mémoire d'un tournoi (une requête au premier appel)"""
+        with self._cache_lock:
+            self._check_caches(tournament_id)
+            standings = self._standings.get(tournament_id)
+            if standings is None:
+                standings = StandingsIndex(self._query_team_standings(tournament_id))
+                self._standings[tournament_id] = standings
+            return standings
+
+    def _query_team_standings(self, tournament_id: str) -> List[Dict]:
+        """Calcule le classement des équipes en SQL"""
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute('''
@@ -316,5 +1287,232 @@ class DatabaseManager:
             rows = cursor.fetchall()
             return [dict(row) for row in rows]
 
-# Instance globale du gestionnaire de base de données
-db_manager = DatabaseManager()
+    def _update_standings(self, team_id: str, **values):
+        """Reporte une modification d'équipe dans les classements chargés"""
+        with self._cache_lock:
+            for standings in self._standings.values():
+                if team_id in standings:
+                    standings.update(team_id, **values)
+                    break
+
+
+# Modes de durabilité de la file d'écriture
+DURABILITY_BATCH = 'batch'  # Synchronisation disque à chaque lot (synchronous = FULL)
+DURABILITY_TIMED = 'timed'  # Synchronisation périodique par point de contrôle WAL
+
+_STOP = object()
+
+
+class _WriteJob:
+    __slots__ = ('future', 'func', 'args', 'kwargs')
+
+    def __init__(self, func: Optional[Callable], args: tuple, kwargs: Dict):
+        self.future: Future = Future()
+        self.func = func  # None pour un score (regroupé avec les autres)
+        self.args = args
+        self.kwargs = kwargs
+
+
+class WriteQueue:
+    """File d'écriture à validation groupée (group commit).
+
+    Un thread unique exécute les écritures dans l'ordre de soumission. Les
+    scores soumis pendant ``max_delay`` secondes sont enregistrés en une seule
+    transaction (``record_match_results``) ; la fenêtre ne s'ouvre que sous
+    charge, quand le lot précédent regroupait plusieurs écritures. Chaque appel reçoit un Future,
+    résolu lorsque l'écriture est durable :
+
+    - ``DURABILITY_BATCH`` : chaque lot est synchronisé sur disque à sa validation ;
+    - ``DURABILITY_TIMED`` : les lots validés sont synchronisés ensemble toutes
+      les ``sync_interval`` secondes (point de contrôle WAL), moins d'accès disque
+      au prix d'une latence plus élevée.
+    """
+
+    def __init__(self, db: 'DatabaseManager', max_delay: float = 0.002, max_batch: int = 512,
+                 durability: str = DURABILITY_BATCH, sync_interval: float = 0.05):
+        if durability not in (DURABILITY_BATCH, DURABILITY_TIMED):
+            raise ValueError(f"Mode de durabilité inconnu : {durability}")
+        self.db = db
+        self.max_delay = max_delay
+        self.max_batch = max_batch
+        self.durability = durability
+        self.sync_interval = sync_interval
+        # Compteurs : transactions de scores et scores enregistrés, synchronisations
+        self.batches = 0
+        self.results_committed = 0
+        self.syncs = 0
+        self._queue: 'queue.Queue' = queue.Queue()
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self._unsynced: List[Tuple[Future, object]] = []
+        self._next_sync = 0.0
+        self._last_batch = 0
+        self._thread = threading.Thread(target=self._run, name='sqlite-writer', daemon=True)
+        self._thread.start()
+
+    def submit(self, func: Callable, *args, **kwargs) -> Future:
+        """Exécute func(*args, **kwargs) dans le thread d'écriture, après les écritures déjà soumises"""
+        return self._put(_WriteJob(func, args, kwargs))
+
+    def submit_result(self, match_id: str, team1_score: int, team2_score: int) -> Future:
+        """Enregistre un score ; le Future reçoit la valeur de record_match_result"""
+        return self._put(_WriteJob(None, (match_id, team1_score, team2_score), {}))
+
+    def _put(self, job: _WriteJob) -> Future:
+        with self._close_lock:
+            if self._closed:
+                job.future.set_exception(RuntimeError("File d'écriture fermée"))
+            else:
+                self._queue.put(job)
+        return job.future
+
+    def close(self):
+        """Termine les écritures en attente puis arrête le thread ; les soumissions
+        ultérieures échouent"""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._thread.join()
+
+    # Thread d'écriture
+    def _run(self):
+        conn = self.db.get_connection()
+        if self.db.pool is not None:
+            synchronous = 'FULL' if self.durability == DURABILITY_BATCH else 'NORMAL'
+            conn.execute(f"PRAGMA synchronous = {synchronous}")
+        while True:
+            timeout = max(0.0, self._next_sync - time.monotonic()) if self._unsynced else None
+            try:
+                jobs = [self._queue.get(timeout=timeout)]
+            except queue.Empty:
+                self._sync(conn)
+                continue
+            # Fenêtre de regroupement, seulement sous charge (lot précédent multiple) :
+            # un écrivain isolé n'attend pas ; les écritures arrivées entre-temps rejoignent le lot
+            deadline = time.monotonic() + (self.max_delay if self._last_batch > 1 else 0)
+            while len(jobs) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                try:
+                    jobs.append(self._queue.get(timeout=remaining) if remaining > 0
+                                else self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            self._last_batch = len(jobs)
+            stop = self._process(jobs)
+            if stop or self.durability == DURABILITY_BATCH or time.monotonic() >= self._next_sync:
+                self._sync(conn)
+            if stop:
+                # Rien ne reste sans réponse : écritures arrivées après la demande d'arrêt
+                while True:
+                    try:
+                        self._reject(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                if self.db.pool is not None:
+                    conn.execute(f"PRAGMA synchronous = {self.db.pool.pragmas['synchronous']}")
+                self.db.release_connection()
+                return
+
+    def _process(self, jobs) -> bool:
+        """Exécute un lot ; retourne True si l'arrêt a été demandé"""
+        scores = []
+        for i, job in enumerate(jobs):
+            if job is _STOP:
+                self._commit_scores(scores)
+                for rejected in jobs[i + 1:]:
+                    self._reject(rejected)
+                return True
+            if not job.future.set_running_or_notify_cancel():
+                continue  # Abandonné par l'appelant avant son tour
+            if job.func is None:
+                scores.append(job)
+                continue
+            # Respecte l'ordre de soumission : les scores reçus avant cette écriture passent d'abord
+            self._commit_scores(scores)
+            scores = []
+            try:
+                self._committed(job, job.func(*job.args, **job.kwargs))
+            except Exception as e:
+                job.future.set_exception(e)
+        self._commit_scores(scores)
+        return False
+
+    def _commit_scores(self, jobs):
+        if not jobs:
+            return
+        # Un match noté deux fois dans le lot garde son dernier score, comme appliqué à la suite
+        results = {job.args[0]: job.args[1:] for job in jobs}
+        try:
+            previous = self.db.record_match_results(results)
+        except Exception as e:
+            if len(jobs) == 1:
+                jobs[0].future.set_exception(e)
+                return
+            # Isole le score fautif : chacun dans sa propre transaction
+            for job in jobs:
+                self._commit_scores([job])
+            return
+        self.batches += 1
+        self.results_committed += len(jobs)
+        for job in jobs:
+            self._committed(job, previous.get(job.args[0]))
+
+    def _committed(self, job: _WriteJob, result):
+        if not self._unsynced:
+            self._next_sync = time.monotonic() + self.sync_interval
+        self._unsynced.append((job.future, result))
+
+    @staticmethod
+    def _reject(job):
+        if job is not _STOP:
+            job.future.set_exception(RuntimeError("File d'écriture fermée"))
+
+    def _sync(self, conn: sqlite3.Connection):
+        """Rend les écritures validées durables puis résout leurs Futures
+
+        Si la synchronisation échoue, les Futures du lot reçoivent l'erreur et
+        le thread d'écriture continue.
+        """
+        if not self._unsynced:
+            return
+        unsynced, self._unsynced = self._unsynced, []
+        try:
+            if self.durability == DURABILITY_TIMED:
+                self._flush_wal(conn)
+                self.syncs += 1
+        except Exception as e:
+            for future, _ in unsynced:
+                future.set_exception(e)
+            return
+        for future, result in unsynced:
+            future.set_result(result)
+
+    @staticmethod
+    def _flush_wal(conn: sqlite3.Connection):
+        """Point de contrôle du WAL ; si des lecteurs empêchent de tout recopier dans
+        la base, le fichier WAL est synchronisé lui-même"""
+        busy, log, checkpointed = conn.execute("PRAGMA wal_checkpoint(PASSIVE)").fetchone()
+        if checkpointed == log:
+            return
+        path = conn.execute('PRAGMA database_list').fetchone()[2]
+        with open(path + '-wal', 'ab') as wal:
+            os.fsync(wal.fileno())
+
+
+# Instance globale du gestionnaire de base de données, créée au premier accès
+# (importer le module n'ouvre ni ne migre petanque_manager.db)
+_db_manager: Optional[DatabaseManager] = None
+_db_manager_lock = threading.Lock()
+
+
+def __getattr__(name: str):
+    global _db_manager
+    if name != 'db_manager':
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    with _db_manager_lock:
+        if _db_manager is None:
+            _db_manager = DatabaseManager()
+    return _db_manager
@@ -4,7 +4,7 @@ Test console pour Pétanque Manager
 Teste la logique métier sans interface graphique
 """
 
-from store import db_manager
+import store
 from tournament import TournamentManager
 import os
 import pytest
@@ -16,7 +16,7 @@ def test_database():
     print("=== Test de la base de données ===")
     
     # Créer un tournoi de test
-    tournament_id = db_manager.create_tournament("Test Tournoi", "doublette", 4)
+    tournament_id = store.db_manager.create_tournament("Test Tournoi", "doublette", 4)
     print(f"Tournoi créé avec l'ID: {tournament_id}")
     
     # Créer des équipes de test
@@ -30,13 +30,13 @@ def test_database():
     ]
     
     for players, name in team_names:
-        team_id = db_manager.create_team(tournament_id, name, players)
+        team_id = store.db_manager.create_team(tournament_id, name, players)
         teams.append(team_id)
         print(f"Équipe '{name}' créée avec les joueurs: {', '.join(players)}")
     
     # Récupérer et afficher les équipes
     print("\n=== Équipes inscrites ===")
-    tournament_teams = db_manager.get_teams_by_tournament(tournament_id)
+    tournament_teams = store.db_manager.get_teams_by_tournament(tournament_id)
     for team in tournament_teams:
         print(f"- {team['name']}: {', '.join(team['players'])}")
     
@@ -73,7 +73,7 @@ def test_tournament_logic(tournament_id):
         
         # Afficher le classement
         print("\n=== Classement après le premier tour ===")
-        standings = db_manager.get_team_standings(tournament_id)
+        standings = store.db_manager.get_team_standings(tournament_id)
         
         for i, team in enumerate(standings):
             print(f"{i+1}. {team['name']} - V:{team['wins']} D:{team['losses']} "
@@ -91,18 +91,22 @@ def test_quadrette_logic():
     print("\n=== Test de la logique quadrette ===")
     
     # Créer un tournoi quadrette
-    tournament_id = db_manager.create_tournament("Test Quadrette", "quadrette", 2)
+    tournament_id = store.db_manager.create_tournament("Test Quadrette", "quadrette", 2)
     
     # Créer des équipes de 4 joueurs
     quadrette_teams = [
         (["A1", "B1", "C1", "D1"], "Équipe Alpha"),
         (["A2", "B2", "C2", "D2"], "Équipe Beta"),
         (["A3", "B3", "C3", "D3"], "Équipe Gamma"),
-        (["A4", "B4", "C4", "D4"], "Équipe Delta")
+        (["A4", "B4", "C4", "D4"], "Équipe Delta"),
+        (["A5", "B5", "C5", "D5"], "Équipe Epsilon"),
+        (["A6", "B6", "C6", "D6"], "Équipe Zêta"),
+        (["A7", "B7", "C7", "D7"], "Équipe Êta"),
+        (["A8", "B8", "C8", "D8"], "Équipe Thêta")
     ]
     
     for players, name in quadrette_teams:
-        db_manager.create_team(tournament_id, name, players)
+        store.db_manager.create_team(tournament_id, name, players)
         print(f"Équipe quadrette '{name}' créée")
     
     tournament_manager = TournamentManager()
@@ -114,6 +118,8 @@ def test_quadrette_logic():
             print(f"\nTour {round_num} - Pattern: {matches[0].get('pattern', 'N/A')}")
             for match in matches:
                 print(f"  {match['team1']['name']} vs {match['team2']['name']}")
+                for players1, players2 in match['games']:
+                    print(f"    {', '.join(players1)} vs {', '.join(players2)}")
         except Exception as e:
             print(f"Erreur au tour {round_num}: {str(e)}")
             break
@@ -0,0 +1,54 @@
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+os.environ["SQLITE_PATH"] = "file:api?mode=memory&cache=shared"
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+import server  # noqa: E402
+
+
+def test_round_trip_from_tournament_to_standings():
+    client = TestClient(server.app)
+    tournament = client.post("/api/tournaments", json={
+        "name": "API", "type": "doublette", "num_courts": 2}).json()
+    for name in ("A", "B", "C", "D"):
+        assert client.post(f"/api/tournaments/{tournament['id']}/teams",
+                           json={"name": name, "players": ["x", "y"]}).status_code == 201
+
+    round_ = client.post(f"/api/tournaments/{tournament['id']}/rounds", json={}).json()
+    assert round_["round_number"] == 1 and len(round_["matches"]) == 2
+    first, second = round_["matches"]
+    assert client.put(f"/api/matches/{first['id']}/result",
+                      json={"team1_score": 13, "team2_score": 5}).status_code == 204
+    ack = client.post(f"/api/tournaments/{tournament['id']}/rounds/1/results",
+                      json={"results": {second["id"]: {"team1_score": 8, "team2_score": 13}}})
+    assert ack.json() == {"updated": 1}
+
+    standings = client.get(f"/api/tournaments/{tournament['id']}/standings").json()
+    assert [s["rank"] for s in standings] == [1, 2, 3, 4]
+    assert standings[0]["wins"] == 1 and standings[-1]["losses"] == 1
+    assert client.put("/api/matches/unknown/result",
+                      json={"team1_score": 1, "team2_score": 0}).status_code == 404
+
+
+def test_standings_are_revalidated_with_etags():
+    client = TestClient(server.app)
+    tournament = client.post("/api/tournaments", json={
+        "name": "ETag", "type": "doublette", "num_courts": 1}).json()
+    url = f"/api/tournaments/{tournament['id']}/standings"
+    first = client.get(url)
+    etag = first.headers["etag"]
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+    client.post(f"/api/tournaments/{tournament['id']}/teams", json={"name": "A"})
+    changed = client.get(url, headers={"If-None-Match": etag})
+    assert changed.status_code == 200 and changed.headers["etag"] != etag
+    assert [s["name"] for s in changed.json()] == ["A"]
+    assert client.get("/api/cache/stats").json()["not_modified"] >= 1
@@ -0,0 +1,38 @@
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+from async_store import AsyncDatabaseManager  # noqa: E402
+from store import DatabaseManager  # noqa: E402
+
+
+def test_concurrent_scores_are_group_committed():
+    store = DatabaseManager("file:async_store?mode=memory&cache=shared")
+    db = AsyncDatabaseManager(store, readers=2)
+
+    async def scenario():
+        tid = await db.create_tournament("Async", "doublette", 8)
+        team_ids = await db.create_teams_bulk(tid, [(f"E{i}", []) for i in range(200)])
+        match_ids = await db.create_matches_bulk(
+            tid, 1, [(team_ids[i], team_ids[i + 1], i // 2 + 1) for i in range(0, 200, 2)])
+
+        # Le rédacteur est occupé : les scores s'accumulent dans sa file
+        results = await asyncio.gather(
+            db.write(time.sleep, 0.05),
+            *(db.record_match_result(match_id, 13, 5) for match_id in match_ids),
+            db.record_match_result("inconnu", 13, 0),
+            db.get_team_standings(tid))
+        results = results[1:]
+        assert all(previous["status"] != "finished" for previous in results[:100])
+        assert results[100] is None
+        return tid
+
+    tid = asyncio.run(scenario())
+    db.close()
+    assert db.writes.results_committed == 101 and db.writes.batches <= 2
+    standings = store.get_team_standings(tid)
+    assert sum(team["wins"] for team in standings) == 100
+    assert sum(team["points_for"] for team in standings) == 100 * 18
@@ -0,0 +1,73 @@
+import threading
+
+import events
+from store import DatabaseManager
+from widgets.change_dispatcher import ChangeDispatcher, affects
+
+
+class FakeRoot:
+    """Remplace tk.Tk : les callbacks `after` / `after_idle` sont exécutés par run_idle()"""
+
+    def __init__(self):
+        self.idle = []
+
+    def after(self, delay, callback):
+        return 'poll'
+
+    def after_idle(self, callback):
+        self.idle.append(callback)
+
+    def after_cancel(self, ident):
+        pass
+
+    def run_idle(self):
+        while self.idle:
+            self.idle.pop(0)()
+
+
+def test_store_emits_typed_events():
+    db = DatabaseManager("file:change_events?mode=memory&cache=shared")
+    received = []
+    db.events.subscribe(received.append)
+
+    tid = db.create_tournament("T", "doublette", 2)
+    a, b = db.create_teams_bulk(tid, [("A", []), ("B", [])])
+    (match_id,) = db.create_matches_bulk(tid, 1, [(a, b, 1)])
+    db.record_match_result(match_id, 13, 7)
+    db.update_match_court(match_id, 3)
+    db.delete_tournament(tid)
+
+    assert [(e.kind, e.tournament_id) for e in received] == [
+        (events.TOURNAMENT_CREATED, tid),
+        (events.TEAM_CREATED, tid),
+        (events.ROUND_CREATED, tid),
+        (events.MATCH_SCORED, tid),
+        (events.TEAM_UPDATED, tid),
+        (events.MATCH_UPDATED, None),
+        (events.TOURNAMENT_DELETED, tid),
+    ]
+    assert received[3].ids == (match_id,)
+    assert set(received[4].ids) == {a, b}
+
+
+def test_dispatcher_coalesces_bursts_into_one_batch():
+    root = FakeRoot()
+    bus = events.EventBus()
+    dispatcher = ChangeDispatcher(root, bus)
+    batches = []
+    dispatcher.add_listener(batches.append)
+
+    for _ in range(3):
+        bus.emit(events.MATCH_SCORED, "t1", ("m1",))
+    bus.emit(events.TEAM_UPDATED, "t1", ("a",))
+    worker = threading.Thread(target=bus.emit, args=(events.TEAM_DELETED, "t2", ("b",)))
+    worker.start()
+    worker.join()
+    root.run_idle()
+
+    assert len(batches) == 1
+    assert [e.kind for e in batches[0]] == [
+        events.MATCH_SCORED, events.TEAM_UPDATED, events.TEAM_DELETED]
+    assert affects(batches[0], "t1", (events.TEAM_UPDATED,))
+    assert not affects(batches[0], "t3", (events.TEAM_DELETED,))
+    dispatcher.close()
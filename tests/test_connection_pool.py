@@ -0,0 +1,31 @@
+import threading
+
+from store import DatabaseManager
+
+
+def test_connection_is_reused_per_thread():
+    db = DatabaseManager("file:pool_reuse?mode=memory&cache=shared")
+    assert db.get_connection() is db.get_connection()
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(db.get_connection()))
+    thread.start()
+    thread.join()
+    assert other[0] is not db.get_connection()
+
+
+def test_released_connection_is_recycled():
+    db = DatabaseManager("file:pool_recycle?mode=memory&cache=shared", max_connections=2)
+    seen = []
+
+    def worker():
+        seen.append(db.get_connection())
+        db.release_connection()
+
+    for _ in range(3):
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+    assert seen[0] is seen[1] is seen[2]
+    assert db.pool._open_count == 2
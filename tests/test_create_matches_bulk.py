@@ -0,0 +1,75 @@
+import sqlite3
+
+import pytest
+
+from store import DatabaseManager
+from tournament import TournamentManager
+
+
+@pytest.fixture
+def db():
+    return DatabaseManager("file:bulk_matches?mode=memory&cache=shared")
+
+
+def test_generate_round_inserts_all_matches(db):
+    tid = db.create_tournament("T", "doublette", 2)
+    for i in range(5):
+        db.create_team(tid, f"Équipe {i + 1}", ["a", "b"])
+
+    matches = TournamentManager(db).generate_next_round(tid)
+
+    assert len(matches) == 2
+    assert db.get_tournament(tid)['current_round'] == 1
+    stored = db.get_matches_by_tournament_round(tid, 1)
+    assert len(stored) == 3
+    bye = [m for m in stored if m['team1_id'] == m['team2_id']][0]
+    assert (bye['team1_score'], bye['team2_score'], bye['status']) == (13, 7, 'finished')
+    bye_team = [t for t in db.get_teams_by_tournament(tid) if t['id'] == bye['team1_id']][0]
+    assert (bye_team['wins'], bye_team['losses'], bye_team['points_for']) == (1, 0, 13)
+
+
+def test_failed_bulk_insert_leaves_no_partial_round(db):
+    tid = db.create_tournament("T", "doublette", 2)
+    t1 = db.create_team(tid, "A", ["a", "b"])
+    t2 = db.create_team(tid, "B", ["c", "d"])
+
+    with pytest.raises(sqlite3.IntegrityError):
+        db.create_matches_bulk(tid, 1, [(t1, t2, 1), (t1, None, 2)])
+
+    assert db.get_matches_by_tournament_round(tid, 1) == []
+    assert db.get_tournament(tid)['current_round'] == 0
+
+
+def test_bye_rotates_before_any_team_gets_a_second_one(db):
+    tid = db.create_tournament("T", "doublette", 2)
+    team_ids = [db.create_team(tid, f"Équipe {i + 1}", ["a", "b"]) for i in range(5)]
+    manager = TournamentManager(db)
+
+    bye_teams = []
+    for round_number in range(1, 6):
+        matches = manager.generate_next_round(tid)
+        manager.submit_round_results(tid, round_number, {m['id']: (13, 0) for m in matches})
+        byes = [m for m in db.get_matches_by_tournament_round(tid, round_number) if m['is_bye']]
+        assert len(byes) == 1 and byes[0]['team1_id'] == byes[0]['team2_id']
+        bye_teams.append(byes[0]['team1_id'])
+
+    assert sorted(bye_teams) == sorted(team_ids)
+    ledger = db.get_bye_ledger(tid)
+    assert all(ledger.count(team_id) == 1 for team_id in team_ids)
+
+
+def test_bye_ledger_follows_mutations(db):
+    tid = db.create_tournament("T", "doublette", 2)
+    a, b, c = (db.create_team(tid, name, ["x"]) for name in "ABC")
+    ledger = db.get_bye_ledger(tid)
+    ids = db.create_matches_bulk(tid, 1, [(a, a, None, 13, 7), (b, c, 1)])
+    assert (ledger.count(a), ledger.total()) == (1, 1)
+
+    db.delete_match(ids[1])
+    assert ledger.count(a) == 1
+    db.delete_match(ids[0])
+    assert ledger.total() == 0
+
+    db.create_matches_bulk(tid, 2, [(b, b, None, 13, 7)])
+    db.delete_team(b)
+    assert ledger.total() == 0
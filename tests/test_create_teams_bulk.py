@@ -0,0 +1,12 @@
+from store import DatabaseManager
+
+
+def test_create_teams_bulk():
+    db = DatabaseManager("file:teams_bulk?mode=memory&cache=shared")
+    tid = db.create_tournament("T", "doublette", 2)
+    db.get_team_standings(tid)
+    ids = db.create_teams_bulk(tid, [("Équipe 1", ["a", "b"]), ("Équipe 2", ["c"])])
+    teams = db.get_teams_by_tournament(tid)
+    assert [t['id'] for t in teams] == ids
+    assert teams[1]['players'] == ["c"]
+    assert len(db.get_team_standings(tid)) == 2
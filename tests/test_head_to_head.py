@@ -0,0 +1,23 @@
+from store import DatabaseManager
+from tournament import TournamentManager
+
+
+def test_head_to_head_index_follows_mutations():
+    db = DatabaseManager("file:head_to_head?mode=memory&cache=shared")
+    tid = db.create_tournament("T", "doublette", 2)
+    a, b, c, d = (db.create_team(tid, name, ["x"]) for name in "ABCD")
+    first = db.create_match(tid, 1, a, b)
+
+    index = db.get_head_to_head(tid)
+    assert index.have_played(b, a)
+    assert not index.have_played(a, c)
+
+    db.create_matches_bulk(tid, 2, [(a, c, 1), (b, d, 2)])
+    assert index.have_played(c, a) and index.have_played(b, d)
+
+    db.delete_match(first)
+    assert not index.have_played(a, b)
+
+    db.delete_team(c)
+    assert index.opponents(a) == set()
+    assert TournamentManager(db)._have_teams_played(tid, b, d)
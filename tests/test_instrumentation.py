@@ -0,0 +1,34 @@
+import json
+import sqlite3
+
+import pytest
+
+from store import DatabaseManager
+
+
+def test_instrumentation_is_opt_in_and_counts_calls(tmp_path):
+    db = DatabaseManager("file:instrumentation?mode=memory&cache=shared")
+    assert db.stats()["enabled"] is False
+    assert "create_team" not in vars(db)
+
+    db.enable_instrumentation()
+    tid = db.create_tournament("T", "doublette", 2)
+    for name in ("A", "B", "C"):
+        db.create_team(tid, name, [])
+    db.get_team_standings(tid)
+    with pytest.raises(sqlite3.OperationalError):
+        db.update_tournament(tid, unknown_column=1)
+
+    stats = db.stats()
+    assert stats["enabled"] and stats["commits"] >= 4 and stats["statements"] > stats["commits"]
+    assert stats["methods"]["create_team"]["calls"] == 3
+    assert sum(stats["methods"]["create_team"]["histogram_ms"].values()) == 3
+    assert stats["methods"]["update_tournament"]["errors"] == 1
+    assert stats["connections"]["opened"] >= 1
+
+    path = tmp_path / "stats.json"
+    db.dump_stats(str(path))
+    assert json.loads(path.read_text(encoding="utf-8"))["methods"]["create_team"]["calls"] == 3
+
+    db.disable_instrumentation()
+    assert "create_team" not in vars(db) and "methods" not in db.stats()
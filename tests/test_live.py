@@ -0,0 +1,42 @@
+import asyncio
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+from live import LiveHub  # noqa: E402
+from store import DatabaseManager  # noqa: E402
+from tournament import TournamentManager  # noqa: E402
+
+
+def test_results_are_coalesced_and_slow_clients_resynchronised():
+    db = DatabaseManager("file:live?mode=memory&cache=shared")
+    manager = TournamentManager(db)
+    tid = db.create_tournament("T", "doublette", 2)
+    a, b, c, d = db.create_teams_bulk(tid, [(name, []) for name in "ABCD"])
+    first, second = db.create_matches_bulk(tid, 1, [(a, b, 1), (c, d, 2)])
+
+    async def scenario():
+        hub = LiveHub(db, asyncio.to_thread, coalesce_delay=0.05, max_pending=1)
+        hub.start()
+        fast, slow = hub.subscribe(tid), hub.subscribe(tid)
+        fast_stream = hub.stream(fast)
+        snapshot = json.loads(await fast_stream.__anext__())
+        assert snapshot["type"] == "snapshot" and len(snapshot["standings"]) == 4
+
+        # Deux résultats dans la même fenêtre : un seul delta
+        await asyncio.to_thread(manager.update_match_result, first, 13, 4)
+        await asyncio.to_thread(manager.update_match_result, second, 7, 13)
+        delta = json.loads(await asyncio.wait_for(fast_stream.__anext__(), 2))
+        assert delta["type"] == "delta"
+        assert {m["id"] for m in delta["matches"]} == {first, second}
+        assert [s["id"] for s in delta["standings"]] == [a, d, c, b]
+        assert [s["rank"] for s in delta["standings"]] == [1, 2, 3, 4]
+
+        # Le client lent n'a rien lu : son retard est remplacé par un nouvel instantané
+        resync = json.loads(await asyncio.wait_for(hub.stream(slow).__anext__(), 2))
+        assert resync["type"] == "snapshot" and resync["standings"][0]["id"] == a
+        hub.stop()
+
+    asyncio.run(scenario())
@@ -0,0 +1,51 @@
+import pytest
+
+from store import DatabaseManager
+from tournament import TournamentManager
+
+
+@pytest.fixture
+def db():
+    return DatabaseManager("file:match_result?mode=memory&cache=shared")
+
+
+def stats(db, tid):
+    return {t['name']: (t['wins'], t['losses'], t['points_for'], t['points_against'])
+            for t in db.get_teams_by_tournament(tid)}
+
+
+def test_correcting_a_score_replaces_previous_result(db):
+    manager = TournamentManager(db)
+    tid = db.create_tournament("T", "doublette", 2)
+    a = db.create_team(tid, "A", ["x"])
+    b = db.create_team(tid, "B", ["y"])
+    match_id = db.create_match(tid, 1, a, b)
+
+    manager.update_match_result(match_id, 13, 8)
+    manager.update_match_result(match_id, 13, 8)
+    assert stats(db, tid) == {"A": (1, 0, 13, 8), "B": (0, 1, 8, 13)}
+
+    manager.update_match_result(match_id, 11, 13)
+    assert stats(db, tid) == {"A": (0, 1, 11, 13), "B": (1, 0, 13, 11)}
+    assert [row['name'] for row in db.get_team_standings(tid)] == ["B", "A"]
+
+    with pytest.raises(ValueError):
+        manager.update_match_result("inconnu", 13, 0)
+
+
+def test_recompute_team_stats_rebuilds_from_matches(db):
+    tid = db.create_tournament("T", "doublette", 2)
+    a = db.create_team(tid, "A", ["x"])
+    b = db.create_team(tid, "B", ["y"])
+    c = db.create_team(tid, "C", ["z"])
+    db.create_matches_bulk(tid, 1, [(a, b, 1), (c, c, None, 13, 7)])
+    match_id = db.get_matches_by_tournament_round(tid, 1)[-1]['id']
+    db.record_match_result(match_id, 6, 13)
+    expected = stats(db, tid)
+
+    db.update_team_stats(a, 9, 9, 99, 99)
+    db.recompute_team_stats(tid)
+
+    assert stats(db, tid) == expected == {
+        "A": (0, 1, 6, 13), "B": (1, 0, 13, 6), "C": (1, 0, 13, 7)}
+    assert db.get_team_standings(tid)[-1]['name'] == "A"
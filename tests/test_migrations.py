@@ -0,0 +1,68 @@
+import os
+import sqlite3
+import subprocess
+import sys
+
+from store import DatabaseManager, SCHEMA_VERSION
+
+
+def test_migrations_upgrade_legacy_database(tmp_path):
+    path = str(tmp_path / "legacy.db")
+    conn = sqlite3.connect(path)
+    conn.execute('CREATE TABLE tournaments (id TEXT PRIMARY KEY, name TEXT NOT NULL, '
+                 'type TEXT NOT NULL, num_courts INTEGER NOT NULL)')
+    conn.execute("INSERT INTO tournaments VALUES ('t1', 'Ancien', 'doublette', 2)")
+    conn.commit()
+    conn.close()
+
+    db = DatabaseManager(path)
+    assert db.get_schema_version() == SCHEMA_VERSION
+    indexes = {row[0] for row in db.get_connection().execute(
+        "SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert {'idx_matches_tournament_round', 'idx_matches_pair'} <= indexes
+    assert db.get_tournament('t1')['name'] == 'Ancien'
+    db.close()
+
+
+def test_migration_flags_existing_bye_matches(tmp_path):
+    path = str(tmp_path / "byes.db")
+    db = DatabaseManager(path)
+    tid = db.create_tournament("T", "doublette", 2)
+    a, b = db.create_team(tid, "A", ["x"]), db.create_team(tid, "B", ["y"])
+    db.create_matches_bulk(tid, 1, [(a, a, None, 13, 7), (a, b, 1)])
+    db.close()
+
+    # Base antérieure au marqueur : on le retire et on redescend de version
+    conn = sqlite3.connect(path)
+    conn.execute('DROP INDEX idx_matches_bye')
+    conn.execute('ALTER TABLE matches DROP COLUMN is_bye')
+    conn.execute('ALTER TABLE tournaments DROP COLUMN data_version')
+    conn.execute('DROP TABLE catalog_version')
+    conn.execute('PRAGMA user_version = 2')
+    conn.commit()
+    conn.close()
+
+    db = DatabaseManager(path)
+    assert db.get_schema_version() == SCHEMA_VERSION
+    assert db.get_bye_ledger(tid).count(a) == 1
+    assert sum(m['is_bye'] for m in db.get_matches_by_tournament_round(tid, 1)) == 1
+    db.close()
+
+
+def test_migrate_rereads_the_version_under_the_write_lock(tmp_path, monkeypatch):
+    path = str(tmp_path / "shared.db")
+    DatabaseManager(path).close()
+
+    # Second processus qui a lu la version avant que le premier ne migre
+    db = DatabaseManager(path)
+    monkeypatch.setattr(db, 'get_schema_version', lambda: 0)
+    db.migrate()
+    assert db.get_connection().execute('PRAGMA user_version').fetchone()[0] == SCHEMA_VERSION
+    db.close()
+
+
+def test_importing_store_leaves_the_database_untouched(tmp_path):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    subprocess.run([sys.executable, '-c', 'import store, tournament'], cwd=str(tmp_path),
+                   env={**os.environ, 'PYTHONPATH': root}, check=True)
+    assert os.listdir(str(tmp_path)) == []
@@ -0,0 +1,80 @@
+import pytest
+
+from pairing import MatchingPairingEngine, SwissPairingEngine
+from store import DatabaseManager
+from tournament import TournamentManager
+
+
+def test_matching_avoids_rematches():
+    performances = {'A': 40, 'B': 30, 'C': 20, 'D': 10}
+    played = {frozenset('AB'), frozenset('CD')}
+    pairs, unpaired = MatchingPairingEngine().pair(
+        list(performances), performances, lambda a, b: frozenset((a, b)) in played)
+    assert unpaired == []
+    assert {frozenset(p) for p in pairs} == {frozenset('AC'), frozenset('BD')}
+
+
+def test_generate_next_round_with_matching_pairs_everyone():
+    db = DatabaseManager("file:pairing_matching?mode=memory&cache=shared")
+    manager = TournamentManager(db)
+    tid = db.create_tournament("T", "doublette", 4)
+    for i in range(8):
+        db.create_team(tid, f"Équipe {i + 1}", ["a", "b"])
+
+    for _ in range(3):
+        matches = manager.generate_next_round(tid, pairing='matching')
+        assert len(matches) == 4
+        for match in matches:
+            manager.update_match_result(match['id'], 13, 5)
+
+    with pytest.raises(ValueError):
+        manager.generate_next_round(tid, pairing='inconnu')
+
+
+def test_swiss_pairs_within_score_groups_and_floats_down():
+    wins = {'A': 2, 'B': 2, 'C': 2, 'D': 1, 'E': 1, 'F': 1, 'G': 0, 'H': 0}
+    tiebreaks = {t: (-i, 0) for i, t in enumerate(wins)}
+    played = {frozenset('AC')}
+    pairs, unpaired = SwissPairingEngine().pair(
+        list(wins), wins, lambda a, b: frozenset((a, b)) in played, tiebreaks)
+    assert unpaired == []
+    # Groupe à 2 victoires : A ne rejoue pas C, C descend et affronte le haut du groupe suivant
+    assert pairs == [('A', 'B'), ('C', 'D'), ('E', 'F'), ('G', 'H')]
+
+
+def test_swiss_is_the_tournament_default_when_chosen_at_creation():
+    db = DatabaseManager("file:pairing_swiss?mode=memory&cache=shared")
+    manager = TournamentManager(db)
+    tid = db.create_tournament("Suisse", "doublette", 4, pairing='swiss')
+    assert db.get_tournament(tid)['pairing'] == 'swiss'
+    for i in range(8):
+        db.create_team(tid, f"Équipe {i + 1}", ["a", "b"])
+
+    seen = set()
+    for _ in range(3):
+        matches = manager.generate_next_round(tid)
+        assert len(matches) == 4
+        for match in matches:
+            team1, team2 = match['team1'], match['team2']
+            assert team1['wins'] == team2['wins']  # 8 équipes : groupes toujours pairs
+            pair = frozenset((team1['id'], team2['id']))
+            assert pair not in seen
+            seen.add(pair)
+            manager.update_match_result(match['id'], 13, 5)
+
+
+def test_swiss_bye_goes_to_the_lowest_score_group():
+    db = DatabaseManager("file:pairing_swiss_bye?mode=memory&cache=shared")
+    tid = db.create_tournament("Suisse", "doublette", 4, pairing='swiss')
+    one_win, no_win, *others = db.create_teams_bulk(tid, [(name, ["x"]) for name in "ABCDE"])
+    # 1 victoire mais gros écart négatif : la performance historique la classe dernière
+    db.update_team_stats(one_win, wins=1, losses=2, points_for=13, points_against=38)
+    db.update_team_stats(no_win, wins=0, losses=3, points_for=36, points_against=39)
+    for team_id in others:
+        db.update_team_stats(team_id, wins=2, losses=1, points_for=35, points_against=20)
+    db.update_tournament(tid, current_round=3)
+
+    TournamentManager(db).generate_next_round(tid)
+
+    bye = [m for m in db.get_matches_by_tournament_round(tid, 4) if m['is_bye']]
+    assert [m['team1_id'] for m in bye] == [no_win]
@@ -0,0 +1,109 @@
+import random
+from collections import Counter
+from itertools import combinations
+
+import pytest
+
+from quadrette import QUADRETTE_SPLITS, QuadretteSchedule, round_pattern
+from store import DatabaseManager
+from tournament import TournamentManager
+
+
+def test_splits_share_games_fairly():
+    partners = Counter()
+    sizes = Counter()
+    for split in QUADRETTE_SPLITS:
+        assert sorted(i for group in split for i in group) == [0, 1, 2, 3]
+        for group in split:
+            sizes.update((player, len(group)) for player in group)
+            partners.update(combinations(group, 2))
+    assert set(partners.values()) == {3}
+    assert all(sizes[(player, 3)] == 3 and sizes[(player, 1)] == 1 for player in range(4))
+    assert round_pattern(1) == "ABC vs D" and round_pattern(7) == "BCD vs A"
+
+
+@pytest.mark.parametrize('num_teams', [7, 8, 9, 16, 33])
+def test_schedule_has_no_rematch_and_rotates_byes(num_teams):
+    team_ids = [f"t{i}" for i in range(num_teams)]
+    schedule = QuadretteSchedule.build(team_ids, random.Random(num_teams))
+    seen = set()
+    byes = Counter()
+    for round_number in range(1, 8):
+        pairs = schedule.pairs(round_number)
+        playing = [t for pair in pairs for t in pair if t is not None]
+        assert sorted(playing) == sorted(team_ids)
+        for team1_id, team2_id in pairs:
+            if team2_id is None:
+                byes[team1_id] += 1
+                continue
+            assert frozenset((team1_id, team2_id)) not in seen
+            seen.add(frozenset((team1_id, team2_id)))
+    assert sum(byes.values()) == 7 * (num_teams % 2)
+    assert all(count == 1 for count in byes.values())
+    assert QuadretteSchedule.from_json(schedule.to_json()).pairs(3) == schedule.pairs(3)
+
+
+def test_quadrette_rounds_follow_stored_schedule(tmp_path):
+    path = str(tmp_path / "quadrette.db")
+    db = DatabaseManager(path)
+    tid = db.create_tournament("Q", "quadrette", 4)
+    for i in range(9):
+        db.create_team(tid, f"Équipe {i + 1}", [f"{letter}{i + 1}" for letter in "ABCD"])
+
+    matches = TournamentManager(db).generate_next_round(tid)
+    assert len(matches) == 4
+    assert matches[0]['pattern'] == "ABC vs D"
+    team1, team2 = matches[0]['team1'], matches[0]['team2']
+    assert matches[0]['games'] == [(team1['players'][:3], team2['players'][:3]),
+                                   (team1['players'][3:], team2['players'][3:])]
+    schedule = db.get_quadrette_schedule(tid)
+    db.close()
+
+    # Relu depuis la base par un nouveau gestionnaire, sans nouveau tirage
+    db = DatabaseManager(path)
+    assert db.get_quadrette_schedule(tid).pairs(2) == schedule.pairs(2)
+    manager = TournamentManager(db)
+    for round_number in range(2, 8):
+        matches = manager.generate_next_round(tid)
+        expected = {frozenset(pair) for pair in schedule.pairs(round_number) if pair[1]}
+        assert {frozenset((m['team1']['id'], m['team2']['id'])) for m in matches} == expected
+        assert matches[0]['pattern'] == round_pattern(round_number)
+    assert all(db.get_bye_ledger(tid).count(team_id) <= 1 for team_id in schedule.team_ids)
+
+    with pytest.raises(ValueError):
+        manager.generate_next_round(tid)
+    db.close()
+
+
+@pytest.mark.parametrize('num_teams', [4, 5, 6])
+def test_small_schedule_spreads_rematches_and_byes(num_teams):
+    team_ids = [f"t{i}" for i in range(num_teams)]
+    schedule = QuadretteSchedule.build(team_ids, random.Random(num_teams))
+    meetings = Counter({frozenset(pair): 0 for pair in combinations(team_ids, 2)})
+    byes = Counter({team_id: 0 for team_id in team_ids})
+    for round_number in range(1, 8):
+        pairs = schedule.pairs(round_number)
+        playing = [t for pair in pairs for t in pair if t is not None]
+        assert sorted(playing) == sorted(team_ids)
+        for team1_id, team2_id in pairs:
+            if team2_id is None:
+                byes[team1_id] += 1
+            else:
+                meetings[frozenset((team1_id, team2_id))] += 1
+    assert max(meetings.values()) - min(meetings.values()) <= 1
+    assert max(byes.values()) - min(byes.values()) <= 1
+    assert sum(byes.values()) == 7 * (num_teams % 2)
+
+
+def test_small_quadrette_tournament_plays_all_rounds():
+    db = DatabaseManager("file:small_quadrette?mode=memory&cache=shared")
+    manager = TournamentManager(db)
+    tid = db.create_tournament("Q", "quadrette", 2)
+    for i in range(5):
+        db.create_team(tid, f"Équipe {i + 1}", [f"{letter}{i + 1}" for letter in "ABCD"])
+
+    for round_number in range(1, 8):
+        assert len(manager.generate_next_round(tid)) == 2
+    assert db.get_tournament(tid)['current_round'] == 7
+    byes = [db.get_bye_ledger(tid).count(team['id']) for team in db.get_teams_by_tournament(tid)]
+    assert sorted(byes) == [1, 1, 1, 2, 2]
@@ -0,0 +1,63 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+from response_cache import HIT, MISS, NOT_MODIFIED, ResponseCache, etag_matches  # noqa: E402
+from store import DatabaseManager  # noqa: E402
+
+
+def test_data_version_changes_only_with_the_tournament():
+    db = DatabaseManager("file:data_version?mode=memory&cache=shared")
+    first = db.create_tournament("A", "doublette", 2)
+    other = db.create_tournament("B", "doublette", 2)
+    team1, team2 = db.create_teams_bulk(first, [("A1", []), ("A2", [])])
+    before, other_before = db.get_data_version(first), db.get_data_version(other)
+
+    match_id = db.create_match(first, 1, team1, team2, 1)
+    assert db.get_data_version(first) != before
+    assert db.get_data_version(other) == other_before
+
+    before = db.get_data_version(first)
+    db.update_team(team1, name="A1 bis")
+    assert db.get_data_version(first) != before
+    assert db.get_data_version(other) == other_before
+    before = db.get_data_version(first)
+    db.record_match_results({match_id: (13, 2)})
+    assert db.get_data_version(first) != before
+    assert db.get_data_version("inconnu") is None
+
+
+def test_data_version_sees_writes_from_another_manager(tmp_path):
+    path = str(tmp_path / "shared.db")
+    gui, api = DatabaseManager(path), DatabaseManager(path)
+    tid = gui.create_tournament("A", "doublette", 2)
+    before = api.get_data_version(tid)
+    gui.create_team(tid, "A1", [])
+    assert api.get_data_version(tid) != before
+    gui.close()
+    api.close()
+
+
+def test_lru_eviction_and_metrics():
+    cache = ResponseCache(max_entries=2)
+    cache.put("a", b"1")
+    cache.put("b", b"2")
+    assert cache.get("a") == b"1"
+    cache.put("c", b"3")  # "b" est le moins récemment utilisé
+    assert cache.get("b") is None and len(cache) == 2
+
+    cache.record(MISS, 0.004)
+    cache.record(HIT, 0.001)
+    cache.record(NOT_MODIFIED, 0.001)
+    stats = cache.stats()
+    assert stats["requests"] == 3 and stats["hit_rate"] == 2 / 3
+    assert set(stats["latency"]) == {HIT, MISS, NOT_MODIFIED}
+
+
+def test_etag_matching():
+    assert etag_matches('W/"x.1"', 'W/"x.1"')
+    assert etag_matches('"x.0", "x.1"', 'W/"x.1"')
+    assert etag_matches("*", 'W/"x.1"')
+    assert not etag_matches('W/"x.0"', 'W/"x.1"')
+    assert not etag_matches(None, 'W/"x.1"')
@@ -0,0 +1,78 @@
+import sqlite3
+
+import pytest
+
+from store import DatabaseManager
+from tournament import TournamentManager
+
+
+def test_two_managers_on_one_file_see_each_other(tmp_path):
+    # L'interface et l'API ouvrent le même fichier dans deux processus
+    path = str(tmp_path / "shared.db")
+    gui, api = DatabaseManager(path), DatabaseManager(path)
+    assert api.get_tournament_catalog() == []
+
+    tid = gui.create_tournament("Partagé", "doublette", 2)
+    assert [row['id'] for row in api.get_tournament_catalog()] == [tid]
+    gui.update_tournament(tid, name="Renommé")
+    assert api.get_tournament_catalog()[0]['name'] == "Renommé"
+
+    a, b, c, d = gui.create_teams_bulk(tid, [(name, ["x"]) for name in "ABCD"])
+    assert [row['wins'] for row in api.get_team_standings(tid)] == [0, 0, 0, 0]
+    first = gui.create_matches_bulk(tid, 1, [(a, b, 1), (c, d, 2)])
+    gui.record_match_results({first[0]: (13, 4), first[1]: (13, 9)})
+    assert api.get_team_standings(tid) == api._query_team_standings(tid)
+    assert api.get_team_standings(tid)[0]['wins'] == 1
+
+    assert api.get_head_to_head(tid).have_played(a, b)
+    gui.create_matches_bulk(tid, 2, [(a, c, 1), (b, d, 2)])
+    third = TournamentManager(api).generate_next_round(tid, pairing='matching')
+    assert {frozenset((m['team1']['id'], m['team2']['id'])) for m in third} == {
+        frozenset((a, d)), frozenset((b, c))}
+
+    # Les écritures de l'API restent visibles de l'interface, caches compris
+    assert gui.get_head_to_head(tid).have_played(a, d)
+    api.delete_tournament(tid)
+    assert gui.get_tournament_catalog() == []
+    gui.close()
+    api.close()
+
+
+class _FailingCommit:
+    """Connexion dont la validation échoue (disque plein, verrou perdu…)"""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __getattr__(self, name):
+        return getattr(self.conn, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.conn.rollback()
+        return False
+
+    def commit(self):
+        raise sqlite3.OperationalError("disk I/O error")
+
+
+def test_failed_commit_leaves_cache_version_behind(tmp_path, monkeypatch):
+    path = str(tmp_path / "shared.db")
+    gui, api = DatabaseManager(path), DatabaseManager(path)
+    tid = gui.create_tournament("Partagé", "doublette", 2)
+    team_id = gui.create_team(tid, "A", ["x"])
+    assert gui.get_team_standings(tid)[0]['name'] == "A"
+
+    connect = gui.get_connection
+    monkeypatch.setattr(gui, 'get_connection', lambda: _FailingCommit(connect()))
+    with pytest.raises(sqlite3.OperationalError):
+        gui.update_team(team_id, name="Perdu")
+    monkeypatch.undo()
+
+    # La version que la validation ratée n'a pas écrite est celle de l'autre processus
+    api.update_team(team_id, name="B")
+    assert gui.get_team_standings(tid)[0]['name'] == "B"
+    gui.close()
+    api.close()
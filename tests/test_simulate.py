@@ -0,0 +1,16 @@
+import json
+
+from bench.simulate import load_score_model, simulate
+
+
+def test_simulation_report_counts_byes_and_statements():
+    report = simulate(9, "doublette", 3, "matching", load_score_model("random"), seed=1)
+    json.dumps(report)
+    totals = report["totals"]
+    assert totals["rounds_played"] == 3 and totals["unpaired"] == 0
+    assert totals["byes"] == 3 and sum(totals["bye_distribution"].values()) == 9
+    assert all(r["matches"] == 4 and r["pairing_statements"] > 0 for r in report["rounds"])
+
+
+def test_score_model_from_import_path():
+    assert load_score_model("bench.simulate:close_model").__name__ == "close_model"
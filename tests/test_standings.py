@@ -0,0 +1,53 @@
+import threading
+
+from store import DatabaseManager
+from tournament import TournamentManager
+
+
+def test_standings_follow_score_updates():
+    db = DatabaseManager("file:standings?mode=memory&cache=shared")
+    manager = TournamentManager(db)
+    tid = db.create_tournament("T", "doublette", 2)
+    a, b, c, d = (db.create_team(tid, name, ["x"]) for name in "ABCD")
+    assert len(db.get_team_standings(tid)) == 4
+
+    first, second = db.create_matches_bulk(tid, 1, [(a, b, 1), (c, d, 2)])
+    manager.update_match_result(first, 5, 13)
+    manager.update_match_result(second, 13, 12)
+
+    assert [row['id'] for row in db.get_team_standings(tid)] == [b, c, d, a]
+    assert db.get_team_rank(tid, d) == 3
+    assert db.get_standings_page(tid, 1, 2)[0]['point_difference'] == 1
+    assert db.get_team_standings(tid) == [
+        row for row in db._query_team_standings(tid)
+    ]
+
+    db.update_team(a, name="Z")
+    db.delete_team(c)
+    assert [row['name'] for row in db.get_team_standings(tid)] == ["B", "D", "Z"]
+
+
+def test_concurrent_reload_does_not_apply_a_result_twice():
+    db = DatabaseManager("file:standings_race?mode=memory&cache=shared")
+    tid = db.create_tournament("T", "doublette", 2)
+    team_ids = db.create_teams_bulk(tid, [(f"E{i}", ["x"]) for i in range(20)])
+    match_ids = db.create_matches_bulk(
+        tid, 1, [(team_ids[i], team_ids[i + 1], 1) for i in range(0, 20, 2)])
+    done = threading.Event()
+
+    def reload():
+        while not done.is_set():
+            with db._cache_lock:
+                db._standings.pop(tid, None)
+            db.get_team_standings(tid)
+        db.release_connection()
+
+    reader = threading.Thread(target=reload)
+    reader.start()
+    try:
+        for score in range(200):
+            db.record_match_results({match_id: (13, score % 13) for match_id in match_ids})
+    finally:
+        done.set()
+        reader.join()
+    assert db.get_team_standings(tid) == db._query_team_standings(tid)
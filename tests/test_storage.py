@@ -0,0 +1,44 @@
+import asyncio
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+from storage import SqliteStorage, Storage, create_storage  # noqa: E402
+from store import DatabaseManager  # noqa: E402
+
+
+def test_sqlite_storage_shares_the_tournament_database():
+    db = DatabaseManager("file:storage?mode=memory&cache=shared")
+    storage = create_storage("sqlite", db, asyncio.to_thread)
+    assert isinstance(storage, SqliteStorage)
+
+    async def scenario():
+        await storage.insert_status_check(
+            {"id": "1", "client_name": "terrain 4", "timestamp": datetime(2026, 5, 1, 9, 30)})
+        return await storage.list_status_checks()
+
+    checks = asyncio.run(scenario())
+    assert checks == [{"id": "1", "client_name": "terrain 4", "timestamp": "2026-05-01T09:30:00"}]
+    # Même fichier que les tournois : une seconde instance relit les données
+    assert asyncio.run(SqliteStorage(db, asyncio.to_thread).list_status_checks()) == checks
+
+
+def test_invalid_configuration_is_rejected():
+    db = DatabaseManager("file:storage_config?mode=memory&cache=shared")
+    with pytest.raises(ValueError):
+        create_storage("mongo", db, asyncio.to_thread)
+    with pytest.raises(ValueError):
+        create_storage("redis", db, asyncio.to_thread)
+
+
+def test_incomplete_backend_fails_when_created():
+    class WriteOnlyStorage(Storage):
+        async def insert_status_check(self, check):
+            pass
+
+    with pytest.raises(TypeError):
+        WriteOnlyStorage()
@@ -0,0 +1,49 @@
+import pytest
+
+from store import DatabaseManager
+from tournament import TournamentManager
+
+
+def test_submit_round_results_is_all_or_nothing():
+    db = DatabaseManager("file:submit_round?mode=memory&cache=shared")
+    manager = TournamentManager(db)
+    tid = db.create_tournament("T", "doublette", 2)
+    for name in "ABCD":
+        db.create_team(tid, name, ["x"])
+    first, second = [m['id'] for m in manager.generate_next_round(tid)]
+
+    with pytest.raises(ValueError):
+        manager.submit_round_results(tid, 1, {first: (13, 4), second: (-1, 13)})
+    assert all(m['status'] == 'pending' for m in db.get_matches_by_tournament_round(tid, 1))
+
+    assert manager.submit_round_results(tid, 1, {first: (13, 4), second: (7, 13)}) == 2
+    assert manager.submit_round_results(tid, 1, {first: (13, 4)}) == 1
+    teams = db.get_teams_by_tournament(tid)
+    assert sum(t['wins'] for t in teams) == 2
+    assert sum(t['points_for'] for t in teams) == 37
+
+    with pytest.raises(ValueError):
+        manager.submit_round_results(tid, 2, {first: (13, 0)})
+
+
+def test_bool_scores_and_bye_matches_are_rejected():
+    db = DatabaseManager("file:submit_round_bye?mode=memory&cache=shared")
+    manager = TournamentManager(db)
+    tid = db.create_tournament("T", "doublette", 2)
+    for name in "ABC":
+        db.create_team(tid, name, ["x"])
+    manager.generate_next_round(tid)
+    matches = db.get_matches_by_tournament_round(tid, 1)
+    bye = next(m['id'] for m in matches if m['team1_id'] == m['team2_id'])
+    played = next(m['id'] for m in matches if m['id'] != bye)
+
+    with pytest.raises(ValueError):
+        manager.submit_round_results(tid, 1, {played: (True, False)})
+    with pytest.raises(ValueError):
+        manager.submit_round_results(tid, 1, {bye: (0, 13)})
+    with pytest.raises(ValueError):
+        db.record_match_results({played: (13, True)})
+    with pytest.raises(ValueError):
+        db.record_match_results({played: (13, 7), bye: (0, 13)})
+    assert db.get_matches_by_tournament_round(tid, 1) == matches
+    assert sum(t['wins'] for t in db.get_teams_by_tournament(tid)) == 1
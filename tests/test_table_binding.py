@@ -0,0 +1,94 @@
+import random
+
+from widgets.table_binding import TreeviewBinding, diff_rows
+
+
+class FakeTree:
+    """Modèle minimal d'un ttk.Treeview à un seul niveau"""
+
+    def __init__(self):
+        self.children = []
+        self.items = {}
+        self.calls = 0
+        self.lookups = 0
+
+    def insert(self, parent, index, iid, values, tags):
+        self.calls += 1
+        self.items[iid] = (values, tags)
+        self.children.insert(len(self.children) if index == 'end' else index, iid)
+
+    def delete(self, *iids):
+        self.calls += 1
+        for iid in iids:
+            self.children.remove(iid)
+            del self.items[iid]
+
+    def detach(self, iid):
+        self.calls += 1
+        self.children.remove(iid)
+
+    def move(self, iid, parent, index):
+        self.calls += 1
+        self.children.insert(len(self.children) if index == 'end' else index, iid)
+
+    def index(self, iid):
+        self.lookups += 1
+        return self.children.index(iid)
+
+    def item(self, iid, values, tags):
+        self.calls += 1
+        self.items[iid] = (values, tags)
+
+    def set_children(self, parent, *iids):
+        self.calls += 1
+        self.children = list(iids)
+
+
+def rows(data):
+    return [(iid, (iid, score), ()) for iid, score in data]
+
+
+def test_single_score_change_touches_one_row():
+    tree = FakeTree()
+    binding = TreeviewBinding(tree)
+    data = [(f"t{i}", 0) for i in range(3000)]
+    binding.sync(rows(data))
+
+    tree.calls = 0
+    data[1500] = ("t1500", 13)
+    diff = binding.sync(rows(data))
+    assert diff.updated == ["t1500"] and not diff.moved
+    assert tree.calls == 1
+
+
+def test_sync_matches_target_order():
+    rng = random.Random(1)
+    tree = FakeTree()
+    binding = TreeviewBinding(tree)
+    ids = [f"t{i}" for i in range(60)]
+    for _ in range(50):
+        target = rng.sample(ids, rng.randint(0, 60))
+        if rng.random() < 0.5:
+            target.sort()
+        data = [(iid, rng.randint(0, 2)) for iid in target]
+        binding.sync(rows(data))
+        assert tree.children == target
+        assert [tree.items[iid][0] for iid in target] == [(iid, s) for iid, s in data]
+
+
+def test_diff_moves_only_displaced_rows():
+    old = ["a", "b", "c", "d"]
+    diff = diff_rows(old, {i: 0 for i in old}, ["b", "c", "d", "a"], {i: 0 for i in old})
+    assert diff.moved == {"a"}
+
+
+def test_filling_new_rows_does_not_look_up_positions():
+    tree = FakeTree()
+    binding = TreeviewBinding(tree)
+    data = [(f"t{i}", 0) for i in range(2000)]
+    binding.sync(rows(data[:10]))
+    binding.sync(rows(data))
+    binding.clear()
+    binding.sync(rows(data))
+    assert tree.lookups == 0
+    assert tree.children == [iid for iid, _ in data]
@@ -0,0 +1,43 @@
+import threading
+import time
+
+from widgets.task_executor import TaskExecutor
+
+
+class FakeRoot:
+    """Remplace tk.Tk : les callbacks `after` sont exécutés par pump()"""
+
+    def __init__(self):
+        self.callbacks = []
+        self.errors = []
+
+    def after(self, delay, callback):
+        self.callbacks.append(callback)
+
+    def report_callback_exception(self, exc_type, exc, tb):
+        self.errors.append(exc)
+
+    def pump(self, timeout=2.0):
+        deadline = time.monotonic() + timeout
+        while self.callbacks and time.monotonic() < deadline:
+            self.callbacks.pop(0)()
+            time.sleep(0.01)
+
+
+def test_callbacks_run_on_the_polling_thread():
+    root = FakeRoot()
+    busy = []
+    executor = TaskExecutor(root, on_busy_change=busy.append)
+    results, errors = [], []
+
+    executor.submit(threading.get_ident, on_success=results.append, description="Calcul")
+    executor.submit(lambda: 1 / 0, on_error=errors.append)
+    executor.submit(lambda: 1 / 0)
+    root.pump()
+    executor.shutdown()
+
+    assert results and results[0] != threading.get_ident()
+    assert isinstance(errors[0], ZeroDivisionError)
+    assert isinstance(root.errors[0], ZeroDivisionError)
+    assert busy[0] == "Calcul" and busy[-1] is None
+    assert not executor.busy
@@ -0,0 +1,16 @@
+from store import DatabaseManager
+
+
+def test_tournament_catalog_follows_changes():
+    db = DatabaseManager("file:tournament_catalog?mode=memory&cache=shared")
+    first = db.create_tournament("A", "doublette", 2)
+    assert [t['id'] for t in db.get_tournament_catalog()] == [first]
+
+    second = db.create_tournament("B", "triplette", 4)
+    db.update_tournament(first, name="A bis")
+    catalog = db.get_tournament_catalog()
+    assert [t['id'] for t in catalog] == [second, first]
+    assert catalog[1]['name'] == "A bis"
+
+    db.delete_tournament(second)
+    assert [t['id'] for t in db.get_tournament_catalog()] == [first]
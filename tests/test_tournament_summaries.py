@@ -0,0 +1,10 @@
+from store import DatabaseManager
+
+
+def test_tournament_summaries_match_full_listing():
+    db = DatabaseManager("file:tournament_summaries?mode=memory&cache=shared")
+    db.create_tournament("A", "doublette", 2)
+    db.create_tournament("B", "triplette", 4)
+    summaries = db.get_tournament_summaries()
+    assert [s['id'] for s in summaries] == [t['id'] for t in db.get_all_tournaments()]
+    assert set(summaries[0]) == {'id', 'name', 'type'}
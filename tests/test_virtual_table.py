@@ -0,0 +1,31 @@
+from store import DatabaseManager
+from widgets.virtual_table import PagedSource, RowWindow
+
+
+def test_row_window_fetches_pages_around_visible_rows():
+    db = DatabaseManager("file:virtual_table?mode=memory&cache=shared")
+    tid = db.create_tournament("T", "doublette", 2)
+    db.create_teams_bulk(tid, [(f"Équipe {i:03d}", []) for i in range(200)])
+
+    source = PagedSource(
+        lambda: db.count_teams(tid),
+        lambda offset, limit, key, desc: [
+            (t['id'], (t['name'],), ()) for t in
+            db.get_teams_page(tid, offset, limit, key or 'name', desc)])
+    window = RowWindow(source, visible=10, buffer=20)
+
+    assert window.total == 200
+    assert [r[1][0] for r in window.rows()][:2] == ["Équipe 000", "Équipe 001"]
+    window.scroll_to(15)
+    assert window.rows()[0][1][0] == "Équipe 015"
+    assert window.fetch_count == 1  # Encore dans la marge chargée
+
+    window.scroll_to(1000)
+    assert window.offset == 190
+    assert window.rows()[-1][1][0] == "Équipe 199"
+    assert window.fetch_count == 2
+
+    window.sort_key, window.descending = 'name', True
+    window.offset = 0
+    window.invalidate()
+    assert window.rows()[0][1][0] == "Équipe 199"
@@ -0,0 +1,114 @@
+import sqlite3
+import threading
+import time
+
+import pytest
+
+import store
+from store import DURABILITY_TIMED, DatabaseManager, WriteQueue
+
+
+def make_round(db, count):
+    tid = db.create_tournament("File", "doublette", 4)
+    team_ids = db.create_teams_bulk(tid, [(f"E{i}", []) for i in range(2 * count)])
+    match_ids = db.create_matches_bulk(
+        tid, 1, [(team_ids[i], team_ids[i + 1], i // 2 + 1) for i in range(0, 2 * count, 2)])
+    return tid, match_ids
+
+
+def test_results_from_concurrent_writers_share_transactions(tmp_path):
+    db = DatabaseManager(str(tmp_path / "queue.db"))
+    tid, match_ids = make_round(db, 40)
+    writes = WriteQueue(db, max_delay=0.02)
+
+    futures = []
+    lock = threading.Lock()
+
+    def writer(ids):
+        for match_id in ids:
+            future = writes.submit_result(match_id, 13, 7)
+            with lock:
+                futures.append(future)
+
+    threads = [threading.Thread(target=writer, args=(match_ids[i::8],)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert all(future.result(5)["status"] == "pending" for future in futures)
+    writes.close()
+
+    assert writes.results_committed == 40 and writes.batches < 40
+    assert sum(team["wins"] for team in db.get_team_standings(tid)) == 40
+
+
+def test_timed_durability_syncs_batches_together(tmp_path):
+    db = DatabaseManager(str(tmp_path / "timed.db"))
+    tid, match_ids = make_round(db, 4)
+    writes = WriteQueue(db, max_delay=0, durability=DURABILITY_TIMED, sync_interval=0.05)
+
+    # Les écritures restent dans l'ordre de soumission, scores compris
+    renamed = writes.submit(db.update_team, db.get_teams_by_tournament(tid)[0]["id"], name="Z")
+    futures = [writes.submit_result(match_id, 13, 0) for match_id in match_ids]
+    missing = writes.submit_result("inconnu", 13, 0)
+    assert renamed.result(5) is None and missing.result(5) is None
+    assert all(future.result(5) is not None for future in futures)
+    assert writes.syncs >= 1
+    writes.close()
+
+    with pytest.raises(ValueError):
+        WriteQueue(db, durability="jamais")
+
+
+def test_close_answers_every_submission(tmp_path):
+    db = DatabaseManager(str(tmp_path / "close.db"))
+    tid, match_ids = make_round(db, 2)
+    writes = WriteQueue(db)
+    # Le thread d'écriture est occupé : l'arrêt et la soumission suivante attendent ensemble
+    busy = writes.submit(time.sleep, 0.1)
+    closer = threading.Thread(target=writes.close)
+    closer.start()
+    time.sleep(0.02)
+    late = writes.submit_result(match_ids[0], 13, 0)
+    closer.join()
+
+    assert busy.result(1) is None
+    with pytest.raises(RuntimeError):
+        late.result(1)
+    with pytest.raises(RuntimeError):
+        writes.submit_result(match_ids[1], 13, 0).result(1)
+
+
+def test_failed_sync_fails_its_batch_and_keeps_the_writer(tmp_path, monkeypatch):
+    db = DatabaseManager(str(tmp_path / "sync.db"))
+    tid, match_ids = make_round(db, 2)
+    writes = WriteQueue(db, durability=DURABILITY_TIMED, sync_interval=0)
+
+    def broken(conn):
+        raise OSError("disque plein")
+
+    monkeypatch.setattr(writes, "_flush_wal", broken)
+    with pytest.raises(OSError):
+        writes.submit_result(match_ids[0], 13, 0).result(1)
+    monkeypatch.undo()
+    assert writes.submit_result(match_ids[1], 13, 0).result(1) is not None
+    writes.close()
+
+
+def test_incomplete_checkpoint_syncs_the_wal(tmp_path, monkeypatch):
+    path = str(tmp_path / "wal.db")
+    db = DatabaseManager(path)
+    tid, match_ids = make_round(db, 1)
+    # Un lecteur garde un instantané ouvert : le point de contrôle ne peut pas tout recopier
+    reader = sqlite3.connect(path)
+    reader.execute('BEGIN')
+    reader.execute('SELECT COUNT(*) FROM matches').fetchone()
+    synced = []
+    monkeypatch.setattr(store.os, "fsync", lambda fd: synced.append(fd))
+
+    writes = WriteQueue(db, durability=DURABILITY_TIMED, sync_interval=0)
+    assert writes.submit_result(match_ids[0], 13, 0).result(1) is not None
+    writes.close()
+    reader.rollback()
+    reader.close()
+    assert synced
@@ -5,32 +5,55 @@ Gère les algorithmes d'appariement et la génération des tours
 
 import random
 from typing import List, Dict, Tuple, Optional
-from store import db_manager
+import store
+from store import DatabaseManager
+from pairing import MatchingPairingEngine, SwissPairingEngine
+from quadrette import QUADRETTE_ROUNDS, QuadretteSchedule, round_compositions, round_pattern
+
+# Méthodes d'appariement des tournois standard
+PAIRING_METHODS = ('adjacent', 'matching', 'swiss')
+
+
+def _is_score(value) -> bool:
+    """Un score est un entier ; True et False, des int pour Python, n'en sont pas"""
+    return isinstance(value, int) and not isinstance(value, bool)
 
 class TournamentManager:
     """Gestionnaire de la logique de tournoi"""
     
-    def __init__(self):
-        pass
+    def __init__(self, db: Optional[DatabaseManager] = None):
+        self.db = db if db is not None else store.db_manager
     
-    def generate_next_round(self, tournament_id: str) -> List[Dict]:
-        """Génère le tour suivant pour un tournoi"""
-        tournament = db_manager.get_tournament(tournament_id)
+    def generate_next_round(self, tournament_id: str, pairing: Optional[str] = None) -> List[Dict]:
+        """Génère le tour suivant pour un tournoi
+
+        ``pairing`` choisit l'appariement des tournois standard : 'adjacent'
+        (équipes voisines au classement), 'matching' (couplage de coût minimal)
+        ou 'swiss' (système suisse par groupes de victoires). Par défaut, celui
+        choisi à la création du tournoi.
+        """
+        if pairing is not None and pairing not in PAIRING_METHODS:
+            raise ValueError(f"Méthode d'appariement inconnue: {pairing}")
+        
+        tournament = self.db.get_tournament(tournament_id)
         if not tournament:
             raise ValueError("Tournoi introuvable")
+        if pairing is None:
+            pairing = tournament.get('pairing') or 'adjacent'
         
         tournament_type = tournament['type']
         current_round = tournament['current_round']
         next_round = current_round + 1
         
         # Récupérer les équipes et leurs statistiques
-        teams = db_manager.get_teams_by_tournament(tournament_id)
+        teams = self.db.get_teams_by_tournament(tournament_id)
         if len(teams) < 2:
             raise ValueError("Au moins 2 équipes sont nécessaires")
         
         # Générer les matchs selon le type de tournoi
         if tournament_type in ['tete_a_tete', 'doublette', 'triplette']:
-            matches = self._generate_standard_matches(tournament_id, teams, next_round, tournament['num_courts'])
+            matches = self._generate_standard_matches(tournament_id, teams, next_round,
+                                                      tournament['num_courts'], pairing)
         elif tournament_type == 'quadrette':
             matches = self._generate_quadrette_matches(tournament_id, teams, next_round, tournament['num_courts'])
         elif tournament_type == 'melee':
@@ -38,56 +61,61 @@ class TournamentManager:
         else:
             raise ValueError(f"Type de tournoi non supporté: {tournament_type}")
         
-        # Mettre à jour le tour actuel
-        db_manager.update_tournament(tournament_id, current_round=next_round)
+        # Enregistrer le tour complet et le tour actuel en une seule transaction
+        pairings = []
+        for match in matches:
+            pairing = (match['team1']['id'], match['team2']['id'], match['court'])
+            if match.get('bye'):
+                pairing += match['score']
+            pairings.append(pairing)
+        match_ids = self.db.create_matches_bulk(tournament_id, next_round, pairings)
+        for match, match_id in zip(matches, match_ids):
+            match['id'] = match_id
         
-        return matches
+        return [match for match in matches if not match.get('bye')]
     
     def _generate_standard_matches(self, tournament_id: str, teams: List[Dict], 
-                                 round_number: int, num_courts: int) -> List[Dict]:
-        """Génère les matchs pour les tournois standard (tête-à-tête, doublette, triplette)"""
+                                 round_number: int, num_courts: int,
+                                 pairing: str = 'adjacent') -> List[Dict]:
+        """Génère les matchs pour les tournois standard (tête-à-tête, doublette, triplette)
+
+        Les matchs sont retournés sans être enregistrés ; generate_next_round
+        les insère en bloc.
+        """
         # Calculer les performances des équipes
-        team_performances = []
-        for team in teams:
-            wins = team.get('wins', 0)
-            losses = team.get('losses', 0)
-            points_for = team.get('points_for', 0)
-            points_against = team.get('points_against', 0)
-            
-            # Performance = différence de points pondérée par le ratio victoires/défaites
-            total_games = wins + losses
-            win_ratio = wins / total_games if total_games > 0 else 0
-            point_diff = points_for - points_against
-            performance = point_diff + (win_ratio * 50)  # Bonus pour les victoires
-            
-            team_performances.append((team, performance))
+        team_performances = [(team, self._team_performance(team)) for team in teams]
         
         # Trier par performance
         team_performances.sort(key=lambda x: x[1], reverse=True)
         
+        matches = []
+        
         # Gérer le nombre impair d'équipes (BYE)
         if len(teams) % 2 == 1:
-            if round_number == 1:
-                # Premier tour : BYE aléatoire
-                bye_team = random.choice(teams)
-            else:
-                # Tours suivants : BYE pour l'équipe la moins bien classée
-                bye_team = team_performances[-1][0]
-            
-            # Créer un match BYE (victoire 13-7)
-            bye_match_id = db_manager.create_match(tournament_id, round_number, 
-                                                 bye_team['id'], bye_team['id'], None)
-            db_manager.update_match_score(bye_match_id, 13, 7)
+            bye_team = self._choose_bye_team(tournament_id, team_performances, round_number,
+                                             pairing)
             
-            # Mettre à jour les stats de l'équipe
-            self._update_team_stats_after_match(bye_team['id'], 13, 7, bye_team['id'], 13, 7)
+            # Match BYE (victoire 13-7), statistiques mises à jour à l'insertion
+            matches.append({
+                'team1': bye_team,
+                'team2': bye_team,
+                'court': None,
+                'bye': True,
+                'score': (13, 7)
+            })
             
             # Retirer l'équipe BYE de la liste
             teams = [t for t in teams if t['id'] != bye_team['id']]
             team_performances = [tp for tp in team_performances if tp[0]['id'] != bye_team['id']]
         
+        if pairing == 'matching':
+            matches.extend(self._pair_by_matching(tournament_id, team_performances, num_courts))
+            return matches
+        if pairing == 'swiss':
+            matches.extend(self._pair_by_swiss(tournament_id, teams, num_courts))
+            return matches
+        
         # Apparier les équipes
-        matches = []
         used_teams = set()
         court = 1
         
@@ -102,10 +130,7 @@ class TournamentManager:
             if team1['id'] not in used_teams and team2['id'] not in used_teams:
                 # Vérifier qu'ils ne se sont pas déjà rencontrés
                 if not self._have_teams_played(tournament_id, team1['id'], team2['id']):
-                    match_id = db_manager.create_match(tournament_id, round_number,
-                                                     team1['id'], team2['id'], court)
                     matches.append({
-                        'id': match_id,
                         'team1': team1,
                         'team2': team2,
                         'court': court
@@ -116,49 +141,121 @@ class TournamentManager:
         
         return matches
     
+    def _choose_bye_team(self, tournament_id: str,
+                         team_performances: List[Tuple[Dict, float]], round_number: int,
+                         pairing: str = 'adjacent') -> Dict:
+        """Choisit l'équipe exemptée parmi celles qui ont reçu le moins de BYE
+
+        Aucune équipe ne reçoit un second BYE tant qu'une autre n'en a eu aucun.
+        Parmi les candidates : tirage au premier tour, puis la moins bien classée
+        (en système suisse : moins de victoires, puis différence de points et
+        points marqués les plus faibles, soit le groupe de score le plus bas).
+        """
+        ledger = self.db.get_bye_ledger(tournament_id)
+        fewest = min(ledger.count(team['id']) for team, _ in team_performances)
+        candidates = [team for team, _ in team_performances if ledger.count(team['id']) == fewest]
+        if round_number == 1:
+            return random.choice(candidates)
+        if pairing == 'swiss':
+            return min(candidates, key=lambda team: (
+                team.get('wins', 0), team.get('points_for', 0) - team.get('points_against', 0),
+                team.get('points_for', 0)))
+        return candidates[-1]
+    
+    def _team_performance(self, team: Dict) -> float:
+        """Performance = différence de points pondérée par le ratio victoires/défaites"""
+        wins = team.get('wins', 0)
+        losses = team.get('losses', 0)
+        total_games = wins + losses
+        win_ratio = wins / total_games if total_games > 0 else 0
+        point_diff = team.get('points_for', 0) - team.get('points_against', 0)
+        return point_diff + (win_ratio * 50)  # Bonus pour les victoires
+    
+    def _pair_by_matching(self, tournament_id: str, team_performances: List[Tuple[Dict, float]],
+                          num_courts: int) -> List[Dict]:
+        """Apparie les équipes par couplage de coût minimal (revanches en dernier recours)"""
+        teams_by_id = {team['id']: team for team, _ in team_performances}
+        performances = {team['id']: performance for team, performance in team_performances}
+        head_to_head = self.db.get_head_to_head(tournament_id)
+        
+        pairs, _ = MatchingPairingEngine().pair(list(performances), performances,
+                                                 head_to_head.have_played)
+        matches = []
+        for i, (team1_id, team2_id) in enumerate(pairs):
+            matches.append({
+                'team1': teams_by_id[team1_id],
+                'team2': teams_by_id[team2_id],
+                'court': (i % num_courts) + 1
+            })
+        return matches
+    
+    def _pair_by_swiss(self, tournament_id: str, teams: List[Dict], num_courts: int) -> List[Dict]:
+        """Apparie les équipes par groupes de victoires (système suisse), sans revanche"""
+        teams_by_id = {team['id']: team for team in teams}
+        wins = {team['id']: team.get('wins', 0) for team in teams}
+        # Départage dans un groupe : différence de points, puis points marqués
+        tiebreaks = {team['id']: (team.get('points_for', 0) - team.get('points_against', 0),
+                                  team.get('points_for', 0)) for team in teams}
+        head_to_head = self.db.get_head_to_head(tournament_id)
+        
+        pairs, _ = SwissPairingEngine().pair(list(wins), wins, head_to_head.have_played,
+                                             tiebreaks)
+        return [{
+            'team1': teams_by_id[team1_id],
+            'team2': teams_by_id[team2_id],
+            'court': (i % num_courts) + 1
+        } for i, (team1_id, team2_id) in enumerate(pairs)]
+    
     def _generate_quadrette_matches(self, tournament_id: str, teams: List[Dict], 
                                   round_number: int, num_courts: int) -> List[Dict]:
-        """Génère les matchs pour les tournois quadrette (planning fixe sur 7 tours)"""
-        if round_number > 7:
+        """Génère les matchs pour les tournois quadrette (planning fixe sur 7 tours)
+
+        Le planning complet (adversaires et sous-équipes) est tiré au premier
+        tour puis enregistré ; les tours suivants le relisent tel quel. Chaque
+        match porte ses parties (``games``) : sous-équipes face à face.
+        """
+        if round_number > QUADRETTE_ROUNDS:
             raise ValueError("Le tournoi quadrette ne peut avoir plus de 7 tours")
         
-        # Planning fixe des 7 tours de quadrette
-        round_patterns = {
-            1: "ABC vs D",     # Groupe ABC contre joueur D
-            2: "AB vs CD",     # AB contre CD
-            3: "ABD vs C",     # ABD contre C
-            4: "AC vs BD",     # AC contre BD
-            5: "ACD vs B",     # ACD contre B
-            6: "AD vs BC",     # AD contre BC
-            7: "BCD vs A"      # BCD contre A
-        }
+        schedule = self.db.get_quadrette_schedule(tournament_id)
+        if schedule is None:
+            schedule = QuadretteSchedule.build([team['id'] for team in teams])
+            self.db.save_quadrette_schedule(tournament_id, schedule)
+        teams_by_id = {team['id']: team for team in teams}
+        if teams_by_id.keys() - set(schedule.team_ids):
+            raise ValueError("Des équipes ont été ajoutées après le début du tournoi quadrette")
         
-        pattern = round_patterns[round_number]
+        pattern = round_pattern(round_number)
         matches = []
         court = 1
-        
-        # Pour chaque équipe de 4 joueurs, créer les sous-équipes selon le pattern
-        i = 0
-        while i < len(teams) - 1:
-            team1 = teams[i]
-            team2 = teams[i + 1] if i + 1 < len(teams) else None
-            
+        for team1_id, team2_id in schedule.pairs(round_number):
+            # Une équipe supprimée depuis le tirage laisse son adversaire exempté
+            team1 = teams_by_id.get(team1_id)
+            team2 = teams_by_id.get(team2_id)
+            if team1 is None:
+                team1, team2 = team2, None
+            if team1 is None:
+                continue
             if team2 is None:
-                break
-                
-            # Créer le match selon le pattern du tour
-            match_id = db_manager.create_match(tournament_id, round_number,
-                                             team1['id'], team2['id'], court)
+                matches.append({
+                    'team1': team1,
+                    'team2': team1,
+                    'court': None,
+                    'bye': True,
+                    'score': (13, 7),
+                    'pattern': pattern
+                })
+                continue
+            
             matches.append({
-                'id': match_id,
                 'team1': team1,
                 'team2': team2,
                 'court': court,
-                'pattern': pattern
+                'pattern': pattern,
+                'games': list(zip(round_compositions(team1['players'], round_number),
+                                  round_compositions(team2['players'], round_number)))
             })
-            
             court = (court % num_courts) + 1
-            i += 2
         
         return matches
     
@@ -185,10 +282,7 @@ class TournamentManager:
             if team2 is None:
                 break
                 
-            match_id = db_manager.create_match(tournament_id, round_number,
-                                             team1['id'], team2['id'], court)
             matches.append({
-                'id': match_id,
                 'team1': team1,
                 'team2': team2,
                 'court': court
@@ -200,100 +294,64 @@ class TournamentManager:
         return matches
     
     def _have_teams_played(self, tournament_id: str, team1_id: str, team2_id: str) -> bool:
-        """Vérifie si deux équipes se sont déjà rencontrées"""
-        with db_manager.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT COUNT(*) FROM matches 
-                WHERE tournament_id = ? AND (
-                    (team1_id = ? AND team2_id = ?) OR 
-                    (team1_id = ? AND team2_id = ?)
-                )
-            ''', (tournament_id, team1_id, team2_id, team2_id, team1_id))
-            count = cursor.fetchone()[0]
-            return count > 0
+        """Vérifie si deux équipes se sont déjà rencontrées (historique en mémoire)"""
+        return self.db.get_head_to_head(tournament_id).have_played(team1_id, team2_id)
     
     def update_match_result(self, match_id: str, team1_score: int, team2_score: int):
-        """Met à jour le résultat d'un match et les statistiques des équipes"""
-        # Récupérer les informations du match
-        with db_manager.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('SELECT team1_id, team2_id FROM matches WHERE id = ?', (match_id,))
-            row = cursor.fetchone()
-            if not row:
-                raise ValueError("Match introuvable")
-            
-            team1_id, team2_id = row
-        
-        # Mettre à jour le score du match
-        db_manager.update_match_score(match_id, team1_score, team2_score)
-        
-        # Mettre à jour les statistiques des équipes
-        self._update_team_stats_after_match(team1_id, team1_score, team2_score, 
-                                          team2_id, team2_score, team1_score)
+        """Met à jour le résultat d'un match et les statistiques des équipes
+
+        Corriger un score déjà saisi remplace l'ancien résultat dans les
+        statistiques au lieu de s'y ajouter.
+        """
+        if self.db.record_match_result(match_id, team1_score, team2_score) is None:
+            raise ValueError("Match introuvable")
     
-    def _update_team_stats_after_match(self, team1_id: str, team1_score: int, team2_score: int,
-                                     team2_id: str, team2_score_for_team2: int, team1_score_for_team2: int):
-        """Met à jour les statistiques des équipes après un match"""
-        # Récupérer les stats actuelles des équipes
-        with db_manager.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # Team 1
-            cursor.execute('SELECT wins, losses, points_for, points_against FROM teams WHERE id = ?', (team1_id,))
-            team1_stats = cursor.fetchone()
-            
-            # Team 2 
-            cursor.execute('SELECT wins, losses, points_for, points_against FROM teams WHERE id = ?', (team2_id,))
-            team2_stats = cursor.fetchone()
-            
-            if not team1_stats or not team2_stats:
-                return
-            
-            # Calcul des nouvelles statistiques
-            team1_wins = team1_stats[0]
-            team1_losses = team1_stats[1]
-            team1_points_for = team1_stats[2] + team1_score
-            team1_points_against = team1_stats[3] + team2_score
-            
-            team2_wins = team2_stats[0]
-            team2_losses = team2_stats[1]
-            team2_points_for = team2_stats[2] + team2_score_for_team2
-            team2_points_against = team2_stats[3] + team1_score_for_team2
-            
-            # Déterminer le vainqueur
-            if team1_score > team2_score:
-                team1_wins += 1
-                team2_losses += 1
-            elif team2_score > team1_score:
-                team2_wins += 1
-                team1_losses += 1
-            # Égalité = pas de changement dans wins/losses
-            
-            # Mettre à jour les stats
-            db_manager.update_team_stats(team1_id, team1_wins, team1_losses, 
-                                       team1_points_for, team1_points_against)
-            db_manager.update_team_stats(team2_id, team2_wins, team2_losses, 
-                                       team2_points_for, team2_points_against)
+    def submit_round_results(self, tournament_id: str, round_number: int,
+                             results: Dict[str, Tuple[int, int]]) -> int:
+        """Valide puis enregistre tous les résultats d'un tour en une transaction
+
+        ``results`` associe chaque identifiant de match à (score1, score2).
+        Aucun résultat n'est enregistré si l'un d'eux est invalide. Retourne
+        le nombre de matchs mis à jour.
+        """
+        round_matches = {m['id']: m for m in
+                         self.db.get_matches_by_tournament_round(tournament_id, round_number)}
+        errors = []
+        for match_id, scores in results.items():
+            match = round_matches.get(match_id)
+            if match is None:
+                errors.append(f"Match {match_id} absent du tour {round_number}")
+                continue
+            if match['is_bye']:
+                errors.append(f"{match['team1_name']}: un BYE ne reçoit pas de score")
+                continue
+            if (len(scores) != 2 or not all(_is_score(score) for score in scores)
+                    or min(scores) < 0):
+                errors.append(f"{match['team1_name']} - {match['team2_name']}: "
+                              f"score invalide {scores}")
+        if errors:
+            raise ValueError("\n".join(errors))
+        
+        return len(self.db.record_match_results(results))
     
     def get_tournament_status(self, tournament_id: str) -> Dict:
         """Retourne le statut actuel du tournoi"""
-        tournament = db_manager.get_tournament(tournament_id)
+        tournament = self.db.get_tournament(tournament_id)
         if not tournament:
             return {}
         
-        teams = db_manager.get_teams_by_tournament(tournament_id)
+        teams = self.db.get_teams_by_tournament(tournament_id)
         current_round = tournament['current_round']
         
         # Récupérer les matchs du tour actuel s'il existe
         current_matches = []
         if current_round > 0:
-            current_matches = db_manager.get_matches_by_tournament_round(tournament_id, current_round)
+            current_matches = self.db.get_matches_by_tournament_round(tournament_id, current_round)
         
         return {
             'tournament': tournament,
             'teams': teams,
             'current_round': current_round,
             'current_matches': current_matches,
-            'standings': db_manager.get_team_standings(tournament_id)
+            'standings': self.db.get_team_standings(tournament_id)
         }
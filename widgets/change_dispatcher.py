@@ -0,0 +1,90 @@
+"""
+Distribution des notifications de la base aux widgets tkinter
+Regroupe les rafales d'évènements en un seul rafraîchissement par cycle Tk
+"""
+
+import queue
+import threading
+from typing import Callable, Collection, Iterable, List, Optional
+
+from events import TOURNAMENT_DELETED, ChangeEvent, EventBus
+
+
+def affects(events: Iterable[ChangeEvent], tournament_id: Optional[str], kinds: Collection[str],
+            shows: Optional[Callable[[Iterable[str]], bool]] = None) -> bool:
+    """Indique si l'un des évènements concerne le tournoi affiché
+
+    Un évènement dont le tournoi est inconnu compte seulement si ``shows(ids)``
+    est vrai (lignes affichées), ou toujours si ``shows`` n'est pas fourni.
+    """
+    for event in events:
+        if event.kind not in kinds:
+            continue
+        if event.tournament_id == tournament_id:
+            return True
+        if event.tournament_id is None and (shows is None or shows(event.ids)):
+            return True
+    return False
+
+
+def tournament_deleted(events: Iterable[ChangeEvent], tournament_id: Optional[str]) -> bool:
+    """Indique si le tournoi affiché a été supprimé"""
+    return any(event.kind == TOURNAMENT_DELETED and event.tournament_id == tournament_id
+               for event in events)
+
+
+class ChangeDispatcher:
+    """Relais entre le bus d'évènements et la boucle Tk.
+
+    Les évènements peuvent être publiés depuis n'importe quel thread (tâches
+    de fond) ; ils sont mis en file puis remis aux écouteurs sur le thread
+    principal, en un seul lot dédoublonné par cycle d'inactivité.
+    """
+
+    def __init__(self, root, bus: EventBus, poll_interval: int = 50):
+        self.root = root
+        self.poll_interval = poll_interval
+        self._events = queue.Queue()
+        self._listeners: List[Callable[[List[ChangeEvent]], None]] = []
+        self._scheduled = False
+        self._unsubscribe = bus.subscribe(self._on_event)
+        self._poll_id = self.root.after(self.poll_interval, self._poll)
+
+    def add_listener(self, callback: Callable[[List[ChangeEvent]], None]):
+        """callback(events) est appelé sur le thread principal avec le lot d'évènements"""
+        self._listeners.append(callback)
+
+    def _on_event(self, event: ChangeEvent):
+        self._events.put(event)
+        # Hors du thread principal, Tk ne doit pas être appelé : le sondage prend le relais
+        if threading.current_thread() is threading.main_thread():
+            self._schedule()
+
+    def _schedule(self):
+        if not self._scheduled:
+            self._scheduled = True
+            self.root.after_idle(self._flush)
+
+    def _poll(self):
+        if not self._events.empty():
+            self._schedule()
+        self._poll_id = self.root.after(self.poll_interval, self._poll)
+
+    def _flush(self):
+        self._scheduled = False
+        batch = []
+        while True:
+            try:
+                batch.append(self._events.get_nowait())
+            except queue.Empty:
+                break
+        if not batch:
+            return
+        batch = list(dict.fromkeys(batch))
+        for listener in list(self._listeners):
+            listener(batch)
+
+    def close(self):
+        """Se désabonne du bus et arrête le sondage"""
+        self._unsubscribe()
+        self.root.after_cancel(self._poll_id)
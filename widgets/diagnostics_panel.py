@@ -0,0 +1,117 @@
+"""
+Panneau de diagnostic (caché) de Pétanque Manager
+Affiche les statistiques d'utilisation de la base (db_manager.stats()) ;
+ouvert par Ctrl+Maj+D depuis la fenêtre principale
+"""
+
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+
+
+class DiagnosticsPanel:
+    """Fenêtre de suivi des appels à la base de données, rafraîchie chaque seconde"""
+
+    REFRESH_INTERVAL = 1000  # ms
+
+    def __init__(self, parent, db):
+        self.db = db
+        self.window = tk.Toplevel(parent)
+        self.window.title("Diagnostic base de données")
+        self.window.geometry("760x420")
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+        self._after_id = None
+        self.setup_ui()
+        self.refresh()
+
+    def setup_ui(self):
+        """Configure l'interface du panneau"""
+        self.window.grid_rowconfigure(1, weight=1)
+        self.window.grid_columnconfigure(0, weight=1)
+
+        header = ttk.Frame(self.window, padding="10 10 10 0")
+        header.grid(row=0, column=0, sticky='ew')
+        header.grid_columnconfigure(1, weight=1)
+
+        self.enabled_var = tk.BooleanVar(value=self.db.stats()['enabled'])
+        ttk.Checkbutton(header, text="Mesures actives", variable=self.enabled_var,
+                        command=self.toggle).grid(row=0, column=0, sticky='w')
+        self.summary_var = tk.StringVar()
+        ttk.Label(header, textvariable=self.summary_var).grid(row=0, column=1, sticky='w', padx=10)
+
+        # Tableau des méthodes, triées par temps cumulé
+        columns = ('Méthode', 'Appels', 'Erreurs', 'Total (ms)', 'Moyenne', 'p50', 'p95', 'Max')
+        table_frame = ttk.Frame(self.window, padding=10)
+        table_frame.grid(row=1, column=0, sticky='nsew')
+        table_frame.grid_rowconfigure(0, weight=1)
+        table_frame.grid_columnconfigure(0, weight=1)
+        self.tree = ttk.Treeview(table_frame, columns=columns, show='headings')
+        for column in columns:
+            self.tree.heading(column, text=column)
+            self.tree.column(column, width=220 if column == 'Méthode' else 70,
+                             anchor='w' if column == 'Méthode' else 'e')
+        scrollbar = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree.grid(row=0, column=0, sticky='nsew')
+        scrollbar.grid(row=0, column=1, sticky='ns')
+
+        buttons = ttk.Frame(self.window, padding="10 0 10 10")
+        buttons.grid(row=2, column=0, sticky='e')
+        ttk.Button(buttons, text="Remettre à zéro", command=self.reset).grid(row=0, column=0, padx=5)
+        ttk.Button(buttons, text="Exporter JSON", command=self.export).grid(row=0, column=1, padx=5)
+        ttk.Button(buttons, text="Fermer", command=self.close).grid(row=0, column=2, padx=5)
+
+    def toggle(self):
+        """Active ou désactive l'instrumentation de la base"""
+        if self.enabled_var.get():
+            self.db.enable_instrumentation()
+        else:
+            self.db.disable_instrumentation()
+        self.refresh()
+
+    def reset(self):
+        """Repart de compteurs vides"""
+        if self.enabled_var.get():
+            self.db.disable_instrumentation()
+            self.db.enable_instrumentation()
+        self.refresh()
+
+    def refresh(self):
+        """Met à jour les compteurs et le tableau"""
+        if self._after_id is not None:
+            self.window.after_cancel(self._after_id)
+        stats = self.db.stats()
+        connections = stats['connections']
+        summary = f"Connexions : {connections.get('open', connections['opened'])} ouvertes"
+        if stats['enabled']:
+            summary += (f" — {stats['statements']} requêtes, {stats['commits']} validations "
+                        f"depuis {stats['since'][11:]}")
+        self.summary_var.set(summary)
+
+        self.tree.delete(*self.tree.get_children())
+        for name, method in stats.get('methods', {}).items():
+            self.tree.insert('', 'end', values=(
+                name, method['calls'], method['errors'], f"{method['total_ms']:.1f}",
+                f"{method['mean_ms']:.2f}", f"{method['p50_ms']:g}", f"{method['p95_ms']:g}",
+                f"{method['max_ms']:.2f}"))
+        self._after_id = self.window.after(self.REFRESH_INTERVAL, self.refresh)
+
+    def export(self):
+        """Enregistre les statistiques dans un fichier JSON"""
+        filename = filedialog.asksaveasfilename(
+            parent=self.window,
+            defaultextension=".json",
+            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+        )
+        if filename:
+            self.db.dump_stats(filename)
+            messagebox.showinfo("Succès", f"Statistiques enregistrées dans {filename}",
+                                parent=self.window)
+
+    def close(self):
+        if self._after_id is not None:
+            self.window.after_cancel(self._after_id)
+            self._after_id = None
+        self.window.destroy()
+
+    def exists(self) -> bool:
+        return self._after_id is not None
@@ -5,8 +5,11 @@ Affiche les matchs et permet la saisie des scores
 
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
+from events import MATCH_SCORED, MATCH_UPDATED, ROUND_CREATED, TEAM_DELETED, TEAM_UPDATED
 from store import db_manager
 from tournament import TournamentManager
+from widgets.change_dispatcher import affects, tournament_deleted
+from widgets.virtual_table import VirtualTable, PagedSource
 
 class MatchWidget:
     """Widget pour la gestion des matchs"""
@@ -15,7 +18,10 @@ class MatchWidget:
         self.parent = parent
         self.main_window = main_window
         self.tournament_manager = TournamentManager()
+        self._tournament_id = None
+        self._shown_round = None
         self.setup_ui()
+        main_window.changes.add_listener(self.on_changes)
     
     def setup_ui(self):
         """Configure l'interface du widget"""
@@ -36,8 +42,9 @@ class MatchWidget:
         buttons_frame = ttk.Frame(header_frame)
         buttons_frame.grid(row=0, column=1, sticky='e')
         
-        ttk.Button(buttons_frame, text="Générer tour suivant", 
-                  command=self.generate_next_round).grid(row=0, column=0, padx=5)
+        self.generate_button = ttk.Button(buttons_frame, text="Générer tour suivant", 
+                                          command=self.generate_next_round)
+        self.generate_button.grid(row=0, column=0, padx=5)
         ttk.Button(buttons_frame, text="Valider tous les scores", 
                   command=self.validate_all_scores).grid(row=0, column=1, padx=5)
         
@@ -61,33 +68,20 @@ class MatchWidget:
         
         # Configuration du tableau
         columns = ('Terrain', 'Équipe 1', 'Score 1', 'Score 2', 'Équipe 2', 'Statut')
-        self.matches_tree = ttk.Treeview(matches_frame, columns=columns, show='headings', height=15)
+        self.matches_table = VirtualTable(matches_frame, columns, height=15, sort_keys={
+            'Terrain': 'court_number', 'Équipe 1': 'team1_name', 'Score 1': 'team1_score',
+            'Score 2': 'team2_score', 'Équipe 2': 'team2_name', 'Statut': 'status'})
+        self.matches_tree = self.matches_table.tree
         
         # Configuration des colonnes
-        self.matches_tree.heading('Terrain', text='Terrain')
         self.matches_tree.column('Terrain', width=70, anchor='center')
-        
-        self.matches_tree.heading('Équipe 1', text='Équipe 1')
         self.matches_tree.column('Équipe 1', width=150)
-        
-        self.matches_tree.heading('Score 1', text='Score 1')
         self.matches_tree.column('Score 1', width=70, anchor='center')
-        
-        self.matches_tree.heading('Score 2', text='Score 2')
         self.matches_tree.column('Score 2', width=70, anchor='center')
-        
-        self.matches_tree.heading('Équipe 2', text='Équipe 2')
         self.matches_tree.column('Équipe 2', width=150)
-        
-        self.matches_tree.heading('Statut', text='Statut')
         self.matches_tree.column('Statut', width=100, anchor='center')
         
-        # Scrollbar pour le tableau
-        scrollbar = ttk.Scrollbar(matches_frame, orient='vertical', command=self.matches_tree.yview)
-        self.matches_tree.configure(yscrollcommand=scrollbar.set)
-        
-        self.matches_tree.grid(row=0, column=0, sticky='nsew')
-        scrollbar.grid(row=0, column=1, sticky='ns')
+        self.matches_table.grid(row=0, column=0, columnspan=2, sticky='nsew')
         
         # Double-clic pour éditer un match
         self.matches_tree.bind('<Double-1>', self.edit_match)
@@ -106,28 +100,31 @@ class MatchWidget:
         matches_frame.grid_columnconfigure(0, weight=1)
     
     def generate_next_round(self):
-        """Génère le tour suivant"""
+        """Génère le tour suivant (en arrière-plan)"""
         if not self.main_window.current_tournament_id:
             messagebox.showwarning("Attention", "Aucun tournoi sélectionné")
             return
         
-        try:
-            # Vérifier qu'il y a des équipes
-            teams = db_manager.get_teams_by_tournament(self.main_window.current_tournament_id)
-            if len(teams) < 2:
-                messagebox.showwarning("Attention", "Au moins 2 équipes sont nécessaires pour générer un tour")
-                return
-            
-            # Générer le tour
-            matches = self.tournament_manager.generate_next_round(self.main_window.current_tournament_id)
-            
-            # Rafraîchir l'affichage
-            self.refresh()
-            
-            self.main_window.update_status(f"Tour généré avec {len(matches)} matchs")
-            
-        except Exception as e:
-            messagebox.showerror("Erreur", f"Erreur lors de la génération du tour: {str(e)}")
+        # Empêcher une double génération pendant le calcul
+        self.generate_button.state(['disabled'])
+        self.main_window.task_executor.submit(
+            self.tournament_manager.generate_next_round,
+            self.main_window.current_tournament_id,
+            on_success=self._on_round_generated,
+            on_error=self._on_generation_error,
+            description="Génération du tour"
+        )
+    
+    def _on_round_generated(self, matches):
+        self.generate_button.state(['!disabled'])
+        self.main_window.update_status(f"Tour généré avec {len(matches)} matchs")
+    
+    def _on_generation_error(self, error):
+        self.generate_button.state(['!disabled'])
+        if isinstance(error, ValueError):
+            messagebox.showwarning("Attention", str(error))
+        else:
+            messagebox.showerror("Erreur", f"Erreur lors de la génération du tour: {str(error)}")
     
     def validate_all_scores(self):
         """Valide tous les scores du tour actuel"""
@@ -135,8 +132,24 @@ class MatchWidget:
             messagebox.showwarning("Attention", "Aucun tournoi sélectionné")
             return
         
-        # TODO: Implémenter la validation de tous les scores
-        messagebox.showinfo("Info", "Fonctionnalité de validation à implémenter")
+        selection = self.round_combo.current()
+        if selection < 0:
+            messagebox.showwarning("Attention", "Aucun tour à valider")
+            return
+        round_number = selection + 1
+        
+        matches = db_manager.get_matches_by_tournament_round(
+            self.main_window.current_tournament_id, round_number)
+        matches = [m for m in matches if not m['is_bye']]
+        if not matches:
+            messagebox.showinfo("Info", "Aucun match à saisir pour ce tour")
+            return
+        
+        dialog = RoundScoresDialog(self.parent, self.main_window.current_tournament_id,
+                                   round_number, matches, self.tournament_manager)
+        if dialog.result:
+            self.main_window.update_status(
+                f"Tour {round_number} : {dialog.result} scores enregistrés")
     
     def on_round_change(self, event=None):
         """Appelé quand le tour sélectionné change"""
@@ -149,14 +162,48 @@ class MatchWidget:
         if not self.main_window.current_tournament_id:
             return
         
-        # Vider le tableau
-        for item in self.matches_tree.get_children():
-            self.matches_tree.delete(item)
-        
-        # Charger les matchs
-        matches = db_manager.get_matches_by_tournament_round(
-            self.main_window.current_tournament_id, round_number)
-        
+        self.show_round(self.main_window.current_tournament_id, round_number)
+    
+    def show_round(self, tournament_id, round_number, keep_position=False):
+        """Branche le tableau sur les matchs d'un tour, lus page par page"""
+        source = PagedSource(
+            lambda: db_manager.count_matches(tournament_id, round_number),
+            lambda offset, limit, sort_key, descending: self.make_rows(
+                db_manager.get_matches_page(tournament_id, round_number, offset, limit,
+                                            sort_key or 'court_number', descending)))
+        self._shown_round = (tournament_id, round_number)
+        self.matches_table.set_source(source, keep_position=keep_position)
+    
+    def on_changes(self, events):
+        """Met à jour le tableau selon les notifications (thread principal)"""
+        tournament_id = self._tournament_id
+        if tournament_id is None:
+            return
+        if tournament_deleted(events, tournament_id):
+            self._tournament_id = self._shown_round = None
+            self.matches_table.set_source(None)
+            self.round_combo['values'] = []
+            self.round_combo.set('')
+            self.round_info.config(text="Aucun tournoi sélectionné")
+        elif affects(events, tournament_id, (ROUND_CREATED,)):
+            # Nouveau tour : liste des tours et tour affiché changent
+            self.main_window.task_executor.submit(
+                self.load_data, tournament_id,
+                on_success=lambda tournament: self._render_if_shown(tournament_id, tournament),
+                description="Chargement des matchs"
+            )
+        elif (affects(events, tournament_id, (MATCH_SCORED, MATCH_UPDATED), self.matches_table.shows)
+              or affects(events, tournament_id, (TEAM_UPDATED, TEAM_DELETED))):
+            # Scores, terrains ou noms d'équipes : seule la page affichée est relue
+            self.matches_table.refresh()
+    
+    def _render_if_shown(self, tournament_id, tournament):
+        if tournament_id == self._tournament_id:
+            self.render(tournament)
+    
+    def make_rows(self, matches):
+        """Convertit des matchs en lignes du tableau"""
+        rows = []
         for match in matches:
             court = match.get('court_number', '-')
             team1_name = match.get('team1_name', 'Équipe 1')
@@ -165,9 +212,10 @@ class MatchWidget:
             score2 = match.get('team2_score', '-')
             status = self.get_status_text(match.get('status', 'pending'))
             
-            self.matches_tree.insert('', 'end', iid=match['id'], values=(
+            rows.append((match['id'], (
                 court, team1_name, score1, score2, team2_name, status
-            ))
+            ), ()))
+        return rows
     
     def get_status_text(self, status):
         """Convertit le statut en texte français"""
@@ -180,7 +228,7 @@ class MatchWidget:
     
     def edit_match(self, event=None):
         """Ouvre la boîte de dialogue pour modifier un match"""
-        selection = self.matches_tree.selection()
+        selection = self.matches_table.selection()
         if not selection:
             messagebox.showwarning("Attention", "Aucun match sélectionné")
             return
@@ -205,21 +253,23 @@ class MatchWidget:
             
             match_data = dict(row)
         
+        if match_data['is_bye']:
+            messagebox.showinfo("Info", "Un BYE n'a pas de score à saisir")
+            return
+        
         # Ouvrir la boîte de dialogue d'édition
-        dialog = MatchEditDialog(self.parent, match_data, self.tournament_manager)
-        if dialog.result:
-            self.refresh()
+        MatchEditDialog(self.parent, match_data, self.tournament_manager)
     
     def change_court(self):
         """Change le terrain d'un match"""
-        selection = self.matches_tree.selection()
+        selection = self.matches_table.selection()
         if not selection:
             messagebox.showwarning("Attention", "Aucun match sélectionné")
             return
 
         match_id = selection[0]
         try:
-            current_values = self.matches_tree.item(match_id, 'values')
+            current_values = self.matches_table.row_values(match_id)
             initial_court = current_values[0] if current_values else ''
             new_court = simpledialog.askinteger(
                 "Changer le terrain",
@@ -232,7 +282,6 @@ class MatchWidget:
                 return
 
             db_manager.update_match_court(match_id, new_court)
-            self.refresh()
             self.main_window.update_status(f"Terrain mis à jour: {new_court}")
         except Exception as e:
             messagebox.showerror("Erreur", f"Erreur lors de la mise à jour du terrain: {str(e)}")
@@ -243,11 +292,18 @@ class MatchWidget:
             self.round_info.config(text="Aucun tournoi sélectionné")
             return
         
-        # Récupérer les informations du tournoi
-        tournament = db_manager.get_tournament(self.main_window.current_tournament_id)
+        self.render(self.load_data(self.main_window.current_tournament_id))
+    
+    def load_data(self, tournament_id):
+        """Charge le tournoi (thread de travail possible) ; les matchs sont lus à l'affichage"""
+        return db_manager.get_tournament(tournament_id)
+    
+    def render(self, tournament):
+        """Affiche les données chargées par load_data (thread principal)"""
         if not tournament:
             return
         
+        self._tournament_id = tournament['id']
         current_round = tournament.get('current_round', 0)
         self.round_info.config(text=f"Tour actuel: {current_round}")
         
@@ -257,7 +313,12 @@ class MatchWidget:
         
         if rounds:
             self.round_combo.current(len(rounds) - 1)  # Sélectionner le dernier tour
-            self.load_matches_for_round(rounds[-1])
+            shown = (tournament['id'], current_round)
+            self.show_round(*shown, keep_position=shown == self._shown_round)
+        else:
+            self._shown_round = None
+            self.round_combo.set('')
+            self.matches_table.set_source(None)
 
 
 class MatchEditDialog:
@@ -318,18 +379,119 @@ class MatchEditDialog:
         try:
             score1 = int(self.score1_var.get())
             score2 = int(self.score2_var.get())
-            
-            if score1 < 0 or score2 < 0:
-                messagebox.showerror("Erreur", "Les scores doivent être positifs")
-                return
-            
+        except ValueError:
+            messagebox.showerror("Erreur", "Les scores doivent être des nombres entiers")
+            return
+        
+        if score1 < 0 or score2 < 0:
+            messagebox.showerror("Erreur", "Les scores doivent être positifs")
+            return
+        
+        try:
             # Mettre à jour le match
             self.tournament_manager.update_match_result(self.match_data['id'], score1, score2)
             
             self.result = True
             self.dialog.destroy()
             
-        except ValueError:
-            messagebox.showerror("Erreur", "Les scores doivent être des nombres entiers")
+        except ValueError as e:
+            messagebox.showerror("Erreur", str(e))
         except Exception as e:
             messagebox.showerror("Erreur", f"Erreur lors de la sauvegarde: {str(e)}")
+
+
+class RoundScoresDialog:
+    """Grille de saisie des scores de tous les matchs d'un tour"""
+    
+    def __init__(self, parent, tournament_id, round_number, matches, tournament_manager):
+        self.result = None
+        self.tournament_id = tournament_id
+        self.round_number = round_number
+        self.matches = matches
+        self.tournament_manager = tournament_manager
+        
+        # Création de la fenêtre
+        self.dialog = tk.Toplevel(parent)
+        self.dialog.title(f"Scores du tour {round_number}")
+        self.dialog.geometry("560x500")
+        self.dialog.transient(parent)
+        self.dialog.grab_set()
+        
+        # Centrage de la fenêtre
+        self.dialog.geometry("+%d+%d" % (parent.winfo_rootx() + 50, parent.winfo_rooty() + 50))
+        
+        self.setup_ui()
+        
+        # Attendre la fermeture de la boîte de dialogue
+        self.dialog.wait_window()
+    
+    def setup_ui(self):
+        """Configure la grille de saisie"""
+        self.dialog.grid_rowconfigure(0, weight=1)
+        self.dialog.grid_columnconfigure(0, weight=1)
+        
+        # Zone défilante contenant la grille
+        canvas = tk.Canvas(self.dialog, highlightthickness=0)
+        scrollbar = ttk.Scrollbar(self.dialog, orient='vertical', command=canvas.yview)
+        canvas.configure(yscrollcommand=scrollbar.set)
+        canvas.grid(row=0, column=0, sticky='nsew', padx=(10, 0), pady=10)
+        scrollbar.grid(row=0, column=1, sticky='ns', pady=10)
+        
+        grid_frame = ttk.Frame(canvas)
+        canvas.create_window((0, 0), window=grid_frame, anchor='nw')
+        grid_frame.bind('<Configure>',
+                        lambda e: canvas.configure(scrollregion=canvas.bbox('all')))
+        
+        for col, title in enumerate(('Terrain', 'Équipe 1', 'Score 1', 'Score 2', 'Équipe 2')):
+            ttk.Label(grid_frame, text=title, font=('Arial', 10, 'bold')).grid(
+                row=0, column=col, padx=5, pady=5)
+        
+        # Une ligne par match : les scores déjà saisis sont pré-remplis
+        self.score_vars = {}
+        for row, match in enumerate(self.matches, start=1):
+            ttk.Label(grid_frame, text=match.get('court_number') or '-').grid(row=row, column=0, padx=5)
+            ttk.Label(grid_frame, text=match['team1_name']).grid(row=row, column=1, sticky='w', padx=5)
+            finished = match.get('status') == 'finished'
+            score1_var = tk.StringVar(value=str(match['team1_score']) if finished else '')
+            score2_var = tk.StringVar(value=str(match['team2_score']) if finished else '')
+            ttk.Spinbox(grid_frame, from_=0, to=20, textvariable=score1_var, width=5).grid(
+                row=row, column=2, padx=5, pady=2)
+            ttk.Spinbox(grid_frame, from_=0, to=20, textvariable=score2_var, width=5).grid(
+                row=row, column=3, padx=5, pady=2)
+            ttk.Label(grid_frame, text=match['team2_name']).grid(row=row, column=4, sticky='w', padx=5)
+            self.score_vars[match['id']] = (score1_var, score2_var)
+        
+        # Boutons
+        button_frame = ttk.Frame(self.dialog)
+        button_frame.grid(row=1, column=0, columnspan=2, pady=10)
+        
+        ttk.Button(button_frame, text="Valider le tour", command=self.save_scores).grid(row=0, column=0, padx=5)
+        ttk.Button(button_frame, text="Annuler", command=self.dialog.destroy).grid(row=0, column=1, padx=5)
+    
+    def save_scores(self):
+        """Enregistre tous les scores saisis en une seule transaction"""
+        results = {}
+        for match_id, (score1_var, score2_var) in self.score_vars.items():
+            score1, score2 = score1_var.get().strip(), score2_var.get().strip()
+            if not score1 and not score2:
+                continue  # Match non encore joué
+            try:
+                results[match_id] = (int(score1), int(score2))
+            except ValueError:
+                messagebox.showerror("Erreur", "Les scores doivent être des nombres entiers",
+                                     parent=self.dialog)
+                return
+        
+        if not results:
+            self.dialog.destroy()
+            return
+        
+        try:
+            self.result = self.tournament_manager.submit_round_results(
+                self.tournament_id, self.round_number, results)
+            self.dialog.destroy()
+        except ValueError as e:
+            messagebox.showerror("Erreur", f"Scores invalides:\n{str(e)}", parent=self.dialog)
+        except Exception as e:
+            messagebox.showerror("Erreur", f"Erreur lors de la sauvegarde: {str(e)}",
+                                 parent=self.dialog)
@@ -5,12 +5,10 @@ Affiche les statistiques et permet l'export PDF
 
 import tkinter as tk
 from tkinter import ttk, messagebox
+from events import TEAM_CREATED, TEAM_DELETED, TEAM_UPDATED
 from store import db_manager
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib import colors
-from reportlab.lib.units import inch
+from widgets.change_dispatcher import affects, tournament_deleted
+from widgets.virtual_table import VirtualTable, PagedSource
 from datetime import datetime
 
 class StandingsWidget:
@@ -19,7 +17,9 @@ class StandingsWidget:
     def __init__(self, parent, main_window):
         self.parent = parent
         self.main_window = main_window
+        self._tournament_id = None
         self.setup_ui()
+        main_window.changes.add_listener(self.on_changes)
     
     def setup_ui(self):
         """Configure l'interface du widget"""
@@ -54,20 +54,15 @@ class StandingsWidget:
         
         # Configuration du tableau
         columns = ('Position', 'Équipe', 'Victoires', 'Défaites', 'Points +', 'Points -', 'Différence', 'Ratio')
-        self.standings_tree = ttk.Treeview(standings_frame, columns=columns, show='headings', height=15)
+        self.standings_table = VirtualTable(standings_frame, columns, height=15)
+        self.standings_tree = self.standings_table.tree
         
         # Configuration des colonnes
         col_widths = [80, 150, 80, 80, 80, 80, 80, 80]
         for i, col in enumerate(columns):
-            self.standings_tree.heading(col, text=col)
             self.standings_tree.column(col, width=col_widths[i], anchor='center' if i > 1 else 'w')
         
-        # Scrollbar pour le tableau
-        scrollbar = ttk.Scrollbar(standings_frame, orient='vertical', command=self.standings_tree.yview)
-        self.standings_tree.configure(yscrollcommand=scrollbar.set)
-        
-        self.standings_tree.grid(row=0, column=0, sticky='nsew')
-        scrollbar.grid(row=0, column=1, sticky='ns')
+        self.standings_table.grid(row=0, column=0, sticky='nsew')
         
         # Style pour les lignes du tableau
         self.standings_tree.tag_configure('first', background='#FFD700')  # Or pour le premier
@@ -102,22 +97,65 @@ class StandingsWidget:
             self.title_label.config(text="Aucun tournoi sélectionné")
             return
         
-        # Récupérer les informations du tournoi
-        tournament = db_manager.get_tournament(self.main_window.current_tournament_id)
+        self.render(self.load_data(self.main_window.current_tournament_id))
+    
+    def load_data(self, tournament_id):
+        """Charge le tournoi et les statistiques résumées (thread de travail possible)
+
+        Les lignes du classement sont lues page par page à l'affichage.
+        """
+        tournament = db_manager.get_tournament(tournament_id)
+        standings = db_manager.get_team_standings(tournament_id) if tournament else []
+        return tournament, self.compute_statistics(standings)
+    
+    def render(self, data):
+        """Affiche le classement chargé par load_data (thread principal)"""
+        tournament, statistics = data
         if not tournament:
             return
         
         self.title_label.config(text=f"Classement - {tournament['name']}")
         
-        # Vider le tableau
-        for item in self.standings_tree.get_children():
-            self.standings_tree.delete(item)
-        
-        # Charger le classement
-        standings = db_manager.get_team_standings(self.main_window.current_tournament_id)
+        tournament_id = tournament['id']
+        source = PagedSource(
+            lambda: len(db_manager.get_standings_index(tournament_id)),
+            lambda offset, limit, sort_key, descending: self.make_rows(
+                db_manager.get_standings_page(tournament_id, offset, limit), offset))
+        same_tournament = tournament_id == self._tournament_id
+        self._tournament_id = tournament_id
+        self.standings_table.set_source(source, keep_position=same_tournament)
         
+        # Mettre à jour les statistiques
+        self.update_statistics(statistics)
+    
+    def on_changes(self, events):
+        """Met à jour le classement et les statistiques selon les notifications"""
+        tournament_id = self._tournament_id
+        if tournament_id is None:
+            return
+        if tournament_deleted(events, tournament_id):
+            self._tournament_id = None
+            self.standings_table.set_source(None)
+            self.title_label.config(text="Aucun tournoi sélectionné")
+            self.update_statistics(None)
+        elif affects(events, tournament_id, (TEAM_CREATED, TEAM_UPDATED, TEAM_DELETED),
+                     self.standings_table.shows):
+            # Les statistiques portent sur tout le classement : calcul en arrière-plan
+            self.main_window.task_executor.submit(
+                self.load_data, tournament_id,
+                on_success=lambda data: self._render_if_shown(tournament_id, data),
+                description="Mise à jour du classement"
+            )
+    
+    def _render_if_shown(self, tournament_id, data):
+        if tournament_id == self._tournament_id:
+            self.render(data)
+    
+    def make_rows(self, standings, offset=0):
+        """Convertit une page du classement en lignes du tableau"""
+        rows = []
         for i, team in enumerate(standings):
-            position = i + 1
+            position = offset + i + 1
             name = team['name']
             wins = team.get('wins', 0)
             losses = team.get('losses', 0)
@@ -138,20 +176,17 @@ class StandingsWidget:
             elif position % 2 == 0:
                 tag = 'even'
             
-            self.standings_tree.insert('', 'end', values=(
+            rows.append((team['id'], (
                 position, name, wins, losses, points_for, points_against, 
                 f"+{difference}" if difference >= 0 else str(difference), ratio
-            ), tags=(tag,))
-        
-        # Mettre à jour les statistiques
-        self.update_statistics(standings)
+            ), (tag,)))
+        return rows
     
-    def update_statistics(self, standings):
-        """Met à jour les statistiques résumées"""
+    @staticmethod
+    def compute_statistics(standings):
+        """Calcule les statistiques résumées d'un classement"""
         if not standings:
-            for key in self.stats_labels:
-                self.stats_labels[key].config(text="0")
-            return
+            return None
         
         total_teams = len(standings)
         total_matches = sum(team.get('wins', 0) + team.get('losses', 0) for team in standings) // 2
@@ -167,14 +202,31 @@ class StandingsWidget:
         
         avg_score = sum(all_scores) / len(all_scores) if all_scores else 0
         highest_score = max(all_scores) if all_scores else 0
+        return {
+            'total_teams': total_teams,
+            'total_matches': total_matches,
+            'avg_score': avg_score,
+            'highest_score': highest_score,
+        }
+    
+    def update_statistics(self, statistics):
+        """Met à jour les statistiques résumées"""
+        if not statistics:
+            for key in self.stats_labels:
+                self.stats_labels[key].config(text="0")
+            return
         
-        self.stats_labels['total_teams'].config(text=str(total_teams))
-        self.stats_labels['total_matches'].config(text=str(total_matches))
-        self.stats_labels['avg_score'].config(text=f"{avg_score:.1f}")
-        self.stats_labels['highest_score'].config(text=str(highest_score))
+        self.stats_labels['total_teams'].config(text=str(statistics['total_teams']))
+        self.stats_labels['total_matches'].config(text=str(statistics['total_matches']))
+        self.stats_labels['avg_score'].config(text=f"{statistics['avg_score']:.1f}")
+        self.stats_labels['highest_score'].config(text=str(statistics['highest_score']))
     
-    def export_to_pdf(self, filename=None):
-        """Exporte le classement en PDF"""
+    def export_to_pdf(self, filename=None, on_done=None):
+        """Exporte le classement en PDF (construction du document en arrière-plan)
+
+        ``on_done(filename)`` est appelé sur le thread principal une fois le
+        fichier écrit.
+        """
         if not self.main_window.current_tournament_id:
             messagebox.showwarning("Attention", "Aucun tournoi sélectionné")
             return
@@ -190,109 +242,125 @@ class StandingsWidget:
         if not filename:
             return
         
-        try:
-            # Récupérer les données
-            tournament = db_manager.get_tournament(self.main_window.current_tournament_id)
-            standings = db_manager.get_team_standings(self.main_window.current_tournament_id)
-            
-            # Créer le document PDF
-            doc = SimpleDocTemplate(filename, pagesize=A4)
-            story = []
-            
-            # Styles
-            styles = getSampleStyleSheet()
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=18,
-                spaceAfter=30,
-                alignment=1  # Centré
-            )
-            
-            # Titre
-            title = Paragraph(f"Classement du Tournoi: {tournament['name']}", title_style)
-            story.append(title)
-            
-            # Date et heure
-            date_str = datetime.now().strftime("%d/%m/%Y à %H:%M")
-            date_para = Paragraph(f"Généré le {date_str}", styles['Normal'])
-            story.append(date_para)
-            story.append(Spacer(1, 20))
-            
-            # Tableau du classement
-            table_data = [
-                ['Position', 'Équipe', 'V', 'D', 'Pts +', 'Pts -', 'Diff', 'Ratio']
-            ]
-            
-            for i, team in enumerate(standings):
-                position = i + 1
-                name = team['name']
-                wins = team.get('wins', 0)
-                losses = team.get('losses', 0)
-                points_for = team.get('points_for', 0)
-                points_against = team.get('points_against', 0)
-                difference = team.get('point_difference', 0)
-                
-                total_games = wins + losses
-                ratio = f"{wins}/{total_games}" if total_games > 0 else "0/0"
-                
-                table_data.append([
-                    str(position), name, str(wins), str(losses), 
-                    str(points_for), str(points_against),
-                    f"+{difference}" if difference >= 0 else str(difference), 
-                    ratio
-                ])
-            
-            # Créer et styliser le tableau
-            table = Table(table_data)
-            table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 12),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 1), (-1, -1), 10),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
-            ]))
-            
-            # Mettre en évidence le podium
-            if len(standings) >= 1:
-                table.setStyle(TableStyle([('BACKGROUND', (0, 1), (-1, 1), colors.gold)]))
-            if len(standings) >= 2:
-                table.setStyle(TableStyle([('BACKGROUND', (0, 2), (-1, 2), colors.silver)]))
-            if len(standings) >= 3:
-                table.setStyle(TableStyle([('BACKGROUND', (0, 3), (-1, 3), colors.Color(0.8, 0.5, 0.2))]))
-            
-            story.append(table)
-            
-            # Statistiques
-            story.append(Spacer(1, 20))
-            stats_title = Paragraph("Statistiques du Tournoi", styles['Heading2'])
-            story.append(stats_title)
-            
-            total_teams = len(standings)
-            total_matches = sum(team.get('wins', 0) + team.get('losses', 0) for team in standings) // 2
-            
-            stats_text = f"""
-            • Nombre d'équipes: {total_teams}<br/>
-            • Nombre de matchs joués: {total_matches}<br/>
-            • Type de tournoi: {tournament['type']}<br/>
-            • Nombre de terrains: {tournament['num_courts']}<br/>
-            • Tour actuel: {tournament.get('current_round', 0)}
-            """
-            
-            stats_para = Paragraph(stats_text, styles['Normal'])
-            story.append(stats_para)
-            
-            # Générer le PDF
-            doc.build(story)
+        def done(_):
+            if on_done is not None:
+                on_done(filename)
+            else:
+                self.main_window.update_status(f"Export réussi vers {filename}")
+        
+        self.main_window.task_executor.submit(
+            self._build_pdf, self.main_window.current_tournament_id, filename,
+            on_success=done,
+            on_error=lambda e: messagebox.showerror("Erreur", f"Erreur lors de l'export PDF: {str(e)}"),
+            description="Export PDF"
+        )
+    
+    def _build_pdf(self, tournament_id, filename):
+        """Construit le PDF du classement (thread de travail)"""
+        # reportlab n'est chargé qu'au premier export (démarrage plus rapide)
+        from reportlab.lib.pagesizes import A4
+        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.lib import colors
+        
+        # Récupérer les données
+        tournament = db_manager.get_tournament(tournament_id)
+        standings = db_manager.get_team_standings(tournament_id)
+        
+        # Créer le document PDF
+        doc = SimpleDocTemplate(filename, pagesize=A4)
+        story = []
+        
+        # Styles
+        styles = getSampleStyleSheet()
+        title_style = ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=18,
+            spaceAfter=30,
+            alignment=1  # Centré
+        )
+        
+        # Titre
+        title = Paragraph(f"Classement du Tournoi: {tournament['name']}", title_style)
+        story.append(title)
+        
+        # Date et heure
+        date_str = datetime.now().strftime("%d/%m/%Y à %H:%M")
+        date_para = Paragraph(f"Généré le {date_str}", styles['Normal'])
+        story.append(date_para)
+        story.append(Spacer(1, 20))
+        
+        # Tableau du classement
+        table_data = [
+            ['Position', 'Équipe', 'V', 'D', 'Pts +', 'Pts -', 'Diff', 'Ratio']
+        ]
+        
+        for i, team in enumerate(standings):
+            position = i + 1
+            name = team['name']
+            wins = team.get('wins', 0)
+            losses = team.get('losses', 0)
+            points_for = team.get('points_for', 0)
+            points_against = team.get('points_against', 0)
+            difference = team.get('point_difference', 0)
             
-            return True
+            total_games = wins + losses
+            ratio = f"{wins}/{total_games}" if total_games > 0 else "0/0"
             
-        except Exception as e:
-            messagebox.showerror("Erreur", f"Erreur lors de l'export PDF: {str(e)}")
-            return False
+            table_data.append([
+                str(position), name, str(wins), str(losses), 
+                str(points_for), str(points_against),
+                f"+{difference}" if difference >= 0 else str(difference), 
+                ratio
+            ])
+        
+        # Créer et styliser le tableau
+        table = Table(table_data)
+        table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 12),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black),
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 1), (-1, -1), 10),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
+        ]))
+        
+        # Mettre en évidence le podium
+        if len(standings) >= 1:
+            table.setStyle(TableStyle([('BACKGROUND', (0, 1), (-1, 1), colors.gold)]))
+        if len(standings) >= 2:
+            table.setStyle(TableStyle([('BACKGROUND', (0, 2), (-1, 2), colors.silver)]))
+        if len(standings) >= 3:
+            table.setStyle(TableStyle([('BACKGROUND', (0, 3), (-1, 3), colors.Color(0.8, 0.5, 0.2))]))
+        
+        story.append(table)
+        
+        # Statistiques
+        story.append(Spacer(1, 20))
+        stats_title = Paragraph("Statistiques du Tournoi", styles['Heading2'])
+        story.append(stats_title)
+        
+        total_teams = len(standings)
+        total_matches = sum(team.get('wins', 0) + team.get('losses', 0) for team in standings) // 2
+        
+        stats_text = f"""
+        • Nombre d'équipes: {total_teams}<br/>
+        • Nombre de matchs joués: {total_matches}<br/>
+        • Type de tournoi: {tournament['type']}<br/>
+        • Nombre de terrains: {tournament['num_courts']}<br/>
+        • Tour actuel: {tournament.get('current_round', 0)}
+        """
+        
+        stats_para = Paragraph(stats_text, styles['Normal'])
+        story.append(stats_para)
+        
+        # Générer le PDF
+        doc.build(story)
+        
+        return True
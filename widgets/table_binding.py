@@ -0,0 +1,132 @@
+"""
+Liaison entre un ttk.Treeview et une liste de lignes indexées par identifiant
+Ne touche que les lignes réellement modifiées lors d'un rafraîchissement
+"""
+
+from bisect import bisect_left
+from typing import Dict, Iterable, List, NamedTuple, Sequence, Set, Tuple
+
+# Au-delà de ce nombre de déplacements, un seul réordonnancement global est plus rapide
+MAX_SINGLE_MOVES = 32
+
+
+class TableDiff(NamedTuple):
+    """Opérations nécessaires pour passer de l'ancien au nouvel état d'une table"""
+    deleted: List[str]
+    inserted: Set[str]
+    updated: List[str]
+    moved: Set[str]
+
+    def __bool__(self):
+        return bool(self.deleted or self.inserted or self.updated or self.moved)
+
+
+def _stable_items(old_order: List[str], new_order: List[str]) -> Set[str]:
+    """Plus longue sous-suite de new_order déjà dans le bon ordre relatif (pas à déplacer)"""
+    position = {iid: i for i, iid in enumerate(old_order)}
+    kept = [iid for iid in new_order if iid in position]
+    tails: List[int] = []       # Plus petite fin de sous-suite croissante par longueur
+    tail_index: List[int] = []
+    previous = [-1] * len(kept)
+    for k, iid in enumerate(kept):
+        p = position[iid]
+        length = bisect_left(tails, p)
+        if length == len(tails):
+            tails.append(p)
+            tail_index.append(k)
+        else:
+            tails[length] = p
+            tail_index[length] = k
+        previous[k] = tail_index[length - 1] if length > 0 else -1
+
+    stable = set()
+    k = tail_index[-1] if tail_index else -1
+    while k >= 0:
+        stable.add(kept[k])
+        k = previous[k]
+    return stable
+
+
+def diff_rows(old_order: List[str], old_rows: Dict[str, Tuple],
+              new_order: List[str], new_rows: Dict[str, Tuple]) -> TableDiff:
+    """Calcule l'ensemble minimal de suppressions, insertions, mises à jour et déplacements"""
+    deleted = [iid for iid in old_order if iid not in new_rows]
+    inserted = {iid for iid in new_order if iid not in old_rows}
+    updated = [iid for iid in new_order
+               if iid in old_rows and old_rows[iid] != new_rows[iid]]
+
+    remaining = [iid for iid in old_order if iid in new_rows]
+    kept_new = [iid for iid in new_order if iid in old_rows]
+    if remaining == kept_new:
+        moved = set()
+    else:
+        moved = set(kept_new) - _stable_items(remaining, kept_new)
+    return TableDiff(deleted, inserted, updated, moved)
+
+
+class TreeviewBinding:
+    """Synchronise un Treeview avec des lignes ``(iid, values, tags)``.
+
+    L'état précédemment affiché est conservé ; ``sync`` n'applique au widget
+    que la différence, ce qui préserve la sélection et la position de défilement.
+    """
+
+    def __init__(self, tree):
+        self.tree = tree
+        self._order: List[str] = []
+        self._rows: Dict[str, Tuple] = {}
+
+    def clear(self):
+        """Vide la table"""
+        self.sync([])
+
+    def sync(self, rows: Iterable[Tuple[str, Sequence, Sequence]]) -> TableDiff:
+        """Met la table à jour avec les nouvelles lignes et retourne les opérations appliquées"""
+        new_order = []
+        new_rows = {}
+        for iid, values, tags in rows:
+            iid = str(iid)
+            new_order.append(iid)
+            new_rows[iid] = (tuple(values), tuple(tags))
+
+        diff = diff_rows(self._order, self._rows, new_order, new_rows)
+        tree = self.tree
+
+        if diff.deleted:
+            tree.delete(*diff.deleted)
+        for iid in diff.updated:
+            values, tags = new_rows[iid]
+            tree.item(iid, values=values, tags=tags)
+
+        if not self._order:
+            # Table vide : remplissage dans l'ordre, sans recherche de position
+            for iid in new_order:
+                values, tags = new_rows[iid]
+                tree.insert('', 'end', iid=iid, values=values, tags=tags)
+        elif (len(diff.moved) > MAX_SINGLE_MOVES
+              or len(diff.inserted) > len(new_order) - len(diff.inserted)):
+            # Beaucoup de déplacements (ex. changement de tri) ou plus d'insertions que de
+            # lignes conservées : un seul réordonnancement, chaque tree.index coûtant O(n)
+            for iid in new_order:
+                if iid in diff.inserted:
+                    values, tags = new_rows[iid]
+                    tree.insert('', 'end', iid=iid, values=values, tags=tags)
+            tree.set_children('', *new_order)
+        elif diff.inserted or diff.moved:
+            # Parcours à rebours : chaque ligne est placée juste avant la suivante
+            successor = None
+            for iid in reversed(new_order):
+                if iid in diff.inserted or iid in diff.moved:
+                    if iid in diff.moved:
+                        tree.detach(iid)
+                    index = tree.index(successor) if successor is not None else 'end'
+                    if iid in diff.inserted:
+                        values, tags = new_rows[iid]
+                        tree.insert('', index, iid=iid, values=values, tags=tags)
+                    else:
+                        tree.move(iid, '', index)
+                successor = iid
+
+        self._order = new_order
+        self._rows = new_rows
+        return diff
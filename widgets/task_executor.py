@@ -0,0 +1,79 @@
+"""
+Exécuteur de tâches de fond pour l'interface tkinter
+Exécute les accès base de données et l'export PDF hors de la boucle Tk
+"""
+
+import queue
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional
+
+
+class TaskExecutor:
+    """Pool de threads dont les résultats sont renvoyés au thread principal Tk.
+
+    Les fonctions soumises s'exécutent dans un thread de travail ; leurs
+    callbacks ``on_success`` / ``on_error`` sont appelés depuis la boucle Tk
+    (sondage de la file de résultats via ``after``), seul endroit où l'on peut
+    toucher aux widgets.
+    """
+
+    def __init__(self, root, max_workers: int = 2, poll_interval: int = 50,
+                 on_busy_change: Optional[Callable[[Optional[str]], None]] = None):
+        self.root = root
+        self.poll_interval = poll_interval
+        self.on_busy_change = on_busy_change
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix='petanque-worker')
+        self._results = queue.Queue()
+        self._pending = []  # Descriptions des tâches en cours, dans l'ordre de soumission
+        self._polling = False
+
+    def submit(self, func: Callable, *args, on_success: Optional[Callable] = None,
+               on_error: Optional[Callable[[Exception], None]] = None,
+               description: str = "Traitement en cours", **kwargs) -> Future:
+        """Exécute func(*args, **kwargs) en arrière-plan"""
+        self._pending.append(description)
+        self._notify_busy()
+
+        future = self._executor.submit(func, *args, **kwargs)
+        future.add_done_callback(
+            lambda f: self._results.put((f, description, on_success, on_error)))
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.poll_interval, self._poll)
+        return future
+
+    @property
+    def busy(self) -> bool:
+        return bool(self._pending)
+
+    def _poll(self):
+        """Traite les tâches terminées sur le thread principal"""
+        while True:
+            try:
+                future, description, on_success, on_error = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._pending.remove(description)
+            self._notify_busy()
+            error = future.exception()
+            if error is None:
+                if on_success is not None:
+                    on_success(future.result())
+            elif on_error is not None:
+                on_error(error)
+            else:
+                self.root.report_callback_exception(type(error), error, error.__traceback__)
+
+        if self._pending:
+            self.root.after(self.poll_interval, self._poll)
+        else:
+            self._polling = False
+
+    def _notify_busy(self):
+        if self.on_busy_change is not None:
+            self.on_busy_change(self._pending[-1] if self._pending else None)
+
+    def shutdown(self):
+        """Arrête les threads de travail (sans attendre les tâches en cours)"""
+        self._executor.shutdown(wait=False)
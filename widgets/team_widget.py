@@ -4,8 +4,12 @@ Permet l'inscription et la gestion des participants
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog
+from tkinter import ttk, messagebox, simpledialog, filedialog
+from events import TEAM_CREATED, TEAM_DELETED, TEAM_UPDATED
 from store import db_manager
+from widgets.change_dispatcher import affects, tournament_deleted
+from widgets.virtual_table import VirtualTable, PagedSource
+import csv
 import json
 
 class TeamWidget:
@@ -14,7 +18,9 @@ class TeamWidget:
     def __init__(self, parent, main_window):
         self.parent = parent
         self.main_window = main_window
+        self._tournament_id = None
         self.setup_ui()
+        main_window.changes.add_listener(self.on_changes)
     
     def setup_ui(self):
         """Configure l'interface du widget"""
@@ -53,18 +59,20 @@ class TeamWidget:
         
         # Tableau des équipes
         columns = ('Nom', 'Joueurs', 'Victoires', 'Défaites', 'Points +', 'Points -')
-        self.teams_tree = ttk.Treeview(right_frame, columns=columns, show='headings', height=15)
+        # Tableau virtualisé : seules les lignes visibles sont créées, tri côté base
+        self.teams_table = VirtualTable(right_frame, columns, height=15, sort_keys={
+            'Nom': 'name', 'Victoires': 'wins', 'Défaites': 'losses',
+            'Points +': 'points_for', 'Points -': 'points_against'
+        })
+        self.teams_tree = self.teams_table.tree
         
         for col in columns:
-            self.teams_tree.heading(col, text=col)
             self.teams_tree.column(col, width=100)
         
-        # Scrollbar pour le tableau
-        scrollbar = ttk.Scrollbar(right_frame, orient='vertical', command=self.teams_tree.yview)
-        self.teams_tree.configure(yscrollcommand=scrollbar.set)
+        self.teams_table.grid(row=0, column=0, columnspan=2, sticky='nsew')
         
-        self.teams_tree.grid(row=0, column=0, sticky='nsew')
-        scrollbar.grid(row=0, column=1, sticky='ns')
+        # Double-clic pour modifier une équipe
+        self.teams_tree.bind('<Double-1>', lambda e: self.edit_team())
         
         # Boutons de gestion
         buttons_frame = ttk.Frame(right_frame)
@@ -74,6 +82,8 @@ class TeamWidget:
                   command=self.delete_team).grid(row=0, column=0, padx=5)
         ttk.Button(buttons_frame, text="Modifier", 
                   command=self.edit_team).grid(row=0, column=1, padx=5)
+        ttk.Button(buttons_frame, text="Importer...", 
+                  command=self.import_teams).grid(row=0, column=2, padx=5)
         
         # Configuration de la grille
         right_frame.grid_rowconfigure(0, weight=1)
@@ -127,13 +137,10 @@ class TeamWidget:
         try:
             db_manager.create_team(self.main_window.current_tournament_id, team_name, players)
             
-            # Réinitialiser les champs
+            # Réinitialiser les champs (la liste se met à jour via les notifications)
             for entry_var, entry in self.player_entries:
                 entry_var.set("")
             
-            # Rafraîchir la liste
-            self.refresh()
-            
             self.main_window.update_status(f"Équipe '{team_name}' créée avec succès")
             
         except Exception as e:
@@ -144,36 +151,104 @@ class TeamWidget:
         if not self.main_window.current_tournament_id:
             return
         
-        # Vider le tableau
-        for item in self.teams_tree.get_children():
-            self.teams_tree.delete(item)
-        
-        # Charger les équipes
-        teams = db_manager.get_teams_by_tournament(self.main_window.current_tournament_id)
+        self.render(self.load_data(self.main_window.current_tournament_id))
+    
+    def load_data(self, tournament_id):
+        """Prépare la source paginée des équipes (peut s'exécuter dans un thread de travail)"""
+        def fetch(offset, limit, sort_key, descending):
+            teams = db_manager.get_teams_page(tournament_id, offset, limit,
+                                              sort_key or 'name', descending)
+            return self.make_rows(teams)
         
+        return tournament_id, PagedSource(lambda: db_manager.count_teams(tournament_id), fetch)
+    
+    def render(self, data):
+        """Affiche la source chargée (thread principal)"""
+        tournament_id, source = data
+        # Même tournoi : conserver la position de défilement et la sélection
+        same_tournament = tournament_id == self._tournament_id
+        self._tournament_id = tournament_id
+        self.teams_table.set_source(source, keep_position=same_tournament)
+    
+    def on_changes(self, events):
+        """Relit la page affichée quand les équipes du tournoi changent"""
+        if tournament_deleted(events, self._tournament_id):
+            self._tournament_id = None
+            self.teams_table.set_source(None)
+        elif affects(events, self._tournament_id, (TEAM_CREATED, TEAM_UPDATED, TEAM_DELETED),
+                     self.teams_table.shows):
+            self.teams_table.refresh()
+    
+    def make_rows(self, teams):
+        """Convertit des équipes en lignes du tableau"""
+        rows = []
         for team in teams:
             players_str = ", ".join(team['players'])
             if len(players_str) > 30:
                 players_str = players_str[:27] + "..."
             
-            self.teams_tree.insert('', 'end', iid=team['id'], values=(
+            rows.append((team['id'], (
                 team['name'],
                 players_str,
                 team.get('wins', 0),
                 team.get('losses', 0),
                 team.get('points_for', 0),
                 team.get('points_against', 0)
-            ))
+            ), ()))
+        return rows
+    
+    def import_teams(self):
+        """Importe des équipes depuis un fichier (une équipe par ligne, joueurs séparés par , ou ;)"""
+        if not self.main_window.current_tournament_id:
+            messagebox.showwarning("Attention", "Aucun tournoi sélectionné")
+            return
+        
+        filename = filedialog.askopenfilename(
+            filetypes=[("CSV / Texte", "*.csv *.txt"), ("All files", "*.*")],
+            title="Importer des équipes"
+        )
+        if not filename:
+            return
+        
+        tournament_id = self.main_window.current_tournament_id
+        self.main_window.task_executor.submit(
+            self._import_file, tournament_id, filename,
+            on_success=self._on_import_done,
+            on_error=lambda e: messagebox.showerror("Erreur", f"Erreur lors de l'import: {str(e)}"),
+            description="Import des équipes"
+        )
+    
+    def _import_file(self, tournament_id, filename):
+        """Lit le fichier et crée les équipes en une transaction (thread de travail)"""
+        with open(filename, newline='', encoding='utf-8-sig') as f:
+            lines = [line for line in f if line.strip()]
+        
+        teams = []
+        for row in csv.reader(lines, delimiter=';' if any(';' in l for l in lines) else ','):
+            players = [name.strip() for name in row if name.strip()][:4]
+            if players:
+                teams.append(players)
+        
+        # Numérotation à la suite des équipes existantes
+        first_number = len(db_manager.get_teams_by_tournament(tournament_id)) + 1
+        db_manager.create_teams_bulk(tournament_id, [
+            (f"Équipe {first_number + i}", players) for i, players in enumerate(teams)
+        ])
+        return len(teams)
+    
+    def _on_import_done(self, count):
+        self.main_window.update_status(f"{count} équipes importées")
     
     def delete_team(self):
         """Supprime l'équipe sélectionnée"""
-        selection = self.teams_tree.selection()
+        selection = self.teams_table.selection()
         if not selection:
             messagebox.showwarning("Attention", "Aucune équipe sélectionnée")
             return
 
         team_id = selection[0]
-        team_name = self.teams_tree.item(team_id, 'values')[0]
+        values = self.teams_table.row_values(team_id)
+        team_name = values[0] if values else "sélectionnée"
         response = messagebox.askyesno(
             "Confirmation",
             f"Supprimer l'équipe '{team_name}' et ses matchs ?"
@@ -181,22 +256,15 @@ class TeamWidget:
         if response:
             try:
                 db_manager.delete_team(team_id)
-                self.main_window.refresh_all_widgets()
                 self.main_window.update_status(
                     f"Équipe '{team_name}' supprimée")
             except Exception as e:
                 messagebox.showerror("Erreur",
                                      f"Erreur lors de la suppression: {str(e)}")
-
-
-        db_manager.delete_team(team_id)
-        self.refresh()
-        self.main_window.update_status("Équipe supprimée")
     
-        
     def edit_team(self):
         """Modifie l'équipe sélectionnée"""
-        selection = self.teams_tree.selection()
+        selection = self.teams_table.selection()
         if not selection:
             messagebox.showwarning("Attention", "Aucune équipe sélectionnée")
             return
@@ -218,7 +286,6 @@ class TeamWidget:
 
         dialog = TeamEditDialog(self.parent, team_data)
         if dialog.result:
-            self.refresh()
             self.main_window.update_status("Équipe mise à jour")
 
 
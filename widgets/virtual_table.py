@@ -0,0 +1,250 @@
+"""
+Tableau virtualisé pour les très grands tournois
+Seules les lignes visibles existent dans le Treeview ; les données sont
+paginées depuis la source au fil du défilement
+"""
+
+from tkinter import ttk
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from widgets.table_binding import TreeviewBinding
+
+Row = Tuple[str, Sequence, Sequence]
+
+
+class PagedSource:
+    """Source de lignes paginée.
+
+    ``count()`` retourne le nombre total de lignes et
+    ``fetch(offset, limit, sort_key, descending)`` une liste de lignes
+    ``(iid, values, tags)`` déjà triées.
+    """
+
+    def __init__(self, count: Callable[[], int],
+                 fetch: Callable[[int, int, Optional[str], bool], List[Row]]):
+        self.count = count
+        self.fetch = fetch
+
+
+class RowWindow:
+    """Fenêtre de lignes visibles et cache de pages autour de celle-ci (sans Tk)"""
+
+    def __init__(self, source: Optional[PagedSource] = None, visible: int = 15, buffer: int = 30):
+        self.visible = visible
+        self.buffer = buffer
+        self.offset = 0
+        self.sort_key: Optional[str] = None
+        self.descending = False
+        self.fetch_count = 0
+        self.set_source(source)
+
+    def set_source(self, source: Optional[PagedSource]):
+        self.source = source
+        self.invalidate()
+
+    def invalidate(self):
+        """Oublie le cache et relit le nombre total de lignes"""
+        self._cache_offset = 0
+        self._cache: List[Row] = []
+        self.total = self.source.count() if self.source is not None else 0
+        self.offset = self.clamp(self.offset)
+
+    def clamp(self, offset: int) -> int:
+        return max(0, min(offset, self.total - self.visible))
+
+    def scroll_to(self, offset: int) -> bool:
+        """Déplace la fenêtre ; retourne True si elle a changé"""
+        offset = self.clamp(offset)
+        changed = offset != self.offset
+        self.offset = offset
+        return changed
+
+    def rows(self) -> List[Row]:
+        """Lignes visibles, en rechargeant une page (avec marge) si nécessaire"""
+        if self.source is None:
+            return []
+        end = min(self.offset + self.visible, self.total)
+        cache_end = self._cache_offset + len(self._cache)
+        if self.offset < self._cache_offset or end > cache_end:
+            start = max(0, self.offset - self.buffer)
+            self._cache = self.source.fetch(start, end - start + self.buffer,
+                                            self.sort_key, self.descending)
+            self._cache_offset = start
+            self.fetch_count += 1
+        first = self.offset - self._cache_offset
+        return self._cache[first:first + end - self.offset]
+
+    def index_of(self, iid: str) -> Optional[int]:
+        """Position absolue d'une ligne présente dans le cache"""
+        for i, row in enumerate(self._cache):
+            if row[0] == iid:
+                return self._cache_offset + i
+        return None
+
+    def contains_any(self, iids) -> bool:
+        """Indique si l'une des lignes est présente dans le cache"""
+        cached = {row[0] for row in self._cache}
+        return any(iid in cached for iid in iids)
+
+    def row(self, iid: str) -> Optional[Row]:
+        index = self.index_of(iid)
+        return None if index is None else self._cache[index - self._cache_offset]
+
+
+class VirtualTable(ttk.Frame):
+    """Remplaçant d'un Treeview + Scrollbar qui ne matérialise que les lignes visibles.
+
+    Le Treeview interne reste accessible via ``tree`` (colonnes, tags,
+    événements). Un clic sur un en-tête présent dans ``sort_keys`` trie la
+    source ; la navigation clavier (flèches, pages, début/fin) fait défiler
+    la fenêtre au-delà des lignes affichées.
+    """
+
+    def __init__(self, parent, columns: Sequence[str], height: int = 15, buffer: int = 30,
+                 sort_keys: Optional[Dict[str, str]] = None):
+        super().__init__(parent)
+        self.window = RowWindow(visible=height, buffer=buffer)
+        self.sort_keys = sort_keys or {}
+        self._selected: Optional[str] = None
+
+        self.tree = ttk.Treeview(self, columns=columns, show='headings', height=height,
+                                 selectmode='browse')
+        self.binding = TreeviewBinding(self.tree)
+        self.scrollbar = ttk.Scrollbar(self, orient='vertical', command=self._on_scrollbar)
+
+        self.tree.grid(row=0, column=0, sticky='nsew')
+        self.scrollbar.grid(row=0, column=1, sticky='ns')
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        for column in columns:
+            self.tree.heading(column, text=column)
+            if column in self.sort_keys:
+                self.tree.heading(column, command=lambda c=column: self.sort_by(c))
+
+        self.tree.bind('<<TreeviewSelect>>', self._on_select)
+        self.tree.bind('<Configure>', self._on_resize)
+        self.tree.bind('<MouseWheel>', lambda e: self._scroll_units(-1 if e.delta > 0 else 1, 3))
+        self.tree.bind('<Button-4>', lambda e: self._scroll_units(-1, 3))
+        self.tree.bind('<Button-5>', lambda e: self._scroll_units(1, 3))
+        for key, move in (('<Up>', -1), ('<Down>', 1), ('<Prior>', 'page-'), ('<Next>', 'page+'),
+                          ('<Home>', 'home'), ('<End>', 'end')):
+            self.tree.bind(key, lambda e, m=move: self._on_key(m))
+
+    # Données
+    def set_source(self, source: Optional[PagedSource], keep_position: bool = False):
+        """Affiche une nouvelle source (retour en haut sauf keep_position)"""
+        if not keep_position:
+            self.window.offset = 0
+            self._selected = None
+        self.window.set_source(source)
+        self.render()
+
+    def refresh(self):
+        """Relit la source en conservant la position et la sélection"""
+        self.window.invalidate()
+        self.render()
+
+    def sort_by(self, column: str):
+        """Trie sur une colonne (second clic : ordre inverse)"""
+        key = self.sort_keys[column]
+        if self.window.sort_key == key:
+            self.window.descending = not self.window.descending
+        else:
+            self.window.sort_key, self.window.descending = key, False
+        self.window.offset = 0
+        self.refresh()
+
+    def render(self):
+        """Matérialise les lignes visibles dans le Treeview"""
+        self.binding.sync(self.window.rows())
+        if self._selected is not None and self.tree.exists(self._selected):
+            if self.tree.selection() != (self._selected,):
+                self.tree.selection_set(self._selected)
+            self.tree.focus(self._selected)
+        elif self.tree.selection():
+            self.tree.selection_remove(*self.tree.selection())
+        self._update_scrollbar()
+
+    # Sélection
+    def selection(self) -> Tuple[str, ...]:
+        """Ligne sélectionnée, même si elle est hors de la zone visible"""
+        return (self._selected,) if self._selected is not None else ()
+
+    def shows(self, iids) -> bool:
+        """Indique si l'une des lignes est chargée dans la fenêtre courante"""
+        return self.window.contains_any(str(iid) for iid in iids)
+
+    def row_values(self, iid: str) -> Sequence:
+        """Valeurs affichées d'une ligne (depuis le cache de la fenêtre)"""
+        row = self.window.row(iid)
+        return row[1] if row is not None else ()
+
+    def _on_select(self, event=None):
+        selection = self.tree.selection()
+        if selection:
+            self._selected = selection[0]
+
+    # Défilement
+    def _update_scrollbar(self):
+        total = self.window.total
+        if total <= self.window.visible:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            first = self.window.offset / total
+            self.scrollbar.set(first, first + self.window.visible / total)
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == 'moveto':
+            self._scroll_to(round(float(amount) * self.window.total))
+        elif action == 'scroll':
+            step = self.window.visible if unit == 'pages' else 1
+            self._scroll_units(int(amount), step)
+
+    def _scroll_units(self, direction: int, step: int):
+        self._scroll_to(self.window.offset + direction * step)
+        return 'break'
+
+    def _scroll_to(self, offset: int):
+        if self.window.scroll_to(offset):
+            self.render()
+
+    def _on_resize(self, event):
+        style = ttk.Style()
+        row_height = int(style.lookup(self.tree.cget('style') or 'Treeview', 'rowheight') or 20)
+        visible = max(1, (event.height - row_height) // row_height)
+        if visible != self.window.visible:
+            self.window.visible = visible
+            self.window.offset = self.window.clamp(self.window.offset)
+            self.render()
+
+    def _on_key(self, move):
+        """Navigation clavier sur l'ensemble des lignes, pas seulement les visibles"""
+        window = self.window
+        if window.total == 0:
+            return 'break'
+        current = window.index_of(self._selected) if self._selected is not None else None
+        if current is None:
+            current = window.offset
+        if move == 'home':
+            target = 0
+        elif move == 'end':
+            target = window.total - 1
+        elif move == 'page-':
+            target = current - window.visible
+        elif move == 'page+':
+            target = current + window.visible
+        else:
+            target = current + move
+        target = max(0, min(target, window.total - 1))
+
+        # Amener la ligne cible dans la zone visible
+        if target < window.offset:
+            window.scroll_to(target)
+        elif target >= window.offset + window.visible:
+            window.scroll_to(target - window.visible + 1)
+        rows = window.rows()
+        self._selected = rows[target - window.offset][0]
+        self.render()
+        self.tree.see(self._selected)
+        return 'break'